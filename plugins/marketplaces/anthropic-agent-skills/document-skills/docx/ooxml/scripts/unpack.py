@@ -1,29 +1,56 @@
 #!/usr/bin/env python3
 """Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
 
+import os
 import random
 import sys
 import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+from pack import write_manifest
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
+def pretty_print_xml(xml_file):
+    """Rewrite one XML part indented for reading and editing."""
+    content = xml_file.read_bytes()
     dom = defusedxml.minidom.parseString(content)
     xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+def unpack_document(input_file, output_dir):
+    """Extract an Office file and pretty print its XML parts in parallel.
+
+    A manifest of the unpacked parts lets pack.py reuse the unchanged ones.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    zipfile.ZipFile(input_file).extractall(output_path)
+
+    # Pretty print all XML files, largest first so one big part does not finish last
+    xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
+    xml_files.sort(key=lambda f: f.stat().st_size, reverse=True)
+    workers = min(os.cpu_count() or 1, len(xml_files))
+    if workers <= 1:
+        for xml_file in xml_files:
+            pretty_print_xml(xml_file)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so worker errors are raised here
+            list(executor.map(pretty_print_xml, xml_files))
+
+    write_manifest(output_path, input_file)
+
+
+if __name__ == "__main__":
+    # Get command line arguments
+    assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
+    input_file, output_dir = sys.argv[1], sys.argv[2]
+
+    unpack_document(input_file, output_dir)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
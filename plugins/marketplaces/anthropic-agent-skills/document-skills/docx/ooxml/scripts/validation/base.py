@@ -2,11 +2,47 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import functools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .cache import ValidationCache
+
+
+@functools.lru_cache(maxsize=32)
+def load_schema(schema_path):
+    """Compile an XSD schema once per process, keyed by its path."""
+    with open(schema_path, "rb") as xsd_file:
+        parser = lxml.etree.XMLParser()
+        xsd_doc = lxml.etree.parse(xsd_file, parser=parser, base_url=str(schema_path))
+    return lxml.etree.XMLSchema(xsd_doc)
+
+
+# Validator owned by each XSD worker process; its schema and tree caches stay
+# warm across all the parts that worker handles
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    """Create the validator used by an XSD worker process."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file)
+
+
+def _validate_part_in_worker(xml_file):
+    """Validate one part against its XSD schema in a worker process.
+
+    Returns the result along with the validation cache entries it used, so the
+    parent process can persist them.
+    """
+    result = _worker_validator.validate_file_against_xsd(xml_file, verbose=False)
+    return result, _worker_validator._validation_cache.take_used()
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,11 +139,14 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(self, unpacked_dir, original_file, verbose=False, jobs=1):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Worker processes for XSD validation (0 = one per CPU)
+        self.jobs = jobs or os.cpu_count() or 1
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
@@ -120,6 +159,35 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees (or parse errors) shared by every check in this run
+        self._parsed_trees = {}
+
+        # Original document, read lazily; its XSD errors are memoized per part
+        self._original_zip = None
+        self._original_names = set()
+        self._original_errors = {}
+
+        # Per-part XSD results persisted across runs, keyed by content hash
+        self._validation_cache = ValidationCache(self.unpacked_dir)
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file once per run and return the cached tree.
+
+        Callers must not modify the returned tree; copy it first if needed.
+        Parse errors are cached too and re-raised on every call.
+        """
+        xml_file = Path(xml_file)
+        if xml_file not in self._parsed_trees:
+            try:
+                self._parsed_trees[xml_file] = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                self._parsed_trees[xml_file] = e
+
+        result = self._parsed_trees[xml_file]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -131,7 +199,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -159,7 +227,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,15 +258,17 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
+                # Remove all mc:AlternateContent elements from a copy of the
+                # tree so the cached tree stays intact for the other checks
+                mc_xpath = ".//mc:AlternateContent"
+                mc_namespaces = {"mc": self.MC_NAMESPACE}
+                if root.xpath(mc_xpath, namespaces=mc_namespaces):
+                    root = copy.deepcopy(root)
+                    for elem in root.xpath(mc_xpath, namespaces=mc_namespaces):
+                        elem.getparent().remove(elem)
 
                 # Now check IDs in the cleaned tree
                 for elem in root.iter():
@@ -295,6 +365,10 @@ class BaseSchemaValidator:
                 file_path.is_file()
                 and file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
+                and not (
+                    file_path.parent == self.unpacked_dir
+                    and file_path.name.startswith(".")
+                )  # Tool metadata such as the unpack manifest and validation cache
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
 
@@ -310,7 +384,7 @@ class BaseSchemaValidator:
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -390,8 +464,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -411,7 +483,7 @@ class BaseSchemaValidator:
 
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +506,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse_xml(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,7 +603,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -593,7 +665,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._parse_xml(xml_file).getroot().tag
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
@@ -673,7 +745,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +764,12 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        results = self._validate_files_against_xsd(self.xml_files)
+        self._validation_cache.save()
+
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
+            is_valid, new_file_errors = results[xml_file]
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,7 +785,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -738,6 +811,33 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd(self, xml_files):
+        """Validate each file against its XSD schema, in parallel when jobs > 1.
+
+        Returns:
+            dict: Mapping of file to (is_valid, new_errors_set)
+        """
+        if self.jobs <= 1 or len(xml_files) <= 1:
+            return {
+                xml_file: self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in xml_files
+            }
+
+        # Hand out the largest parts first so one big part does not finish last
+        by_size = sorted(xml_files, key=lambda f: f.stat().st_size, reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(xml_files)),
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            results = {}
+            for xml_file, (result, cache_entries) in zip(
+                by_size, executor.map(_validate_part_in_worker, by_size)
+            ):
+                results[xml_file] = result
+                self._validation_cache.merge_used(cache_entries)
+            return results
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -829,24 +929,73 @@ class BaseSchemaValidator:
         if not schema_path:
             return None, None  # Skip file
 
+        relative_path = xml_file.relative_to(base_path)
+        if base_path != self.unpacked_dir:
+            try:
+                xml_doc = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                return False, {str(e)}
+            return self._validate_xml_doc_xsd(xml_doc, schema_path, relative_path)
+
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            content = xml_file.read_bytes()
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        # Template tag removal works on a copy, so the tree can come straight
+        # from the tree cache
+        return self._cached_validate_xsd(
+            content, schema_path, relative_path, lambda: self._parse_xml(xml_file)
+        )
+
+    def _cached_validate_xsd(self, content, schema_path, relative_path, parse):
+        """Validate a part against XSD schema unless the cache has a result.
+
+        Args:
+            content: Raw bytes of the part, used for the cache key
+            schema_path: Path to the XSD schema for the part
+            relative_path: Path of the part relative to the package root
+            parse: Callable returning the part's parsed ElementTree
+
+        Returns:
+            tuple: (is_valid, errors_set)
+        """
+        part = relative_path.as_posix()
+        key = ValidationCache.key(
+            type(self).__name__,
+            part,
+            schema_path.relative_to(self.schemas_dir).as_posix(),
+            content,
+        )
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            return cached["valid"], set(cached["errors"])
 
+        try:
+            xml_doc = parse()
+        except Exception as e:
+            is_valid, errors = False, {str(e)}
+        else:
+            is_valid, errors = self._validate_xml_doc_xsd(
+                xml_doc, schema_path, relative_path
+            )
+
+        self._validation_cache.put(
+            key, part, {"valid": is_valid, "errors": sorted(errors)}
+        )
+        return is_valid, errors
+
+    def _validate_xml_doc_xsd(self, xml_doc, schema_path, relative_path):
+        """Validate a parsed XML document against XSD schema. Returns (is_valid, errors_set)."""
+        try:
+            # Load schema
+            schema = load_schema(str(schema_path))
+
+            # Preprocess XML
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -866,42 +1015,74 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _read_original_part(self, relative_path):
+        """Read one member of the original document straight from the zip.
+
+        The archive is opened on first use and kept open for the rest of the
+        run, so looking up many parts does not re-read the central directory.
+
+        Args:
+            relative_path: Path of the part relative to the package root
+
+        Returns:
+            bytes: The member's content, or None if the original lacks it
+        """
+        import zipfile
+
+        if self._original_zip is None:
+            self._original_zip = zipfile.ZipFile(self.original_file, "r")
+            self._original_names = set(self._original_zip.namelist())
+
+        name = Path(relative_path).as_posix()
+        if name not in self._original_names:
+            return None
+        return self._original_zip.read(name)
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are memoized per part, so each original part is read and
+        validated at most once per run.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        if relative_path not in self._original_errors:
+            self._original_errors[relative_path] = self._validate_original_part(
+                relative_path
+            )
+        return self._original_errors[relative_path]
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+    def _validate_original_part(self, relative_path):
+        """Validate one part of the original document against its XSD schema."""
+        schema_path = self._get_schema_path(relative_path)
+        if not schema_path:
+            return set()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        try:
+            content = self._read_original_part(relative_path)
+        except Exception as e:
+            return {str(e)}
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        if content is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        is_valid, errors = self._cached_validate_xsd(
+            content,
+            schema_path,
+            relative_path,
+            lambda: lxml.etree.fromstring(content).getroottree(),
+        )
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -7,6 +7,8 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from .cache import ValidationCache
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -18,6 +20,7 @@ class RedliningValidator:
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        self._validation_cache = ValidationCache(self.unpacked_dir)
 
     def validate(self):
         """Main validation method that returns True if valid, False otherwise."""
@@ -60,57 +63,59 @@ class RedliningValidator:
             # If we can't parse the XML, continue with full validation
             pass
 
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+        # Read the original document.xml straight from the docx
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                original_content = zip_ref.read("word/document.xml")
+        except KeyError:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+        except Exception as e:
+            print(f"FAILED - Error reading original docx: {e}")
+            return False
 
+        # Skip the comparison if this exact pair of documents already passed
+        cache_key = ValidationCache.key(
+            type(self).__name__, modified_file.read_bytes(), original_content
+        )
+        if self._validation_cache.get(cache_key):
             if self.verbose:
                 print("PASSED - All changes by Claude are properly tracked")
             return True
 
+        # Parse both XML files using xml.etree.ElementTree for redlining validation
+        try:
+            import xml.etree.ElementTree as ET
+
+            modified_tree = ET.parse(modified_file)
+            modified_root = modified_tree.getroot()
+            original_root = ET.fromstring(original_content)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_text = self._extract_text_content(modified_root)
+        original_text = self._extract_text_content(original_root)
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
+
+        # Only passes are cached, so failures always print their full diff
+        self._validation_cache.put(cache_key, "redlining:word/document.xml", True)
+        self._validation_cache.save()
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
     def _generate_detailed_diff(self, original_text, modified_text):
         """Generate detailed word-level differences using git word diff."""
         error_parts = [
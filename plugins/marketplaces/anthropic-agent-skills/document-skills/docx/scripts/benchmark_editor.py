@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark the minidom XMLEditor against the lxml LxmlXMLEditor on one XML part.
+
+Each engine runs in its own process, so the peak resident memory it reports
+covers only that engine's parse and edits. Every engine runs the same
+workload: parse, a fixed set of get_node lookups (contains, attrs and
+line_number), one insert_after per ten lookups, then save to a scratch copy.
+
+Usage (from the docx skill directory):
+    python -m scripts.benchmark_editor <unpacked_dir>/word/document.xml [--lookups N]
+"""
+
+import argparse
+import json
+import random
+import re
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ENGINES = ("minidom", "lxml")
+
+NEW_PARAGRAPH = "<w:p><w:r><w:t>Benchmark paragraph</w:t></w:r></w:p>"
+
+
+def build_queries(xml_file, count, seed=0):
+    """Build get_node queries from the raw XML so every engine gets the same ones."""
+    content = Path(xml_file).read_text(encoding="utf-8", errors="ignore")
+    texts = re.findall(r"<w:t(?: [^>]*)?>([^<]{8,})</w:t>", content)
+    para_ids = re.findall(r'<w:p [^>]*w14:paraId="([^"]+)"', content)
+    line_count = content.count("\n") + 1
+
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0 and texts:
+            queries.append({"tag": "w:p", "contains": rng.choice(texts)[:20]})
+        elif kind == 1 and para_ids:
+            queries.append(
+                {"tag": "w:p", "attrs": {"w14:paraId": rng.choice(para_ids)}}
+            )
+        else:
+            queries.append({"tag": "w:r", "line_number": rng.randrange(1, line_count)})
+    return queries
+
+
+def run_engine(engine, xml_file, queries):
+    """Time one engine in this process and return its measurements."""
+    from .lxml_editor import LxmlXMLEditor
+    from .utilities import XMLEditor
+
+    editor_class = LxmlXMLEditor if engine == "lxml" else XMLEditor
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    editor = editor_class(xml_file)
+    parse_seconds = time.perf_counter() - start
+
+    latencies = []
+    found = 0
+    for i, query in enumerate(queries):
+        start = time.perf_counter()
+        try:
+            elem = editor.get_node(**query)
+        except ValueError:
+            elem = None
+        if elem is not None:
+            found += 1
+            if i % 10 == 0 and query["tag"] == "w:p":
+                editor.insert_after(elem, NEW_PARAGRAPH)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    editor.save()
+    save_seconds = time.perf_counter() - start
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "parse_ms": parse_seconds * 1000,
+        "lookup_total_ms": sum(latencies) * 1000,
+        "lookup_median_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "lookup_max_ms": max(latencies) * 1000 if latencies else 0,
+        "save_ms": save_seconds * 1000,
+        "peak_rss_mb": (peak_rss - baseline_rss) * scale / (1024 * 1024),
+        "found": found,
+    }
+
+
+def measure(engine, xml_file, lookups):
+    """Run one engine on a scratch copy of the file in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scratch = Path(temp_dir) / Path(xml_file).name
+        shutil.copyfile(xml_file, scratch)
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "scripts.benchmark_editor",
+                str(scratch),
+                "--lookups",
+                str(lookups),
+                "--engine",
+                engine,
+                "--queries-from",
+                str(xml_file),
+            ],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark XMLEditor engines")
+    parser.add_argument("xml_file", help="Path to an XML part, e.g. word/document.xml")
+    parser.add_argument(
+        "--lookups", type=int, default=300, help="Number of get_node calls"
+    )
+    parser.add_argument("--engine", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--queries-from", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.engine:
+        # Child process: run one engine and report as JSON
+        queries = build_queries(args.queries_from or args.xml_file, args.lookups)
+        print(json.dumps(run_engine(args.engine, args.xml_file, queries)))
+        return
+
+    xml_file = Path(args.xml_file)
+    size_mb = xml_file.stat().st_size / (1024 * 1024)
+    print(f"{xml_file.name}: {size_mb:.1f} MB, {args.lookups} lookups")
+
+    results = {engine: measure(engine, xml_file, args.lookups) for engine in ENGINES}
+    if len({result["found"] for result in results.values()}) != 1:
+        print("Warning: engines found a different number of nodes")
+
+    metrics = [
+        ("parse_ms", "parse", "ms"),
+        ("lookup_total_ms", "lookups total", "ms"),
+        ("lookup_median_ms", "lookup median", "ms"),
+        ("lookup_max_ms", "lookup max", "ms"),
+        ("save_ms", "save", "ms"),
+        ("peak_rss_mb", "peak memory", "MB"),
+    ]
+    print(f"  {'':<14} {'minidom':>10} {'lxml':>10} {'ratio':>7}")
+    for key, label, unit in metrics:
+        old, new = results["minidom"][key], results["lxml"][key]
+        ratio = f"{old / new:6.1f}x" if new else "     -"
+        print(f"  {label:<14} {old:>7.1f} {unit:<2} {new:>7.1f} {unit:<2} {ratio}")
+
+
+if __name__ == "__main__":
+    main()
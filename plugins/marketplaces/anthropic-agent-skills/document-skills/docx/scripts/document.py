@@ -16,25 +16,30 @@ Usage:
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
+    doc.add_comments([(node, "First"), ({"tag": "w:p", "contains": "text"}, "Second")])
 
     # Suggest tracked changes
     doc["word/document.xml"].suggest_deletion(node)  # Delete content
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
+    doc["word/document.xml"].apply_tracked_changes([(node, "suggest_deletion")])  # Batch
 
     # Save
     doc.save()
 """
 
+import filecmp
 import html
+import itertools
+import os
 import random
 import shutil
 import tempfile
-from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
+from ooxml.scripts.validation.cache import CACHE_FILENAME
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
@@ -72,6 +77,9 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
+        # Change ID counter while apply_tracked_changes runs, so IDs are allocated in bulk
+        self._change_ids = None
+
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
         max_id = -1
@@ -86,6 +94,12 @@ class DocxXMLEditor(XMLEditor):
                         pass
         return max_id + 1
 
+    def _allocate_change_id(self):
+        """Get the next change ID, from the batch counter if one is active."""
+        if self._change_ids is not None:
+            return next(self._change_ids)
+        return self._get_next_change_id()
+
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
         root = self.dom.documentElement
@@ -167,7 +181,7 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", str(self._allocate_change_id()))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -261,6 +275,56 @@ class DocxXMLEditor(XMLEditor):
         self._inject_attributes_to_nodes(nodes)
         return nodes
 
+    def apply_tracked_changes(self, changes):
+        """Apply many tracked-change operations in one batch.
+
+        Every node is resolved before the DOM changes, so line_number filters refer
+        to the original file, and change IDs are allocated from a single scan of
+        the document instead of one scan per new w:ins/w:del.
+
+        Args:
+            changes: List of (node, change) pairs. node is a DOM element or a dict of
+                get_node filters; change is "suggest_deletion", "revert_insertion"
+                or "revert_deletion".
+
+        Returns:
+            list: The return value of each operation, in input order
+
+        Raises:
+            ValueError: If a change is unknown or a node is not found. Nothing is
+                modified in that case.
+
+        Example:
+            doc["word/document.xml"].apply_tracked_changes([
+                ({"tag": "w:r", "contains": "obsolete clause"}, "suggest_deletion"),
+                ({"tag": "w:ins", "attrs": {"w:id": "5"}}, "revert_insertion"),
+                (del_elem, "revert_deletion"),
+            ])
+        """
+        operations = {
+            "suggest_deletion": self.suggest_deletion,
+            "revert_insertion": self.revert_insertion,
+            "revert_deletion": self.revert_deletion,
+        }
+
+        # Resolve everything first so a bad entry fails before any change is made
+        resolved = []
+        for node, change in changes:
+            if change not in operations:
+                raise ValueError(
+                    f"Unknown tracked change {change!r}. "
+                    f"Expected one of: {', '.join(operations)}"
+                )
+            if isinstance(node, dict):
+                node = self.get_node(**node)
+            resolved.append((operations[change], node))
+
+        self._change_ids = itertools.count(self._get_next_change_id())
+        try:
+            return [operation(node) for operation, node in resolved]
+        finally:
+            self._change_ids = None
+
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -336,6 +400,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._reindex([ins_elem])
 
         return [elem]
 
@@ -528,6 +593,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._reindex([del_wrapper])
 
             return del_wrapper
 
@@ -586,6 +652,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._reindex([elem])
 
             return elem
 
@@ -604,11 +671,39 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _generate_hex_ids(count: int) -> list[str]:
+    """Generate count distinct random hex IDs (see _generate_hex_id)."""
+    ids = []
+    seen = set()
+    while len(ids) < count:
+        hex_id = _generate_hex_id()
+        if hex_id not in seen:
+            seen.add(hex_id)
+            ids.append(hex_id)
+    return ids
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Hard-link source to target, or copy it when linking fails (e.g. across filesystems)."""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _copy_if_changed(source: Path, target: Path) -> None:
+    """Copy source to target unless target already has the same content."""
+    if target.exists() and filecmp.cmp(source, target, shallow=False):
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -636,16 +731,15 @@ class Document:
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Copy-on-write overlay: unpacked_path holds only the files this session opens
+        # for editing or creates; everything else is read from the original directory
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.word_path = self.unpacked_path / "word"
+        self.word_path.mkdir(parents=True)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
+        # Validation baseline, packed from the original directory on first use (see _ensure_baseline)
         self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
-
-        self.word_path = self.unpacked_path / "word"
 
         # Generate RSID if not provided
         self.rsid = rsid if rsid else _generate_rsid()
@@ -703,7 +797,12 @@ class Document:
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
             if not file_path.exists():
-                raise ValueError(f"XML file not found: {xml_path}")
+                # Copy the part into the overlay so saving the editor never touches the original
+                source_path = self.original_path / xml_path
+                if not source_path.exists():
+                    raise ValueError(f"XML file not found: {xml_path}")
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source_path, file_path)
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
@@ -727,40 +826,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
-
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
-
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
-
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
-
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
-
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
-
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
-
-        self.next_comment_id += 1
-        return comment_id
+        return self.add_comments([((start, end), text)])[0]
 
     def reply_to_comment(
         self,
@@ -780,55 +846,88 @@ class Document:
         Example:
             cm.reply_to_comment(parent_comment_id=0, text="I agree with this change")
         """
-        if parent_comment_id not in self.existing_comments:
-            raise ValueError(f"Parent comment with id={parent_comment_id} not found")
+        return self.add_comments([(parent_comment_id, text)])[0]
 
-        parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    def add_comments(self, comments) -> list[int]:
+        """
+        Add many comments and replies in one batch.
 
-        # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
-            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
-        )
-        parent_ref_elem = self._document.get_node(
-            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
-        )
+        Every anchor is resolved before document.xml changes, so line_number
+        filters refer to the original file. Comment and paragraph IDs are
+        allocated up front, and each comments part is appended to once.
 
-        self._document.insert_after(
-            parent_start_elem, self._comment_range_start_xml(comment_id)
-        )
-        parent_ref_run = parent_ref_elem.parentNode
-        self._document.insert_after(
-            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
-        )
-        self._document.insert_after(
-            parent_ref_run, self._comment_ref_run_xml(comment_id)
-        )
+        Args:
+            comments: List of (anchor, text) pairs. An anchor is one of:
+                - a DOM element to comment on
+                - a (start, end) pair of DOM elements
+                - a dict of get_node filters for word/document.xml, also allowed
+                  as either side of a (start, end) pair
+                - an int: the ID of the comment to reply to, which may be a
+                  comment added earlier in the same batch
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        Returns:
+            list[int]: The created comment IDs, in input order
 
-        # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        Raises:
+            ValueError: If an anchor is not found or a parent comment does not
+                exist. Nothing is modified in that case.
+
+        Example:
+            ids = doc.add_comments([
+                ({"tag": "w:p", "contains": "within 30 days"}, "Should this be 60?"),
+                ((start_node, end_node), "Explanation"),
+            ])
+            doc.add_comments([(ids[0], "Agreed"), (ids[1], "Please expand")])
+        """
+        # Resolve every anchor first so a bad entry fails before any change is made
+        resolved = []
+        known_ids = set(self.existing_comments)
+        for offset, (anchor, text) in enumerate(comments):
+            if isinstance(anchor, int) and not isinstance(anchor, bool):
+                if anchor not in known_ids:
+                    raise ValueError(f"Parent comment with id={anchor} not found")
+                resolved.append((anchor, None, None, text))
+            else:
+                start, end = anchor if isinstance(anchor, tuple) else (anchor, anchor)
+                start_node = self._resolve_anchor(start)
+                end_node = start_node if end is start else self._resolve_anchor(end)
+                resolved.append((None, start_node, end_node, text))
+            known_ids.add(self.next_comment_id + offset)
+
+        # Allocate IDs in bulk
+        first_id = self.next_comment_id
+        para_ids = _generate_hex_ids(len(resolved))
+        durable_ids = _generate_hex_ids(len(resolved))
+
+        comment_entries = []
+        extended_entries = []
+        for offset, (parent_id, start, end, text) in enumerate(resolved):
+            comment_id = first_id + offset
+            para_id = para_ids[offset]
+
+            # Add comment ranges to document.xml
+            if parent_id is None:
+                self._insert_comment_range(comment_id, start, end)
+                parent_para_id = None
+            else:
+                self._insert_reply_range(comment_id, parent_id)
+                parent_para_id = self.existing_comments[parent_id]["para_id"]
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+            comment_entries.append((comment_id, para_id, text))
+            extended_entries.append((para_id, parent_para_id))
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+            # Update existing_comments so replies work
+            self.existing_comments[comment_id] = {"para_id": para_id}
 
-        # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        # Append to each comments part once
+        if comment_entries:
+            self._add_to_comments_xml(comment_entries)
+            self._add_to_comments_extended_xml(extended_entries)
+            self._add_to_comments_ids_xml(list(zip(para_ids, durable_ids)))
+            self._add_to_comments_extensible_xml(durable_ids)
 
-        self.next_comment_id += 1
-        return comment_id
+        self.next_comment_id = first_id + len(resolved)
+        return list(range(first_id, self.next_comment_id))
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
@@ -843,11 +942,13 @@ class Document:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        self._ensure_baseline()
+        view_path = self._materialize_view()
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            view_path, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -861,13 +962,14 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only files whose content differs from the destination are written.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
@@ -879,15 +981,93 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            # Keep the baseline of the document as it was opened for later validate() calls
+            self._ensure_baseline()
+            files = self._overlay_files()
+        else:
+            files = self._merged_files()
+
+        for relative_path, source_path in files.items():
+            _copy_if_changed(source_path, target_path / relative_path)
+
+    # ==================== Private: Working Directory ====================
+
+    def _exists(self, path):
+        """Check whether a path under unpacked_path exists in the overlay or the original."""
+        if path.exists():
+            return True
+        return (self.original_path / path.relative_to(self.unpacked_path)).exists()
+
+    def _overlay_files(self):
+        """Map relative paths to the files this session created or opened for editing."""
+        return {
+            path.relative_to(self.unpacked_path): path
+            for path in self.unpacked_path.rglob("*")
+            if path.is_file()
+        }
+
+    def _merged_files(self):
+        """Map relative paths to the current version of every file in the document."""
+        files = {
+            path.relative_to(self.original_path): path
+            for path in self.original_path.rglob("*")
+            if path.is_file()
+        }
+        files.update(self._overlay_files())
+        return files
+
+    def _materialize_view(self):
+        """Build a complete unpacked directory of the current state for the validators.
+
+        Files are hard-linked where possible, so untouched media are not copied.
+        The view is updated in place between calls, so only files that changed
+        are relinked and the validators' result cache carries over to the next
+        validate().
+        """
+        view_path = Path(self.temp_dir) / "view"
+        files = self._merged_files()
+        cache_path = Path(CACHE_FILENAME)
+
+        if view_path.exists():
+            for path in list(view_path.rglob("*")):
+                relative_path = path.relative_to(view_path)
+                if (
+                    path.is_file()
+                    and relative_path not in files
+                    and relative_path != cache_path
+                ):
+                    path.unlink()
+
+        for relative_path, source_path in files.items():
+            target = view_path / relative_path
+            if target.exists():
+                # The view's cache holds newer results than any copy from the original
+                if relative_path == cache_path:
+                    continue
+                if os.path.samefile(source_path, target) or filecmp.cmp(
+                    source_path, target
+                ):
+                    continue
+                target.unlink()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(source_path, target)
+        return view_path
+
+    def _ensure_baseline(self):
+        """Pack the original directory into original.docx for validation, once.
+
+        If unpack.py's source file is unchanged, its parts are copied verbatim rather than repacked.
+        """
+        if not self.original_docx.exists():
+            pack_document(self.original_path, self.original_docx, validate=False)
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._exists(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
@@ -903,7 +1083,7 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._exists(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
@@ -953,7 +1133,7 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._exists(path):
             # Copy from template
             shutil.copy(TEMPLATE_DIR / "people.xml", path)
 
@@ -1063,34 +1243,81 @@ class Document:
                 rsid_xml = f'<{prefix}:rsid {prefix}:val="{self.rsid}"/>'
                 editor.append_to(rsids_elem, rsid_xml)
 
+    # ==================== Private: Comment Ranges ====================
+
+    def _resolve_anchor(self, anchor):
+        """Return the document.xml element for an anchor: an element or get_node filters."""
+        if isinstance(anchor, dict):
+            return self._document.get_node(**anchor)
+        return anchor
+
+    def _insert_comment_range(self, comment_id, start, end):
+        """Mark a new comment's range from start to end in document.xml."""
+        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+
+        # If end node is a paragraph, append comment markup inside it
+        # Otherwise insert after it (for run-level anchors)
+        if end.tagName == "w:p":
+            self._document.append_to(end, self._comment_range_end_xml(comment_id))
+        else:
+            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+
+    def _insert_reply_range(self, comment_id, parent_comment_id):
+        """Mark a reply's range in document.xml next to its parent comment's range."""
+        parent_start_elem = self._document.get_node(
+            tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
+        )
+        parent_ref_elem = self._document.get_node(
+            tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
+        )
+
+        self._document.insert_after(
+            parent_start_elem, self._comment_range_start_xml(comment_id)
+        )
+        parent_ref_run = parent_ref_elem.parentNode
+        self._document.insert_after(
+            parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
+        )
+        self._document.insert_after(
+            parent_ref_run, self._comment_ref_run_xml(comment_id)
+        )
+
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
+    def _add_to_comments_xml(self, comments):
+        """Add comments to comments.xml.
+
+        Args:
+            comments: List of (comment_id, para_id, text) tuples
+        """
+        if not self._exists(self.comments_path):
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        comment_xmls = []
+        for comment_id, para_id, text in comments:
+            escaped_text = (
+                text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            )
+            comment_xmls.append(f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+</w:comment>''')
+        editor.append_to(root, "\n".join(comment_xmls))
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
+    def _add_to_comments_extended_xml(self, entries):
+        """Add comments to commentsExtended.xml.
+
+        Args:
+            entries: List of (para_id, parent_para_id) tuples; parent_para_id is None for top-level comments
+        """
+        if not self._exists(self.comments_extended_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
@@ -1098,26 +1325,41 @@ class Document:
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        xmls = []
+        for para_id, parent_para_id in entries:
+            if parent_para_id:
+                xmls.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                xmls.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(xmls))
+
+    def _add_to_comments_ids_xml(self, entries):
+        """Add comments to commentsIds.xml.
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
+        Args:
+            entries: List of (para_id, durable_id) tuples
+        """
+        if not self._exists(self.comments_ids_path):
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+            for para_id, durable_id in entries
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
+    def _add_to_comments_extensible_xml(self, durable_ids):
+        """Add comments to commentsExtensible.xml.
+
+        Args:
+            durable_ids: List of durable IDs
+        """
+        if not self._exists(self.comments_extensible_path):
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
@@ -1125,7 +1367,10 @@ class Document:
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+            for durable_id in durable_ids
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -1183,7 +1428,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
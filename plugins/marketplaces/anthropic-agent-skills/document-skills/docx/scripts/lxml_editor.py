@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+lxml engine for XMLEditor.
+
+LxmlXMLEditor offers the same get_node, replace_node, insert_after, insert_before,
+append_to, get_next_rid and save API as XMLEditor. It keeps the document in an
+lxml tree instead of a minidom DOM, which takes far less memory on a large
+document.xml and parses and saves much faster. Line numbers come from lxml's
+sourceline, so line_number lookups match the Read tool output just like
+XMLEditor's.
+
+Nodes are lxml.etree elements rather than minidom nodes. Code that works with
+the minidom node API directly, such as DocxXMLEditor's tracked-change helpers
+and Document, keeps using XMLEditor.
+
+Example usage:
+    editor = LxmlXMLEditor("word/document.xml")
+
+    elem = editor.get_node(tag="w:p", contains="specific text")
+    new_elems = editor.insert_after(elem, "<w:p><w:r><w:t>new text</w:t></w:r></w:p>")
+    editor.save()
+"""
+
+from pathlib import Path
+
+import lxml.etree
+
+from .utilities import XMLEditor
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml.etree.
+
+    Elements added by the editing methods have no original line number, so
+    line_number lookups never match them. That is the same as XMLEditor.
+    One difference: minidom keeps each character reference (e.g. &#160;) as
+    its own text node and contains= ignores it when it is whitespace, while
+    lxml keeps it in the surrounding text, so the whitespace is matched too.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+        root: Root element of the tree
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with a secure parser.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist or declares entities
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        # lxml reports standalone="no" when the declaration omits it
+        self._declares_standalone = "standalone=" in header
+
+        self.tree = lxml.etree.parse(str(self.xml_path), _create_secure_parser())
+        _reject_entity_declarations(self.tree)
+        self.root = self.tree.getroot()
+
+        # Prefixes used in tag and attribute names, as declared on the root element
+        self._namespaces = {"xml": XML_NAMESPACE, **self.root.nsmap}
+        self._tag_names = {}
+        self._attribute_names = {}
+        self.invalidate_indexes()
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml.etree._Element to replace
+            new_content: String containing XML to replace the element with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        parent = elem.getparent()
+        index = parent.index(elem)
+        leading_text, nodes = self._parse_fragment(new_content)
+        self._add_text_before(parent, index, leading_text)
+        for offset, node in enumerate(nodes):
+            parent.insert(index + offset, node)
+
+        # lxml removes an element together with its tail, so keep the tail in place
+        self._add_text_before(parent, index + len(nodes), elem.tail)
+        elem.tail = None
+        parent.remove(elem)
+        self._index_removed(elem)
+        self._reindex(nodes)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml.etree._Element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        parent = elem.getparent()
+        return self._insert_fragment(parent, parent.index(elem) + 1, xml_content)
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml.etree._Element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        parent = elem.getparent()
+        return self._insert_fragment(parent, parent.index(elem), xml_content)
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as children of an element.
+
+        Args:
+            elem: lxml.etree._Element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        return self._insert_fragment(elem, len(elem), xml_content)
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        for rel_elem in self.root.iter("{*}Relationship"):
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Serializes the tree and writes it back to the original file path,
+        preserving the original encoding (ascii or utf-8).
+        """
+        standalone = None
+        if self._declares_standalone:
+            standalone = self.tree.docinfo.standalone
+        self.tree.write(
+            str(self.xml_path),
+            encoding=self.encoding,
+            xml_declaration=True,
+            standalone=standalone,
+        )
+
+    def _get_element_text(self, elem):
+        """
+        Recursively extract all text content from an element.
+
+        Skips whitespace-only text, comments and processing instructions, like
+        XMLEditor. Results are cached per element until the element or a
+        descendant changes.
+
+        Args:
+            elem: lxml.etree._Element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text within the element
+        """
+        text = self._text_cache.get(elem)
+        if text is not None:
+            return text
+
+        text_parts = []
+        if elem.text and elem.text.strip():
+            text_parts.append(elem.text)
+        for child in elem:
+            if isinstance(child.tag, str):
+                text_parts.append(self._get_element_text(child))
+            if child.tail and child.tail.strip():
+                text_parts.append(child.tail)
+        text = "".join(text_parts)
+        self._text_cache[elem] = text
+        return text
+
+    def _insert_fragment(self, parent, index, xml_content):
+        """Insert parsed XML content into parent at the given child index."""
+        leading_text, nodes = self._parse_fragment(xml_content)
+        self._add_text_before(parent, index, leading_text)
+        for offset, node in enumerate(nodes):
+            parent.insert(index + offset, node)
+        self._reindex(nodes)
+        return nodes
+
+    def _add_text_before(self, parent, index, text):
+        """Append text after the child before index, or to parent.text at index 0."""
+        if not text:
+            return
+        if index == 0:
+            parent.text = (parent.text or "") + text
+        else:
+            previous = parent[index - 1]
+            previous.tail = (previous.tail or "") + text
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment using the root element's namespace declarations.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            Tuple of the text before the first node and the list of parsed nodes
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.root.nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>", _create_secure_parser()
+        )
+        # Fragment line numbers are meaningless in this document; 0 reads back as None
+        for elem in wrapper.iter():
+            elem.sourceline = 0
+
+        nodes = list(wrapper)
+        elements = [n for n in nodes if self._is_element(n)]
+        assert elements, "Fragment must contain at least one element"
+        return wrapper.text, nodes
+
+    def _iter_elements(self, root=None):
+        """Return root and its descendant elements, or every element if root is None."""
+        if root is None:
+            root = self.root
+        return root.iter(lxml.etree.Element)
+
+    def _tag_name(self, elem):
+        """Return the qualified tag name of an element, e.g. "w:p"."""
+        tag_name = self._tag_names.get(elem.tag)
+        if tag_name is None:
+            local_name = lxml.etree.QName(elem).localname
+            tag_name = f"{elem.prefix}:{local_name}" if elem.prefix else local_name
+            self._tag_names[elem.tag] = tag_name
+        return tag_name
+
+    def _get_attribute(self, elem, attr_name):
+        """Return an attribute value by qualified name, or "" if it is not set."""
+        clark_name = self._attribute_names.get(attr_name)
+        if clark_name is None:
+            prefix, _, local_name = attr_name.rpartition(":")
+            if not prefix:
+                clark_name = local_name
+            elif prefix in self._namespaces:
+                clark_name = f"{{{self._namespaces[prefix]}}}{local_name}"
+            else:
+                # Undeclared prefix: no element can carry this attribute
+                return ""
+            self._attribute_names[attr_name] = clark_name
+        return elem.get(clark_name, "")
+
+    def _line_number(self, elem):
+        """Return the element's line in the original file, or None if it was added later."""
+        return elem.sourceline or None
+
+    def _is_element(self, node):
+        """Check whether a node returned by the editing methods is an element."""
+        return isinstance(node.tag, str)
+
+    def _parent_element(self, node):
+        """Return the parent element of a node, or None at the document root."""
+        return node.getparent()
+
+    def _is_attached(self, elem):
+        """Check whether an element is still part of this editor's document."""
+        while True:
+            parent = elem.getparent()
+            if parent is None:
+                return elem is self.root
+            elem = parent
+
+
+def _create_secure_parser():
+    """
+    Create an lxml parser that is safe for untrusted documents.
+
+    Entities are never expanded and DTDs and network resources are never
+    loaded, which covers the attacks defusedxml guards against for minidom.
+    """
+    return lxml.etree.XMLParser(
+        resolve_entities=False,
+        load_dtd=False,
+        no_network=True,
+        huge_tree=False,
+    )
+
+
+def _reject_entity_declarations(tree):
+    """Raise ValueError if the document declares entities, like defusedxml does."""
+    dtd = tree.docinfo.internalDTD
+    if dtd is not None and any(True for _ in dtd.iterentities()):
+        raise ValueError("Entity declarations are not allowed in OOXML parts")
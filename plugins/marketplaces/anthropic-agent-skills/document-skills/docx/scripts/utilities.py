@@ -72,6 +72,7 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self.invalidate_indexes()
 
     def get_node(
         self,
@@ -109,40 +110,23 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+        # Text is recomputed on every call, since the DOM may have been edited directly
+        self._text_cache = {}
 
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        matches = self._filter_nodes(
+            self._find_candidates(tag, attrs, line_number), attrs, line_number, contains
+        )
+        if not matches:
+            # Elements added or changed by direct DOM manipulation may not be
+            # indexed yet, so scan the whole document before giving up
+            matches = self._filter_nodes(
+                (elem for elem in self._iter_elements() if self._tag_name(elem) == tag),
+                attrs,
+                line_number,
+                contains,
+            )
+            if matches:
+                self.invalidate_indexes()
 
         if not matches:
             # Build descriptive error message
@@ -180,12 +164,52 @@ class XMLEditor:
             )
         return matches[0]
 
+    def _filter_nodes(self, candidates, attrs, line_number, contains):
+        """Return the candidates that pass every get_node filter."""
+        if contains is not None:
+            normalized_contains = html.unescape(contains)
+
+        matches = []
+        for elem in candidates:
+            # Check line_number filter
+            if line_number is not None:
+                elem_line = self._line_number(elem)
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    self._get_attribute(elem, attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                elem_text = self._get_element_text(elem)
+                # Normalize the search string: convert HTML entities to Unicode characters
+                # This allows searching for both "&#8220;Rowan" and ""Rowan"
+                if normalized_contains not in elem_text:
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached for the duration of one get_node call.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,6 +217,10 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
+        text = self._text_cache.get(elem)
+        if text is not None:
+            return text
+
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
@@ -201,7 +229,154 @@ class XMLEditor:
                     text_parts.append(node.data)
             elif node.nodeType == node.ELEMENT_NODE:
                 text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        text = "".join(text_parts)
+        self._text_cache[elem] = text
+        return text
+
+    def invalidate_indexes(self):
+        """
+        Discard the lookup indexes used by get_node so they are rebuilt on next use.
+
+        replace_node, insert_after, insert_before and append_to keep the indexes
+        up to date. get_node falls back to a full scan when the indexes find no
+        match, so after changing the DOM directly (createElement, appendChild,
+        setAttribute, ...) calling this is optional; it keeps later lookups fast.
+        """
+        self._indexes_built = False
+        self._tag_index = {}
+        self._attr_index = {}
+        self._line_index = {}
+        self._text_cache = {}
+        self._pending_elements = []
+
+    def _find_candidates(self, tag, attrs, line_number):
+        """
+        Return the attached elements that may match a get_node query.
+
+        Candidates come from the most selective index available: the line index
+        for line_number queries, the (tag, attribute, value) index for attrs
+        queries, and the tag index otherwise. get_node still applies every filter.
+        """
+        self._update_indexes()
+
+        if line_number is not None:
+            if isinstance(line_number, range) and len(line_number) > len(
+                self._line_index
+            ):
+                lines = [line for line in self._line_index if line in line_number]
+            elif isinstance(line_number, range):
+                lines = line_number
+            else:
+                lines = [line_number]
+            candidates = [
+                elem
+                for line in lines
+                for elem in self._line_index.get(line, ())
+                if self._tag_name(elem) == tag
+            ]
+        elif attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            candidates = self._get_attr_index(tag, attr_name).get(attr_value, ())
+        else:
+            candidates = self._tag_index.get(tag, ())
+
+        # Elements removed by direct DOM manipulation may still be indexed
+        return [elem for elem in candidates if self._is_attached(elem)]
+
+    def _update_indexes(self):
+        """Build the indexes on first use, then fold in elements inserted since."""
+        if not self._indexes_built:
+            self._build_indexes()
+            return
+
+        pending, self._pending_elements = self._pending_elements, []
+        for root in pending:
+            if not self._is_attached(root):
+                continue
+            for elem in self._iter_elements(root):
+                tag_name = self._tag_name(elem)
+                self._tag_index.setdefault(tag_name, {})[elem] = None
+                for (tag, attr_name), by_value in self._attr_index.items():
+                    if tag == tag_name:
+                        value = self._get_attribute(elem, attr_name)
+                        by_value.setdefault(value, {})[elem] = None
+
+    def _build_indexes(self):
+        """Index every element by tag and by original line in one pass."""
+        self.invalidate_indexes()
+        for elem in self._iter_elements():
+            self._tag_index.setdefault(self._tag_name(elem), {})[elem] = None
+            elem_line = self._line_number(elem)
+            if elem_line is not None:
+                self._line_index.setdefault(elem_line, []).append(elem)
+        self._indexes_built = True
+
+    def _get_attr_index(self, tag, attr_name):
+        """Return {value: elements} for one tag and attribute, building it on first use."""
+        by_value = self._attr_index.get((tag, attr_name))
+        if by_value is None:
+            by_value = {}
+            for elem in self._tag_index.get(tag, ()):
+                by_value.setdefault(self._get_attribute(elem, attr_name), {})[
+                    elem
+                ] = None
+            self._attr_index[(tag, attr_name)] = by_value
+        return by_value
+
+    def _reindex(self, nodes):
+        """
+        Record inserted or modified nodes for indexing.
+
+        Indexing is deferred to the next lookup so that attributes added right
+        after insertion (e.g. by DocxXMLEditor) are indexed with their final values.
+        """
+        for node in nodes:
+            if self._is_element(node):
+                self._pending_elements.append(node)
+
+    def _index_removed(self, elem):
+        """Drop a removed element and its descendants from the indexes."""
+        if not self._indexes_built:
+            return
+        for removed in self._iter_elements(elem):
+            self._tag_index.get(self._tag_name(removed), {}).pop(removed, None)
+
+    # Node access used by get_node and the indexes. Other XML engines override these.
+
+    def _iter_elements(self, root=None):
+        """Return root and its descendant elements, or every element if root is None."""
+        if root is None:
+            return self.dom.getElementsByTagName("*")
+        return [root, *root.getElementsByTagName("*")]
+
+    def _tag_name(self, elem):
+        """Return the qualified tag name of an element, e.g. "w:p"."""
+        return elem.tagName
+
+    def _get_attribute(self, elem, attr_name):
+        """Return an attribute value by qualified name, or "" if it is not set."""
+        return elem.getAttribute(attr_name)
+
+    def _line_number(self, elem):
+        """Return the element's line in the original file, or None if it was added later."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _is_element(self, node):
+        """Check whether a node returned by the editing methods is an element."""
+        return node.nodeType == node.ELEMENT_NODE
+
+    def _parent_element(self, node):
+        """Return the parent element of a node, or None at the document root."""
+        parent = node.parentNode
+        if parent is None or parent.nodeType != parent.ELEMENT_NODE:
+            return None
+        return parent
+
+    def _is_attached(self, elem):
+        """Check whether an element is still part of this editor's document."""
+        while elem.parentNode is not None:
+            elem = elem.parentNode
+        return elem is self.dom
 
     def replace_node(self, elem, new_content):
         """
@@ -222,6 +397,8 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._index_removed(elem)
+        self._reindex(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +423,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._reindex(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +444,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._reindex(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,6 +464,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._reindex(nodes)
         return nodes
 
     def get_next_rid(self):
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark Office document validation with and without the parse and schema caches.
+
+The "uncached" run re-parses every file for each check and recompiles the XSD for
+every part, matching the validators before the caches were added. The "cached" run
+starts from a cold schema cache, like a fresh validate.py invocation. With --jobs N,
+a "parallel" run also validates parts across N worker processes. These runs all
+start without a persistent validation cache; the "revalidate" run keeps it, like
+a second save of an unchanged document.
+
+Usage:
+    python benchmark_validate.py <office_file> [--runs N] [--jobs N]
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import lxml.etree
+
+from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import base
+from validation.cache import CACHE_FILENAME
+
+VALIDATORS = {
+    ".docx": [DOCXSchemaValidator, RedliningValidator],
+    ".pptx": [PPTXSchemaValidator],
+}
+
+
+def run_validators(validators, unpacked_dir, original_file, jobs=1, warm=False):
+    """Run every validator once and return the wall time in seconds."""
+    if not warm:
+        (Path(unpacked_dir) / CACHE_FILENAME).unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for V in validators:
+            if V is RedliningValidator:
+                V(unpacked_dir, original_file).validate()
+            else:
+                V(unpacked_dir, original_file, jobs=jobs).validate()
+    return time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def caches_disabled():
+    """Parse every file on each access and recompile schemas for every part."""
+    cached_parse = base.BaseSchemaValidator._parse_xml
+    cached_load_schema = base.load_schema
+    base.BaseSchemaValidator._parse_xml = lambda self, xml_file: lxml.etree.parse(
+        str(xml_file)
+    )
+    base.load_schema = cached_load_schema.__wrapped__
+    try:
+        yield
+    finally:
+        base.BaseSchemaValidator._parse_xml = cached_parse
+        base.load_schema = cached_load_schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Office document validation")
+    parser.add_argument("office_file", help="Path to a .docx or .pptx file")
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Runs per mode (median is reported)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Also time XSD validation with N workers"
+    )
+    args = parser.parse_args()
+
+    original_file = Path(args.office_file)
+    validators = VALIDATORS.get(original_file.suffix.lower())
+    if validators is None:
+        print(f"Error: Benchmark not supported for file type {original_file.suffix}")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        zipfile.ZipFile(original_file).extractall(temp_dir)
+        part_count = len(list(Path(temp_dir).rglob("*.xml"))) + len(
+            list(Path(temp_dir).rglob("*.rels"))
+        )
+        print(f"{original_file.name}: {part_count} XML parts")
+
+        timings = {}
+        with caches_disabled():
+            timings["uncached"] = statistics.median(
+                run_validators(validators, temp_dir, original_file)
+                for _ in range(args.runs)
+            )
+
+        samples = []
+        for _ in range(args.runs):
+            base.load_schema.cache_clear()
+            samples.append(run_validators(validators, temp_dir, original_file))
+        timings["cached"] = statistics.median(samples)
+
+        if args.jobs > 1:
+            samples = []
+            for _ in range(args.runs):
+                base.load_schema.cache_clear()
+                samples.append(
+                    run_validators(validators, temp_dir, original_file, args.jobs)
+                )
+            timings["parallel"] = statistics.median(samples)
+
+        run_validators(validators, temp_dir, original_file)
+        timings["revalidate"] = statistics.median(
+            run_validators(validators, temp_dir, original_file, warm=True)
+            for _ in range(args.runs)
+        )
+
+    for mode, seconds in timings.items():
+        print(f"  {mode:<10} {seconds * 1000:9.1f} ms")
+    for mode in [mode for mode in timings if mode != "uncached"]:
+        print(f"  speedup    {timings['uncached'] / timings[mode]:9.2f}x ({mode})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,17 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--original <office_file>]
+
+Parts that are unchanged since unpacking are copied from the original file as-is,
+without being condensed or recompressed.
 """
 
 import argparse
-import shutil
+import hashlib
+import json
+import re
+import struct
 import subprocess
 import sys
 import tempfile
@@ -15,17 +21,50 @@ import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+# Already-compressed media is stored as-is; deflating it again costs time for no gain
+STORED_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".wdp", ".jdp",
+    ".mp3", ".m4a", ".mp4", ".m4v", ".mov", ".wmv", ".avi", ".zip",
+}  # fmt: skip
+
+# Condensing tokens: an element named t (w:t, a:t, ...) or CDATA whose content must be
+# kept, a comment with any whitespace after it, or a tag followed by whitespace-only
+# text. Quoted attribute values may contain ">".
+CONDENSE_PATTERN = re.compile(
+    r"(<!\[CDATA\[.*?\]\]>|<(?:[\w.-]+:)?t(?:\s(?:[^>\"'/]|\"[^\"]*\"|'[^']*')*)?>)"
+    r"|<!--.*?-->(?:\s+(?=<))?"
+    r"|(<(?:[^>\"']|\"[^\"]*\"|'[^']*')*>)\s+(?=<)",
+    re.DOTALL,
+)
+
+# Written by unpack.py: the source file and a hash of every part as unpacked
+MANIFEST_FILENAME = ".unpack_manifest.json"
+
+# Encodings the fast condense can read as UTF-8
+UTF8_COMPATIBLE_ENCODINGS = {b"utf-8", b"utf8", b"ascii", b"us-ascii"}
+
+XML_DECLARATION_ENCODING = re.compile(
+    rb"^(<\?xml[^>]*?encoding=[\"'])([A-Za-z0-9._-]+)([\"'])"
+)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--original",
+        help="Office file to reuse unchanged parts from (default: the unpacked file)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            original_file=args.original,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +81,18 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, original_file=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Parts whose content hash matches the original are copied from it as raw zip
+    entries; only new and modified parts are condensed and compressed.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        original_file: Office file to reuse unchanged parts from. Defaults to the
+            file unpack.py extracted input_dir from, if it has not changed since.
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,28 +105,44 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    if original_file is None:
+        original_file = unpacked_source(input_dir)
+    original = _OriginalPackage(input_dir, original_file) if original_file else None
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Stream each part straight into the archive; the input is never modified
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+            for f in sorted(input_dir.rglob("*"), key=_archive_order):
+                # Skip top-level dotfiles: the unpack manifest, validation cache, etc.
+                if not f.is_file() or (
+                    f.parent == input_dir and f.name.startswith(".")
+                ):
+                    continue
+
+                arcname = f.relative_to(input_dir).as_posix()
+                if original and original.is_unchanged(arcname, f):
+                    original.copy_entry(arcname, zf)
+                elif f.name.endswith((".xml", ".rels")):
+                    # Remove pretty-printing whitespace in memory
+                    zf.writestr(
+                        _zip_info(f, arcname),
+                        condense_xml_content(f.read_bytes()),
+                        compress_type=zipfile.ZIP_DEFLATED,
+                    )
+                elif f.suffix.lower() in STORED_EXTENSIONS:
+                    zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zf.write(f, arcname)
+    finally:
+        if original:
+            original.close()
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
@@ -130,10 +190,186 @@ def validate_document(doc_path):
             return False
 
 
+def file_sha256(path):
+    """Hash a file's content in 1MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_signature(path):
+    """Size and modification time, used to tell whether a file has changed."""
+    stat = Path(path).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def write_manifest(unpacked_dir, source_file):
+    """Record the source file and a hash of every unpacked part."""
+    unpacked_dir = Path(unpacked_dir)
+    manifest = {
+        "source": str(Path(source_file).resolve()),
+        "source_signature": _source_signature(source_file),
+        "parts": {
+            f.relative_to(unpacked_dir).as_posix(): file_sha256(f)
+            for f in unpacked_dir.rglob("*")
+            if f.is_file() and not (f.parent == unpacked_dir and f.name.startswith("."))
+        },
+    }
+    (unpacked_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+
+
+def _read_manifest(unpacked_dir):
+    """Load the unpack manifest, or None if it is missing or unreadable."""
+    try:
+        manifest = json.loads((Path(unpacked_dir) / MANIFEST_FILENAME).read_text())
+        return manifest if isinstance(manifest, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def unpacked_source(unpacked_dir):
+    """Get the file unpacked_dir was unpacked from, if it still exists unchanged."""
+    manifest = _read_manifest(unpacked_dir)
+    if not manifest or "source" not in manifest:
+        return None
+    try:
+        if _source_signature(manifest["source"]) != manifest.get("source_signature"):
+            return None
+    except OSError:
+        return None
+    return Path(manifest["source"])
+
+
+class _OriginalPackage:
+    """Finds unchanged parts in an original Office file and copies them verbatim."""
+
+    # Local file header: signature, versions, flags, sizes, name and extra lengths
+    LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+    def __init__(self, unpacked_dir, original_file):
+        self.zip = zipfile.ZipFile(original_file)
+        self.fp = open(original_file, "rb")
+
+        # Hashes of the parts as unpacked are only valid for the file they came from
+        manifest = _read_manifest(unpacked_dir) or {}
+        if manifest.get("source") == str(Path(original_file).resolve()) and (
+            manifest.get("source_signature") == _source_signature(original_file)
+        ):
+            self.unpacked_hashes = manifest.get("parts", {})
+        else:
+            self.unpacked_hashes = {}
+
+    def is_unchanged(self, arcname, path):
+        """Check whether a part has the same content as in the original."""
+        try:
+            info = self.zip.getinfo(arcname)
+        except KeyError:
+            return False
+        if info.flag_bits & 0x1:
+            return False  # Encrypted entries cannot be copied raw
+
+        current = file_sha256(path)
+        if arcname in self.unpacked_hashes:
+            return current == self.unpacked_hashes[arcname]
+
+        # Not in the manifest: compare against the original content itself,
+        # checking size first to avoid decompressing parts that clearly differ
+        if path.stat().st_size != info.file_size:
+            return False
+        digest = hashlib.sha256()
+        with self.zip.open(info) as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return current == digest.hexdigest()
+
+    def copy_entry(self, arcname, zf):
+        """Copy a member's compressed bytes into zf without recompressing them.
+
+        zipfile has no public API for raw copies, so this writes the local
+        header and data itself and registers the entry like ZipFile.write does.
+        """
+        info = self.zip.getinfo(arcname)
+
+        # Data starts after the local header and its variable-length fields
+        self.fp.seek(info.header_offset)
+        header = self.LOCAL_HEADER.unpack(self.fp.read(self.LOCAL_HEADER.size))
+        name_length, extra_length = header[-2:]
+        self.fp.seek(name_length + extra_length, 1)
+
+        zinfo = zipfile.ZipInfo(arcname, info.date_time)
+        zinfo.compress_type = info.compress_type
+        zinfo.CRC = info.CRC
+        zinfo.compress_size = info.compress_size
+        zinfo.file_size = info.file_size
+        zinfo.external_attr = info.external_attr
+        # Sizes go in the local header, so no trailing data descriptor is written
+        zinfo.flag_bits = info.flag_bits & ~0x08
+
+        zinfo.header_offset = zf.fp.tell()
+        zf.fp.write(zinfo.FileHeader())
+        remaining = info.compress_size
+        while remaining:
+            block = self.fp.read(min(remaining, 1024 * 1024))
+            if not block:
+                raise ValueError(f"Truncated entry {arcname} in original file")
+            zf.fp.write(block)
+            remaining -= len(block)
+
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[arcname] = zinfo
+        zf._didModify = True
+
+    def close(self):
+        self.fp.close()
+        self.zip.close()
+
+
+def _archive_order(path):
+    """Sort key putting [Content_Types].xml first, then parts by path."""
+    return (path.name != "[Content_Types].xml", path.as_posix())
+
+
+def _zip_info(path, arcname):
+    """Build a ZipInfo for in-memory content that keeps the file's timestamp."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    return zinfo
+
+
+def condense_xml_content(content):
+    """Strip whitespace-only text and comments from XML bytes in a single regex pass.
+
+    Whitespace inside elements named t (w:t, a:t, ...) is preserved. Parts not
+    encoded as UTF-8 or ASCII fall back to the DOM-based condense.
+    """
+    match = XML_DECLARATION_ENCODING.match(content)
+    if match and match.group(2).lower() not in UTF8_COMPATIBLE_ENCODINGS:
+        return _condense_xml_dom(content)
+    try:
+        text = content.decode("utf-8")
+    except UnicodeDecodeError:
+        return _condense_xml_dom(content)
+
+    condensed = CONDENSE_PATTERN.sub(r"\1\2", text).strip().encode("utf-8")
+
+    # ASCII is a subset of UTF-8, so label the output as UTF-8 like Office does
+    if match:
+        condensed = XML_DECLARATION_ENCODING.sub(rb"\1UTF-8\3", condensed, count=1)
+    return condensed
+
+
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_content(xml_file.read_bytes()))
+
+
+def _condense_xml_dom(content):
+    """Strip unnecessary whitespace and remove comments using a DOM round-trip."""
+    dom = defusedxml.minidom.parseString(content)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +386,7 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
 
 
 if __name__ == "__main__":
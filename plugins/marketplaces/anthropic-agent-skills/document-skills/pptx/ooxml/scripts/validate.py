@@ -3,7 +3,7 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N]
 """
 
 import argparse
@@ -30,6 +30,13 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation (0 = one per CPU)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -38,6 +45,7 @@ def main():
     file_extension = original_file.suffix.lower()
     assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
+    assert args.jobs >= 0, "Error: --jobs must be 0 or a positive number"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
@@ -55,7 +63,12 @@ def main():
     # Run validators
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        if V is RedliningValidator:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        else:
+            validator = V(
+                unpacked_dir, original_file, verbose=args.verbose, jobs=args.jobs
+            )
         if not validator.validate():
             success = False
 
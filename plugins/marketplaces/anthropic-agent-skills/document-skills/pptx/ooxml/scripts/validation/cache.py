@@ -0,0 +1,118 @@
+"""
+Persistent cache of per-part validation results, stored in the unpacked directory.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import lxml.etree
+
+# Bump whenever a change to the validators can change the result for the same input
+VALIDATOR_VERSION = 1
+
+CACHE_FILENAME = ".validation_cache.json"
+
+
+class ValidationCache:
+    """Validation results keyed by a hash of everything the result depends on.
+
+    Each entry records the part it belongs to. On save, entries from this run
+    replace every older entry for the same part, so the file stays about one
+    entry per part no matter how many edit-save cycles it has seen.
+    """
+
+    VERSION = f"{VALIDATOR_VERSION}/lxml-{lxml.etree.__version__}"
+
+    def __init__(self, unpacked_dir):
+        self.path = Path(unpacked_dir) / CACHE_FILENAME
+        self._entries = None
+        self._used = {}
+
+    @staticmethod
+    def key(*parts):
+        """Hash the given str/bytes values into a cache key."""
+        digest = hashlib.sha256()
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode("utf-8")
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached value for key, or None."""
+        if self._entries is None:
+            self._entries = self._load()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._used[key] = entry
+        return entry["value"]
+
+    def put(self, key, part, value):
+        """Record a JSON-serializable value for one part."""
+        if self._entries is None:
+            self._entries = self._load()
+        entry = {"part": part, "value": value}
+        self._entries[key] = entry
+        self._used[key] = entry
+
+    def take_used(self):
+        """Return and forget the entries read or written since the last call."""
+        used, self._used = self._used, {}
+        return used
+
+    def merge_used(self, entries):
+        """Adopt entries used by another cache instance, e.g. in a worker process."""
+        if self._entries is None:
+            self._entries = self._load()
+        self._entries.update(entries)
+        self._used.update(entries)
+
+    def save(self):
+        """Write this run's entries atomically; caching is best-effort."""
+        if not self._used:
+            return
+
+        # Re-read so results saved by other validators since we loaded survive
+        entries = self._load()
+        touched = {entry["part"] for entry in self._used.values()}
+        entries = {
+            key: entry for key, entry in entries.items() if entry["part"] not in touched
+        }
+        entries.update(self._used)
+
+        try:
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=CACHE_FILENAME, suffix=".tmp"
+            )
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": self.VERSION, "entries": entries}, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            Path(temp_path).unlink(missing_ok=True)
+
+    def _load(self):
+        """Load entries, treating a missing, corrupt or outdated file as empty."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return {}
+            return {
+                key: entry
+                for key, entry in data["entries"].items()
+                if isinstance(entry, dict) and "part" in entry and "value" in entry
+            }
+        except (OSError, ValueError, AttributeError, KeyError, TypeError):
+            return {}
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -2,23 +2,99 @@
 """
 Performance monitoring hook for Claude Code operations.
 Logs timing and usage information for analysis.
+
+Entries are appended to .claude/performance.jsonl, one JSON object per line.
+Run with --summary to print per-tool latency percentiles from the log.
 """
 
 import json
+import os
 import sys
 import time
 from pathlib import Path
 
+LOG_FILE = Path('.claude') / 'performance.jsonl'
+
+# Rotate to performance.jsonl.1 once the log grows past this size
+MAX_LOG_BYTES = 5 * 1024 * 1024
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def append_entry(log_file, log_entry):
+    """Append one entry as a single O_APPEND write so concurrent hooks never interleave."""
+    log_file.parent.mkdir(exist_ok=True)
+
+    try:
+        if log_file.stat().st_size > MAX_LOG_BYTES:
+            os.replace(log_file, log_file.with_name(log_file.name + '.1'))
+    except FileNotFoundError:
+        pass
+
+    line = (json.dumps(log_entry, separators=(',', ':')) + '\n').encode('utf-8')
+    fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def summarize(log_file):
+    """Compute per-tool latency percentiles in one streaming pass over the log.
+
+    Latency is the time between a PreToolUse entry and the PostToolUse entry
+    with the same session and tool_use_id.
+    """
+    started = {}
+    latencies = {}
+
+    for path in (log_file.with_name(log_file.name + '.1'), log_file):
+        if not path.exists():
+            continue
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from a rotation or crash
+
+                tool_use_id = entry.get('tool_use_id')
+                if not tool_use_id:
+                    continue
+                key = (entry.get('session_id'), tool_use_id)
+
+                if entry.get('hook_event') == 'PreToolUse':
+                    started[key] = entry['timestamp']
+                elif entry.get('hook_event') == 'PostToolUse' and key in started:
+                    elapsed_ms = (entry['timestamp'] - started.pop(key)) * 1000
+                    latencies.setdefault(entry.get('tool_name', 'unknown'), []).append(elapsed_ms)
+
+    summary = {}
+    for tool_name, samples in latencies.items():
+        samples.sort()
+        summary[tool_name] = {'count': len(samples)}
+        for p in PERCENTILES:
+            # Nearest-rank percentile
+            index = max(0, -(-p * len(samples) // 100) - 1)
+            summary[tool_name][f'p{p}_ms'] = round(samples[index], 1)
+    return summary
+
+
 def main():
+    if '--summary' in sys.argv[1:]:
+        summary = summarize(LOG_FILE)
+        print(json.dumps(summary, indent=2, sort_keys=True))
+        sys.exit(0)
+
     try:
         # Read Claude Code hook input from stdin
         input_data = json.load(sys.stdin)
-        
+
         hook_event = input_data.get('hook_event_name', '')
         tool_name = input_data.get('tool_name', 'unknown')
         session_id = input_data.get('session_id', 'unknown')
         tool_input = input_data.get('tool_input', {})
-        
+
         # Create performance log entry
         log_entry = {
             'timestamp': time.time(),
@@ -26,7 +102,11 @@ def main():
             'hook_event': hook_event,
             'tool_name': tool_name,
         }
-        
+
+        # Pairs PreToolUse with PostToolUse for latency
+        if input_data.get('tool_use_id'):
+            log_entry['tool_use_id'] = input_data['tool_use_id']
+
         # Add tool-specific metrics
         if tool_name == 'Read':
             file_path = tool_input.get('file_path', '')
@@ -41,37 +121,15 @@ def main():
             content = tool_input.get('content', '')
             log_entry['file_path'] = file_path
             log_entry['content_length'] = len(content)
-            
-        # Ensure .claude directory exists
-        claude_dir = Path('.claude')
-        claude_dir.mkdir(exist_ok=True)
-        
-        # Log file path
-        log_file = claude_dir / 'performance.json'
-        
-        # Load existing logs
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-            
-        # Append new entry
-        logs.append(log_entry)
-        
-        # Keep only last 1000 entries
-        logs = logs[-1000:]
-        
-        # Save updated logs
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
-            
+
+        append_entry(LOG_FILE, log_entry)
+
         # Success
         sys.exit(0)
-        
+
     except Exception as e:
         # Don't fail the hook for performance logging issues
         sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
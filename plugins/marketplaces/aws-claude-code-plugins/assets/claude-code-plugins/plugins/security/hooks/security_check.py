@@ -18,9 +18,12 @@ Version: 1.0.0
 """
 
 import json
+import math
 import os
 import re
+import string
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
@@ -63,39 +66,90 @@ def is_sensitive_file(file_path: str) -> bool:
     return False
 
 
+# Secret rules as (description, pattern). Patterns are matched against a lowercased
+# copy of the content, so they are written in lowercase and compiled without
+# IGNORECASE, which lets the regex engine jump between occurrences of each rule's
+# literal prefix. A capture group, if present, holds the secret value.
+SECRET_RULES = [
+    ('API Key', r'api[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']'),
+    ('Secret Key', r'secret[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']'),
+    ('Access Token', r'access[_-]?token\s*[:=]\s*["\']([^"\']{20,})["\']'),
+    ('Password', r'password\s*[:=]\s*["\']([^"\']{8,})["\']'),
+    ('Private Key', r'private[_-]?key\s*[:=]\s*["\']([^"\']+)["\']'),
+    ('Bearer Token', r'bearer\s+([a-z0-9\-_\.]+)'),
+    ('OpenAI API Key', r'sk-[a-z0-9]{48}'),
+    ('Slack Bot Token', r'xoxb-[a-z0-9\-]+'),
+    ('GitHub Personal Access Token', r'ghp_[a-z0-9]{36}'),
+    ('AWS Access Key', r'akia[0-9a-z]{16}'),
+    # The 8 leading hex digits are checked separately (see UUID_PREFIX) so the
+    # search can anchor on the literal "-"
+    ('UUID (potential secret)', r'-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'),
+]
+
+COMPILED_SECRET_RULES = [(description, re.compile(pattern)) for description, pattern in SECRET_RULES]
+UUID_PREFIX = re.compile(r'[0-9a-f]{8}')
+UUID_RULE = 'UUID (potential secret)'
+
+PLACEHOLDERS = ['example', 'placeholder', 'your_key', 'your-key', 'replace', 'xxx', '***']
+
+# Values below this Shannon entropy (bits per character) are repetitive filler
+# such as "aaaaaaaa" or "********", not credentials
+MIN_SECRET_ENTROPY = 2.0
+
+# Maps ASCII uppercase to lowercase without changing string length, so match
+# offsets in the lowered copy are valid in the original content
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def shannon_entropy(value: str) -> float:
+    """Shannon entropy of a string in bits per character."""
+    if not value:
+        return 0.0
+    length = len(value)
+    return -sum(
+        (count / length) * math.log2(count / length)
+        for count in Counter(value).values()
+    )
+
+
 def scan_for_secrets(content: str, file_path: str) -> List[Tuple[str, str]]:
     """Scan file content for potential secrets and credentials."""
     secrets_found = []
-    
-    # Common secret patterns
-    secret_patterns = [
-        (r'api[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']', 'API Key'),
-        (r'secret[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']', 'Secret Key'),
-        (r'access[_-]?token\s*[:=]\s*["\']([^"\']{20,})["\']', 'Access Token'),
-        (r'password\s*[:=]\s*["\']([^"\']{8,})["\']', 'Password'),
-        (r'private[_-]?key\s*[:=]\s*["\']([^"\']+)["\']', 'Private Key'),
-        (r'bearer\s+([a-zA-Z0-9\-_\.]+)', 'Bearer Token'),
-        (r'sk-[a-zA-Z0-9]{48}', 'OpenAI API Key'),
-        (r'xoxb-[a-zA-Z0-9\-]+', 'Slack Bot Token'),
-        (r'ghp_[a-zA-Z0-9]{36}', 'GitHub Personal Access Token'),
-        (r'AKIA[0-9A-Z]{16}', 'AWS Access Key'),
-        (r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', 'UUID (potential secret)'),
-    ]
-    
-    for pattern, secret_type in secret_patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
+
+    # Lowercase once for every rule instead of matching each rule case-insensitively
+    lowered = content.lower() if content.isascii() else content.translate(ASCII_LOWER)
+
+    for secret_type, pattern in COMPILED_SECRET_RULES:
+        for match in pattern.finditer(lowered):
+            start, end = match.span()
+            if secret_type == UUID_RULE:
+                start -= 8
+                if start < 0 or not UUID_PREFIX.fullmatch(lowered, start, match.start()):
+                    continue
+
             # Skip if it looks like a placeholder or example
-            matched_text = match.group(0).lower()
-            if any(placeholder in matched_text for placeholder in 
-                   ['example', 'placeholder', 'your_key', 'your-key', 'replace', 'xxx', '***']):
+            if any(placeholder in lowered[start:end] for placeholder in PLACEHOLDERS):
                 continue
-            
-            secrets_found.append((secret_type, match.group(0)[:50] + '...' if len(match.group(0)) > 50 else match.group(0)))
-    
+
+            # Skip repetitive filler values
+            secret_value = content[match.start(1):match.end(1)] if pattern.groups else content[start:end]
+            if shannon_entropy(secret_value) < MIN_SECRET_ENTROPY:
+                continue
+
+            matched_text = content[start:end]
+            secrets_found.append((secret_type, matched_text[:50] + '...' if len(matched_text) > 50 else matched_text))
+
     return secrets_found
 
 
+def extract_content(tool_input: Dict[str, Any]) -> str:
+    """Get the text a Write, Edit or MultiEdit would add, with all MultiEdit edits joined for one scan."""
+    edits = tool_input.get('edits')
+    if edits:
+        return '\n\n'.join(edit.get('new_string', '') for edit in edits)
+    return tool_input.get('content', '') or tool_input.get('new_string', '')
+
+
 def validate_file_path(file_path: str, project_root: str) -> bool:
     """Validate file path for directory traversal and other security issues."""
     try:
@@ -160,7 +214,7 @@ def main():
         
         # Get file information
         file_path = tool_input.get('file_path', '')
-        content = tool_input.get('content', '') or tool_input.get('new_string', '')
+        content = extract_content(tool_input)
         
         if not file_path:
             # No file path to validate
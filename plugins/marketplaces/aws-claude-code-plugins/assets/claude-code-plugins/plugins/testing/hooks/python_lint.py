@@ -3,15 +3,34 @@
 Python linting hook using Ruff (linting) and optionally mypy (type checking).
 Black is for formatting only, not linting.
 Provides real-time code quality feedback for Python files.
+
+Set PYTHON_LINT_DAEMON=1 for daemon mode: mypy runs through a warm dmypy
+daemon, edits arriving within PYTHON_LINT_DEBOUNCE seconds are linted together
+in one black/ruff/mypy run, and results are cached by file content hash.
 """
 
+import hashlib
 import json
 import sys
 import subprocess
 import os
+import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks (Windows): daemon mode lints each file on its own
+    fcntl = None
+
+DAEMON_MODE = os.environ.get('PYTHON_LINT_DAEMON', '0') == '1'
+DEBOUNCE_SECONDS = float(os.environ.get('PYTHON_LINT_DEBOUNCE', '0.3'))
+
+CACHE_DIR = Path('.claude') / 'python_lint_cache'
+PENDING_FILE = Path('.claude') / 'python_lint_pending'
+LOCK_FILE = Path('.claude') / 'python_lint.lock'
+
 def is_python_file(file_path):
     """Check if the file is a Python file."""
     if not file_path:
@@ -134,6 +153,275 @@ def run_mypy(file_path):
     except Exception as e:
         return {'tool': 'mypy', 'passed': False, 'error': str(e)}
 
+def content_key(file_path):
+    """Cache key for a file's lint results: its path plus a hash of its content."""
+    digest = hashlib.sha256(os.path.abspath(file_path).encode('utf-8') + b'\0')
+    with open(file_path, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def load_cached_results(key):
+    """Load cached lint results for a content key, or None."""
+    try:
+        with open(CACHE_DIR / f'{key}.json', 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_results(key, results):
+    """Cache lint results under a content key (best-effort).
+
+    Results where a tool was missing, timed out or failed to run are not cached,
+    so they are retried on the next edit.
+    """
+    if any(result.get('error') for result in results):
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_file = CACHE_DIR / f'{key}.{os.getpid()}.tmp'
+        with open(temp_file, 'w') as f:
+            json.dump(results, f)
+        os.replace(temp_file, CACHE_DIR / f'{key}.json')
+    except OSError:
+        pass
+
+def path_spellings(file_path):
+    """Ways a tool may print a path: as given, absolute, or relative to the working directory."""
+    spellings = {file_path, os.path.abspath(file_path)}
+    try:
+        spellings.add(os.path.relpath(file_path))
+    except ValueError:
+        # No relative path across Windows drives
+        pass
+    return spellings
+
+def output_by_file(output, file_paths):
+    """Split tool output lines of the form 'path:line:...' by file."""
+    prefixes = [
+        (spelling + ':', file_path)
+        for file_path in file_paths
+        for spelling in path_spellings(file_path)
+    ]
+    lines_by_file = {file_path: [] for file_path in file_paths}
+    for line in output.splitlines():
+        for prefix, file_path in prefixes:
+            if line.startswith(prefix):
+                lines_by_file[file_path].append(line)
+                break
+    return lines_by_file
+
+def check_formatting_batch(file_paths):
+    """Check formatting of several files with one Black run."""
+    try:
+        result = subprocess.run(
+            ['black', '--check', *file_paths],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except Exception:
+        # Black missing or timed out: report per file exactly like the single-file check
+        return {file_path: check_formatting(file_path) for file_path in file_paths}
+
+    # Black reports each file it would change as "would reformat <path>" and each
+    # file it cannot parse as "error: cannot ... <path>:...", exiting 123
+    stderr_lines = result.stderr.splitlines()
+    needs_formatting = {
+        os.path.abspath(line[len('would reformat '):].strip())
+        for line in stderr_lines
+        if line.startswith('would reformat ')
+    }
+    failed_lines = [line for line in stderr_lines if line.startswith('error: cannot ')]
+
+    results = {}
+    for file_path in file_paths:
+        if os.path.abspath(file_path) in needs_formatting or any(
+            f' {spelling}:' in line for line in failed_lines for spelling in path_spellings(file_path)
+        ):
+            results[file_path] = {'tool': 'black (formatting)', 'passed': False, 'message': 'File needs formatting'}
+        else:
+            results[file_path] = {'tool': 'black (formatting)', 'passed': True}
+
+    if result.returncode not in (0, 1) and all(file_result['passed'] for file_result in results.values()):
+        # Black failed without naming a file: check each file on its own
+        return {file_path: check_formatting(file_path) for file_path in file_paths}
+    return results
+
+def run_ruff_batch(file_paths):
+    """Lint several files with one Ruff run."""
+    try:
+        result = subprocess.run(
+            ['ruff', 'check', *file_paths, '--output-format', 'json'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except FileNotFoundError:
+        print("⚠️  Ruff not found, falling back to flake8 (install ruff for better performance)", file=sys.stderr)
+        return run_flake8_batch(file_paths)
+    except Exception:
+        return {file_path: run_ruff(file_path) for file_path in file_paths}
+
+    # Ruff exits 0 when clean and 1 when it found issues; anything else (e.g. a
+    # bad config) or output that is not JSON means ruff itself failed
+    try:
+        errors = json.loads(result.stdout) if result.returncode in (0, 1) else None
+    except ValueError:
+        errors = None
+    if not isinstance(errors, list):
+        return {file_path: run_ruff(file_path) for file_path in file_paths}
+
+    results = {}
+    for file_path in file_paths:
+        file_errors = [error for error in errors if error.get('filename') == file_path]
+        if file_errors:
+            results[file_path] = {'tool': 'ruff', 'passed': False, 'errors': file_errors, 'error': result.stderr}
+        else:
+            results[file_path] = {'tool': 'ruff', 'passed': True}
+    return results
+
+def run_flake8_batch(file_paths):
+    """Fallback to one flake8 run over several files if Ruff is not available."""
+    try:
+        result = subprocess.run(
+            ['flake8', *file_paths, '--max-line-length=88'],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except Exception:
+        return {file_path: run_flake8(file_path) for file_path in file_paths}
+
+    results = {}
+    for file_path, lines in output_by_file(result.stdout, file_paths).items():
+        if lines:
+            results[file_path] = {
+                'tool': 'flake8',
+                'passed': False,
+                'output': '\n'.join(lines),
+                'error': result.stderr
+            }
+        else:
+            results[file_path] = {'tool': 'flake8', 'passed': True}
+    return results
+
+def run_mypy_batch(file_paths):
+    """Type check several files through the mypy daemon, starting it if needed.
+
+    dmypy keeps the project's analysis in memory, so after the first run only
+    changed files are re-checked.
+    """
+    try:
+        result = subprocess.run(
+            [
+                'dmypy', 'run', '--timeout', '3600', '--',
+                '--ignore-missing-imports', '--show-absolute-path', *file_paths
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+    except subprocess.TimeoutExpired:
+        return {file_path: {'tool': 'mypy', 'passed': False, 'error': 'Timeout'} for file_path in file_paths}
+    except Exception:
+        # dmypy not installed: fall back to a cold mypy run per file
+        return {file_path: run_mypy(file_path) for file_path in file_paths}
+
+    # dmypy exits 0 when clean, 1 when errors were found, 2 on failure
+    if result.returncode not in (0, 1):
+        return {
+            file_path: {'tool': 'mypy', 'passed': False, 'error': result.stderr or result.stdout}
+            for file_path in file_paths
+        }
+
+    lines_by_file = output_by_file(result.stdout, file_paths)
+    if result.returncode != 0 and not any(lines_by_file.values()):
+        # Errors that name none of the files (e.g. in an imported module) fail
+        # them all, as a per-file mypy run would
+        return {
+            file_path: {'tool': 'mypy', 'passed': False, 'output': result.stdout, 'error': result.stderr}
+            for file_path in file_paths
+        }
+
+    results = {}
+    for file_path, lines in lines_by_file.items():
+        if lines:
+            results[file_path] = {
+                'tool': 'mypy',
+                'passed': False,
+                'output': '\n'.join(lines),
+                'error': result.stderr
+            }
+        else:
+            results[file_path] = {'tool': 'mypy', 'passed': True}
+    return results
+
+def lint_batch(file_paths):
+    """Run every tool once over several files and return each file's results."""
+    format_results = check_formatting_batch(file_paths)
+    ruff_results = run_ruff_batch(file_paths)
+    mypy_results = run_mypy_batch(file_paths)
+    return {
+        file_path: [format_results[file_path], ruff_results[file_path], mypy_results[file_path]]
+        for file_path in file_paths
+    }
+
+def lint_file_daemon(file_path):
+    """Lint a file in daemon mode, batching it with other files edited in the same burst.
+
+    Each hook queues its file and waits out the debounce window. The first hook
+    to take the lock lints every queued file that has no cached results; the
+    others then find their results in the content-hash cache.
+    """
+    file_path = os.path.abspath(file_path)
+    key = content_key(file_path)
+
+    cached = load_cached_results(key)
+    if cached is not None:
+        return cached
+
+    if fcntl is None:
+        results = lint_batch([file_path])[file_path]
+        save_cached_results(key, results)
+        return results
+
+    PENDING_FILE.parent.mkdir(exist_ok=True)
+    fd = os.open(PENDING_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (file_path + '\n').encode('utf-8'))
+    finally:
+        os.close(fd)
+
+    time.sleep(DEBOUNCE_SECONDS)
+
+    with open(LOCK_FILE, 'a') as lock:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+        # Another hook may have linted this file while we waited
+        cached = load_cached_results(key)
+        if cached is not None:
+            return cached
+
+        # Take over the queue. A path appended after this point is still linted
+        # by its own hook, which will find no cached results.
+        with open(PENDING_FILE, 'r+') as f:
+            queued = f.read().splitlines()
+            f.seek(0)
+            f.truncate()
+
+        keys = {file_path: key}
+        for queued_path in queued:
+            if queued_path not in keys and is_python_file(queued_path) and os.path.exists(queued_path):
+                queued_key = content_key(queued_path)
+                if load_cached_results(queued_key) is None:
+                    keys[queued_path] = queued_key
+
+        batch_results = lint_batch(list(keys))
+        for batch_path, results in batch_results.items():
+            save_cached_results(keys[batch_path], results)
+
+    return batch_results[file_path]
+
 def save_lint_results(file_path, results, session_id):
     """Save linting results to a JSON file."""
     try:
@@ -191,20 +479,20 @@ def main():
             sys.exit(0)
         
         # Run linting tools
-        results = []
+        if DAEMON_MODE:
+            results = lint_file_daemon(file_path)
+        else:
+            results = [check_formatting(file_path), run_ruff(file_path), run_mypy(file_path)]
         has_errors = False
         error_messages = []
+        format_result, ruff_result, mypy_result = results
         
         # Check formatting (not linting)
-        format_result = check_formatting(file_path)
-        results.append(format_result)
         if not format_result['passed'] and 'message' in format_result:
             has_errors = True
             error_messages.append(f"Formatting: {format_result['message']}")
         
-        # Run Ruff (or flake8 as fallback)
-        ruff_result = run_ruff(file_path)
-        results.append(ruff_result)
+        # Ruff (or flake8 as fallback)
         if not ruff_result['passed'] and 'errors' in ruff_result:
             has_errors = True
             if isinstance(ruff_result['errors'], list):
@@ -212,9 +500,7 @@ def main():
             else:
                 error_messages.append(f"{ruff_result['tool']}: Found issues")
         
-        # Run mypy
-        mypy_result = run_mypy(file_path)
-        results.append(mypy_result)
+        # Mypy
         if not mypy_result['passed'] and 'output' in mypy_result:
             has_errors = True
             error_messages.append(f"Mypy: Type checking issues found")
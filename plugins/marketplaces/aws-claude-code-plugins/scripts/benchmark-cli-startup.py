@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# ABOUTME: Measures ccwb CLI startup latency and fails when it exceeds a budget
+# ABOUTME: Guards `ccwb --help` and `ccwb status` against heavy imports creeping back in
+
+"""Benchmark ccwb startup time.
+
+Each case runs the CLI in a fresh interpreter several times and compares the median
+wall time against its budget. `status --help` resolves and loads the status command
+without calling AWS, so it measures the startup cost `ccwb status` pays before its
+first API request.
+
+Usage:
+    poetry run python ../scripts/benchmark-cli-startup.py [--runs N] [--budget-scale X]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SOURCE_DIR = Path(__file__).resolve().parents[1] / "source"
+
+# CLI arguments -> startup budget in milliseconds
+CASES = {
+    ("--help",): 1500,
+    ("status", "--help"): 800,
+}
+
+RUNNER = "import sys; from claude_code_with_bedrock.cli import main; sys.argv = ['ccwb', *sys.argv[1:]]; main()"
+
+
+def run_once(args: tuple[str, ...]) -> float:
+    """Run the CLI once and return its wall time in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", RUNNER, *args],
+        cwd=SOURCE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def slowest_imports(args: tuple[str, ...], limit: int = 10) -> list[tuple[int, str]]:
+    """Get the modules with the highest cumulative import time for a CLI run."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, *args],
+        cwd=SOURCE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            timings.append((int(parts[1]), parts[2].strip()))
+    return sorted(timings, reverse=True)[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case (median is reported)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply all budgets, e.g. for slow CI")
+    options = parser.parse_args()
+
+    failed = False
+    for args, budget_ms in CASES.items():
+        # Warm the filesystem and bytecode caches so runs are comparable
+        run_once(args)
+        median_ms = statistics.median(run_once(args) for _ in range(options.runs))
+        budget = budget_ms * options.budget_scale
+        status = "ok" if median_ms <= budget else "OVER BUDGET"
+        print(f"ccwb {' '.join(args):<16} {median_ms:8.1f} ms  (budget {budget:.0f} ms)  {status}")
+
+        if median_ms > budget:
+            failed = True
+            print("  Slowest imports (cumulative):")
+            for cumulative_us, module in slowest_imports(args):
+                print(f"    {cumulative_us / 1000:8.1f} ms  {module}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# ABOUTME: Measures secret-scanning throughput of the security plugin's security_check hook
+# ABOUTME: Fails when scanning a large synthetic file exceeds the hook's latency budget
+
+"""Benchmark security_check.scan_for_secrets.
+
+Builds synthetic repositories of source files (code-like lines with a sprinkling
+of real-looking and placeholder secrets) and reports scan throughput in MB/s for
+the hook's precompiled rules and for the previous case-insensitive scan that
+compiled each pattern on every call. The run fails if the large single file
+takes longer than the budget.
+
+Usage:
+    python scripts/benchmark-security-check.py [--repo-mb 20] [--file-kb 64] [--large-mb 10] [--budget-ms 500]
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).resolve().parents[1] / "assets" / "claude-code-plugins" / "plugins" / "security" / "hooks"
+sys.path.insert(0, str(HOOKS_DIR))
+
+import security_check  # noqa: E402
+
+SECRET_LINES = [
+    'api_key = "{}"',
+    'PASSWORD: "{}"',
+    "headers['Authorization'] = 'Bearer {}'",
+    'aws_access_key_id = "AKIA{}"',
+    'token = "ghp_{}"',
+]
+PLACEHOLDER_LINES = [
+    'api_key = "your_key_goes_here_replace_me"',
+    'password = "********"',
+    'secret_key = "example-secret-key-for-docs"',
+]
+
+
+LEGACY_PATTERNS = [
+    r'api[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']',
+    r'secret[_-]?key\s*[:=]\s*["\']([^"\']{20,})["\']',
+    r'access[_-]?token\s*[:=]\s*["\']([^"\']{20,})["\']',
+    r'password\s*[:=]\s*["\']([^"\']{8,})["\']',
+    r'private[_-]?key\s*[:=]\s*["\']([^"\']+)["\']',
+    r'bearer\s+([a-zA-Z0-9\-_\.]+)',
+    r'sk-[a-zA-Z0-9]{48}',
+    r'xoxb-[a-zA-Z0-9\-]+',
+    r'ghp_[a-zA-Z0-9]{36}',
+    r'AKIA[0-9A-Z]{16}',
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+]
+
+
+def scan_legacy(content: str) -> list[str]:
+    """The previous scan: one case-insensitive finditer pass per pattern."""
+    secrets_found = []
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, content, re.IGNORECASE):
+            matched_text = match.group(0).lower()
+            if any(placeholder in matched_text for placeholder in security_check.PLACEHOLDERS):
+                continue
+            secrets_found.append(match.group(0)[:50])
+    return secrets_found
+
+
+def random_token(rng: random.Random, length: int) -> str:
+    return "".join(rng.choices(string.ascii_letters + string.digits, k=length))
+
+
+def generate_file(rng: random.Random, size_bytes: int) -> str:
+    """Generate one source file of about size_bytes."""
+    words = ["request", "response", "handler", "config", "value", "items", "result", "client", "index", "user"]
+    lines = []
+    total = 0
+    while total < size_bytes:
+        roll = rng.random()
+        if roll < 0.001:
+            line = rng.choice(SECRET_LINES).format(random_token(rng, 32).upper())
+        elif roll < 0.003:
+            line = rng.choice(PLACEHOLDER_LINES)
+        else:
+            line = f"    {rng.choice(words)}_{rng.randint(0, 99)} = {rng.choice(words)}.get('{rng.choice(words)}')"
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def throughput(scan, files: list[str]) -> tuple[float, float]:
+    """Scan every file once; return (MB/s, slowest file in ms)."""
+    total_bytes = sum(len(content) for content in files)
+    slowest = 0.0
+    start = time.perf_counter()
+    for content in files:
+        file_start = time.perf_counter()
+        scan(content)
+        slowest = max(slowest, time.perf_counter() - file_start)
+    elapsed = time.perf_counter() - start
+    return total_bytes / elapsed / (1024 * 1024), slowest * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo-mb", type=float, default=20, help="Total size of the synthetic repo")
+    parser.add_argument("--file-kb", type=float, default=64, help="Typical file size in the repo")
+    parser.add_argument("--large-mb", type=float, default=10, help="Size of the single large file")
+    parser.add_argument("--budget-ms", type=float, default=500, help="Latency budget for the large file")
+    options = parser.parse_args()
+
+    rng = random.Random(0)
+    file_bytes = int(options.file_kb * 1024)
+    repo = [generate_file(rng, file_bytes) for _ in range(int(options.repo_mb * 1024 / options.file_kb))]
+    large = [generate_file(rng, int(options.large_mb * 1024 * 1024))]
+
+    def scan(content):
+        return security_check.scan_for_secrets(content, "bench.py")
+
+    print(f"{'corpus':<28} {'previous':>12} {'current':>12}  {'findings'}")
+    for label, files in ((f"repo {options.repo_mb:g} MB", repo), (f"single file {options.large_mb:g} MB", large)):
+        old_rate, _ = throughput(scan_legacy, files)
+        new_rate, slowest_ms = throughput(scan, files)
+        findings = sum(len(scan(content)) for content in files)
+        print(f"{label:<28} {old_rate:>7.1f} MB/s {new_rate:>7.1f} MB/s  {findings}")
+
+    status = "ok" if slowest_ms <= options.budget_ms else "OVER BUDGET"
+    print(f"\nLarge file scan: {slowest_ms:.0f} ms (budget {options.budget_ms:.0f} ms)  {status}")
+    return 0 if slowest_ms <= options.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
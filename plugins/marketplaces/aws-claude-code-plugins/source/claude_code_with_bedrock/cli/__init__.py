@@ -3,36 +3,46 @@
 
 """Command-line interface for Claude Code with Bedrock."""
 
+import importlib
+
 from cleo.application import Application
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
+
+# Command name -> (module under .commands, class name)
+# Modules are imported only when their command is run or listed, so `ccwb status`
+# does not pay for the imports of every other command.
+COMMANDS = {
+    "init": ("init", "InitCommand"),
+    "deploy": ("deploy", "DeployCommand"),
+    "status": ("status", "StatusCommand"),
+    "test": ("test", "TestCommand"),
+    "package": ("package", "PackageCommand"),
+    "builds": ("builds", "BuildsCommand"),
+    "distribute": ("distribute", "DistributeCommand"),
+    "destroy": ("destroy", "DestroyCommand"),
+    "cleanup": ("cleanup", "CleanupCommand"),
+    # "token": ("token", "TokenCommand"),  # Temporarily disabled - not implemented
+}
+
+
+def _command_factory(module_name: str, class_name: str):
+    """Create a factory that imports and instantiates a command on first use."""
 
-from .commands.builds import BuildsCommand
-from .commands.cleanup import CleanupCommand
-from .commands.deploy import DeployCommand
-from .commands.destroy import DestroyCommand
-from .commands.distribute import DistributeCommand
-from .commands.init import InitCommand
-from .commands.package import PackageCommand
-from .commands.status import StatusCommand
-from .commands.test import TestCommand
+    def factory():
+        module = importlib.import_module(f"{__name__}.commands.{module_name}")
+        return getattr(module, class_name)()
 
-# TokenCommand temporarily disabled - not implemented
+    return factory
 
 
 def create_application() -> Application:
     """Create the CLI application."""
     application = Application("claude-code-with-bedrock", "1.0.0")
 
-    # Add commands
-    application.add(InitCommand())
-    application.add(DeployCommand())
-    application.add(StatusCommand())
-    application.add(TestCommand())
-    application.add(PackageCommand())
-    application.add(BuildsCommand())
-    application.add(DistributeCommand())
-    application.add(DestroyCommand())
-    application.add(CleanupCommand())
-    # application.add(TokenCommand())  # Temporarily disabled
+    # Register commands lazily
+    application.set_command_loader(
+        FactoryCommandLoader({name: _command_factory(*target) for name, target in COMMANDS.items()})
+    )
 
     return application
 
@@ -3,13 +3,19 @@
 
 """CLI commands for Claude Code with Bedrock."""
 
-from .builds import BuildsCommand
-from .deploy import DeployCommand
-from .destroy import DestroyCommand
-from .init import InitCommand
-from .package import PackageCommand
-from .status import StatusCommand
-from .test import TestCommand
+import importlib
+
+# Command classes are resolved on first attribute access so that importing a single
+# command module does not import all of them.
+_COMMAND_MODULES = {
+    "InitCommand": "init",
+    "DeployCommand": "deploy",
+    "StatusCommand": "status",
+    "TestCommand": "test",
+    "PackageCommand": "package",
+    "BuildsCommand": "builds",
+    "DestroyCommand": "destroy",
+}
 
 __all__ = [
     "InitCommand",
@@ -20,3 +26,10 @@ __all__ = [
     "BuildsCommand",
     "DestroyCommand",
 ]
+
+
+def __getattr__(name: str):
+    if name in _COMMAND_MODULES:
+        module = importlib.import_module(f"{__name__}.{_COMMAND_MODULES[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,6 @@
 
 from datetime import datetime
 
-import boto3
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich.console import Console
@@ -31,6 +30,8 @@ class BuildsCommand(Command):
 
     def handle(self) -> int:
         """Execute the builds command."""
+        import boto3
+
         console = Console()
 
         # Check if this is a status check for a specific build
@@ -132,6 +133,8 @@ class BuildsCommand(Command):
         import json
         from pathlib import Path
 
+        import boto3
+
         try:
             # If no build ID provided or it's "latest", check for latest
             if not build_id or build_id == "latest":
@@ -253,6 +256,7 @@ class BuildsCommand(Command):
         """Download Windows build artifacts from S3."""
         import zipfile
 
+        import boto3
         from botocore.exceptions import ClientError
 
         try:
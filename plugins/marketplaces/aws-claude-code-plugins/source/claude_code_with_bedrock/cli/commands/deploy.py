@@ -4,7 +4,9 @@
 """Deploy command - Deploy AWS infrastructure using boto3."""
 
 import os
+import subprocess
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from cleo.commands.command import Command
@@ -24,6 +26,22 @@ from claude_code_with_bedrock.cli.utils.cf_exceptions import (
 from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.config import Config
 
+# Stack types each stack waits for when both are part of the same deployment.
+# A dependency is either a stack whose outputs are read as parameters (networking
+# for the collector and artifacts bucket, dashboard for the metrics table) or one
+# that creates resources the stack attaches to (the collector's metrics log group
+# for analytics). Everything else only needs the auth stack to exist.
+STACK_DEPENDENCIES = {
+    "auth": [],
+    "distribution": ["auth"],
+    "networking": ["auth"],
+    "monitoring": ["networking"],
+    "dashboard": ["networking"],
+    "analytics": ["monitoring"],
+    "quota": ["networking", "dashboard"],
+    "codebuild": ["auth"],
+}
+
 
 class DeployCommand(Command):
     name = "deploy"
@@ -187,16 +205,7 @@ class DeployCommand(Command):
         # Deploy stacks
         console.print("\n[bold]Deploying stacks...[/bold]\n")
 
-        failed = False
-        for stack_type, description in stacks_to_deploy:
-            console.print(f"[bold]{description}[/bold]")
-
-            result = self._deploy_stack(stack_type, profile, console, cf_manager)
-            if result != 0:
-                failed = True
-                console.print(f"[red]Failed to deploy {stack_type} stack[/red]")
-                break
-            console.print("")
+        failed = not self._deploy_stacks(stacks_to_deploy, profile, console, cf_manager)
 
         if failed:
             console.print("\n[red]Deployment failed. Check the errors above.[/red]")
@@ -210,6 +219,71 @@ class DeployCommand(Command):
 
         return 0
 
+    def _deploy_stacks(
+        self, stacks_to_deploy: list, profile, console: Console, cf_manager: CloudFormationManager
+    ) -> bool:
+        """Deploy stacks concurrently, starting each one as soon as its dependencies succeed.
+
+        Returns:
+            True if every stack deployed successfully
+        """
+        descriptions = dict(stacks_to_deploy)
+        waiting_on = {
+            stack_type: {dep for dep in STACK_DEPENDENCIES.get(stack_type, []) if dep in descriptions}
+            for stack_type in descriptions
+        }
+        stack_outputs: dict[str, dict[str, str]] = {}
+        failed = []
+
+        # Create the CloudFormation client up front so worker threads share it
+        _ = cf_manager.cf_client
+
+        with (
+            Progress(
+                SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+            ) as progress,
+            ThreadPoolExecutor(max_workers=len(descriptions)) as executor,
+        ):
+            running = {}
+
+            def start_ready_stacks():
+                # Preserve the plan order among stacks that become ready together
+                for stack_type in [t for t, deps in waiting_on.items() if not deps]:
+                    del waiting_on[stack_type]
+                    console.print(f"[bold]{descriptions[stack_type]}[/bold]")
+                    future = executor.submit(
+                        self._deploy_stack, stack_type, profile, console, cf_manager, progress, stack_outputs
+                    )
+                    running[future] = stack_type
+
+            start_ready_stacks()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stack_type = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        console.print(f"[red]Unexpected error: {str(e)}[/red]")
+                        result = 1
+
+                    if result != 0:
+                        failed.append(stack_type)
+                        console.print(f"[red]Failed to deploy {stack_type} stack[/red]")
+                        continue
+
+                    for deps in waiting_on.values():
+                        deps.discard(stack_type)
+
+                # Stop scheduling new work after a failure; in-flight stacks are left to finish
+                if not failed:
+                    start_ready_stacks()
+
+        for stack_type in waiting_on:
+            console.print(f"[yellow]Skipped {stack_type} stack[/yellow]")
+
+        return not failed
+
     def _convert_params_to_boto3(self, params: list) -> list:
         """Convert CLI parameter format to boto3 format.
 
@@ -223,395 +297,393 @@ class DeployCommand(Command):
                 result.append({"ParameterKey": key, "ParameterValue": value})
         return result
 
-    def _deploy_stack(self, stack_type: str, profile, console: Console, cf_manager: CloudFormationManager) -> int:
-        """Deploy a CloudFormation stack using boto3."""
+    def _deploy_stack(
+        self,
+        stack_type: str,
+        profile,
+        console: Console,
+        cf_manager: CloudFormationManager,
+        progress: Progress,
+        stack_outputs: dict[str, dict[str, str]],
+    ) -> int:
+        """Deploy a CloudFormation stack using boto3.
+
+        Outputs of successfully deployed stacks are recorded in ``stack_outputs`` so that
+        dependent stacks deployed later in the same run can read them without another lookup.
+        """
         project_root = Path(__file__).parents[4]
 
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            # Common deployment function
-            def deploy_with_cf(
-                template_path, stack_name, params, capabilities=None, task_description="Deploying stack..."
-            ):
-                """Helper function to deploy a stack with CloudFormation manager."""
-                task = progress.add_task(task_description, total=None)
-
-                try:
-                    # Convert parameters to boto3 format
-                    boto3_params = self._convert_params_to_boto3(params) if params else None
-
-                    # Deploy stack
-                    result = cf_manager.deploy_stack(
-                        stack_name=stack_name,
-                        template_path=template_path,
-                        parameters=boto3_params,
-                        capabilities=capabilities or ["CAPABILITY_IAM"],
-                        on_event=lambda e: progress.update(
-                            task,
-                            description=f"{e.get('LogicalResourceId', 'Stack')} - {e.get('ResourceStatus', '')}"
-                            if isinstance(e, dict)
-                            else str(e),
-                        ),
-                    )
+        def dependency_outputs(dependency_type: str, stack_name: str) -> dict[str, str]:
+            """Get outputs of a dependency, preferring those captured during this run."""
+            if dependency_type in stack_outputs:
+                return stack_outputs[dependency_type]
+            return cf_manager.get_stack_outputs(stack_name)
 
-                    progress.update(task, completed=True)
+        # Common deployment function
+        def deploy_with_cf(template_path, stack_name, params, capabilities=None, task_description="Deploying stack..."):
+            """Helper function to deploy a stack with CloudFormation manager."""
+            task = progress.add_task(task_description, total=None)
 
-                    if result.success:
-                        console.print(f"[green]✓ {stack_type} stack deployed successfully[/green]")
-                        return 0
-                    else:
-                        console.print(f"[red]✗ Failed to deploy {stack_type} stack: {result.error}[/red]")
-                        return 1
+            try:
+                # Convert parameters to boto3 format
+                boto3_params = self._convert_params_to_boto3(params) if params else None
+
+                # Deploy stack
+                result = cf_manager.deploy_stack(
+                    stack_name=stack_name,
+                    template_path=template_path,
+                    parameters=boto3_params,
+                    capabilities=capabilities or ["CAPABILITY_IAM"],
+                    on_event=lambda e: progress.update(
+                        task,
+                        description=f"{e.get('LogicalResourceId', 'Stack')} - {e.get('ResourceStatus', '')}"
+                        if isinstance(e, dict)
+                        else str(e),
+                    ),
+                )
 
-                except ResourceConflictError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[yellow]Resource conflict: {e.message}[/yellow]")
-                    if e.get_cleanup_command():
-                        console.print(f"Run: [cyan]{e.get_cleanup_command()}[/cyan]")
-                    return 1
+                progress.update(task, completed=True)
 
-                except StackRollbackError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[yellow]Stack rollback: {e.message}[/yellow]")
-                    console.print(f"Recovery: {e.recovery_action}")
+                if result.success:
+                    stack_outputs[stack_type] = result.outputs
+                    console.print(f"[green]✓ {stack_type} stack deployed successfully[/green]")
+                    return 0
+                else:
+                    console.print(f"[red]✗ Failed to deploy {stack_type} stack: {result.error}[/red]")
                     return 1
 
-                except CloudFormationError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[red]CloudFormation error: {e.message}[/red]")
-                    return 1
+            except ResourceConflictError as e:
+                progress.update(task, completed=True)
+                console.print(f"[yellow]Resource conflict: {e.message}[/yellow]")
+                if e.get_cleanup_command():
+                    console.print(f"Run: [cyan]{e.get_cleanup_command()}[/cyan]")
+                return 1
 
-                except Exception as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[red]Unexpected error: {str(e)}[/red]")
-                    return 1
+            except StackRollbackError as e:
+                progress.update(task, completed=True)
+                console.print(f"[yellow]Stack rollback: {e.message}[/yellow]")
+                console.print(f"Recovery: {e.recovery_action}")
+                return 1
 
-            # Deploy based on stack type
-            if stack_type == "auth":
-                # Select template based on provider type
-                provider_type = profile.provider_type or "okta"
-                template_map = {
-                    "okta": "bedrock-auth-okta.yaml",
-                    "auth0": "bedrock-auth-auth0.yaml",
-                    "azure": "bedrock-auth-azure.yaml",
-                    "cognito": "bedrock-auth-cognito-pool.yaml",
-                }
-
-                template_file = template_map.get(provider_type, "bedrock-auth-okta.yaml")
-                template = project_root / "deployment" / "infrastructure" / template_file
-
-                # Verify template exists
-                if not template.exists():
-                    console.print(f"[red]Error: Template not found: {template_file}[/red]")
-                    console.print(f"[yellow]Supported provider types: {', '.join(template_map.keys())}[/yellow]")
-                    return 1
+            except CloudFormationError as e:
+                progress.update(task, completed=True)
+                console.print(f"[red]CloudFormation error: {e.message}[/red]")
+                return 1
 
-                stack_name = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
+            except Exception as e:
+                progress.update(task, completed=True)
+                console.print(f"[red]Unexpected error: {str(e)}[/red]")
+                return 1
 
-                # Build parameters
-                params = []
-                params.append(f"FederationType={profile.federation_type}")
+        # Deploy based on stack type
+        if stack_type == "auth":
+            # Select template based on provider type
+            provider_type = profile.provider_type or "okta"
+            template_map = {
+                "okta": "bedrock-auth-okta.yaml",
+                "auth0": "bedrock-auth-auth0.yaml",
+                "azure": "bedrock-auth-azure.yaml",
+                "cognito": "bedrock-auth-cognito-pool.yaml",
+            }
+
+            template_file = template_map.get(provider_type, "bedrock-auth-okta.yaml")
+            template = project_root / "deployment" / "infrastructure" / template_file
+
+            # Verify template exists
+            if not template.exists():
+                console.print(f"[red]Error: Template not found: {template_file}[/red]")
+                console.print(f"[yellow]Supported provider types: {', '.join(template_map.keys())}[/yellow]")
+                return 1
 
-                if provider_type == "okta":
-                    params.extend(
-                        [
-                            f"OktaDomain={profile.provider_domain}",
-                            f"OktaClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "auth0":
-                    params.extend(
-                        [
-                            f"Auth0Domain={profile.provider_domain}",
-                            f"Auth0ClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "azure":
-                    # Azure uses tenant ID instead of domain
-                    tenant_id = profile.provider_domain
-                    if "/" in tenant_id:
-                        # Extract tenant ID from full Azure domain if needed
-                        tenant_id = tenant_id.split("/")[0]
-                    params.extend(
-                        [
-                            f"AzureTenantId={tenant_id}",
-                            f"AzureClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "cognito":
-                    # Extract domain prefix from full domain (e.g., "us-east-1p8mdr8zxe" from "us-east-1p8mdr8zxe.auth.us-east-1.amazoncognito.com")
-                    cognito_domain = (
-                        profile.provider_domain.split(".")[0]
-                        if "." in profile.provider_domain
-                        else profile.provider_domain
-                    )
-                    params.extend(
-                        [
-                            f"CognitoUserPoolId={profile.cognito_user_pool_id}",
-                            f"CognitoUserPoolClientId={profile.client_id}",
-                            f"CognitoUserPoolDomain={cognito_domain}",
-                        ]
-                    )
+            stack_name = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
 
+            # Build parameters
+            params = []
+            params.append(f"FederationType={profile.federation_type}")
+
+            if provider_type == "okta":
                 params.extend(
                     [
-                        f"IdentityPoolName={profile.identity_pool_name}",
-                        f"AllowedBedrockRegions={','.join(profile.allowed_bedrock_regions)}",
-                        f"EnableMonitoring={str(profile.monitoring_enabled).lower()}",
+                        f"OktaDomain={profile.provider_domain}",
+                        f"OktaClientId={profile.client_id}",
                     ]
                 )
-
-                return deploy_with_cf(
-                    template,
-                    stack_name,
-                    params,
-                    ["CAPABILITY_NAMED_IAM"],
-                    task_description="Deploying authentication stack...",
+            elif provider_type == "auth0":
+                params.extend(
+                    [
+                        f"Auth0Domain={profile.provider_domain}",
+                        f"Auth0ClientId={profile.client_id}",
+                    ]
                 )
-
-            elif stack_type == "distribution":
-                template = project_root / "deployment" / "infrastructure" / "distribution.yaml"
-                stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
-                params = [f"IdentityPoolName={profile.identity_pool_name}"]
-                return deploy_with_cf(
-                    template,
-                    stack_name,
-                    params,
-                    ["CAPABILITY_NAMED_IAM"],
-                    task_description="Deploying distribution stack...",
+            elif provider_type == "azure":
+                # Azure uses tenant ID instead of domain
+                tenant_id = profile.provider_domain
+                if "/" in tenant_id:
+                    # Extract tenant ID from full Azure domain if needed
+                    tenant_id = tenant_id.split("/")[0]
+                params.extend(
+                    [
+                        f"AzureTenantId={tenant_id}",
+                        f"AzureClientId={profile.client_id}",
+                    ]
                 )
-
-            elif stack_type == "networking":
-                template = project_root / "deployment" / "infrastructure" / "networking.yaml"
-                stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
-                vpc_config = profile.monitoring_config or {}
-                params = [
-                    f"VpcCidr={vpc_config.get('vpc_cidr', '10.0.0.0/16')}",
-                    f"PublicSubnet1Cidr={vpc_config.get('subnet1_cidr', '10.0.1.0/24')}",
-                    f"PublicSubnet2Cidr={vpc_config.get('subnet2_cidr', '10.0.2.0/24')}",
-                ]
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying networking infrastructure..."
+            elif provider_type == "cognito":
+                # Extract domain prefix from full domain (e.g., "us-east-1p8mdr8zxe" from "us-east-1p8mdr8zxe.auth.us-east-1.amazoncognito.com")
+                cognito_domain = (
+                    profile.provider_domain.split(".")[0] if "." in profile.provider_domain else profile.provider_domain
                 )
-
-            elif stack_type == "monitoring":
-                template = project_root / "deployment" / "infrastructure" / "otel-collector.yaml"
-                stack_name = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
-
-                # Get VPC outputs from networking stack
-                networking_stack_name = profile.stack_names.get(
-                    "networking", f"{profile.identity_pool_name}-networking"
+                params.extend(
+                    [
+                        f"CognitoUserPoolId={profile.cognito_user_pool_id}",
+                        f"CognitoUserPoolClientId={profile.client_id}",
+                        f"CognitoUserPoolDomain={cognito_domain}",
+                    ]
                 )
-                networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
-
-                params = []
-                if networking_outputs:
-                    vpc_id = networking_outputs.get("VpcId", "")
-                    subnet_ids = networking_outputs.get("SubnetIds", "")
-                    if vpc_id:
-                        params.append(f"VpcId={vpc_id}")
-                    if subnet_ids:
-                        params.append(f"SubnetIds={subnet_ids}")
-
-                # Add HTTPS domain parameters if configured
-                monitoring_config = getattr(profile, "monitoring_config", {})
-                if monitoring_config.get("custom_domain"):
-                    params.append(f"CustomDomainName={monitoring_config['custom_domain']}")
-                    params.append(f"HostedZoneId={monitoring_config['hosted_zone_id']}")
 
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying monitoring collector..."
-                )
+            params.extend(
+                [
+                    f"IdentityPoolName={profile.identity_pool_name}",
+                    f"AllowedBedrockRegions={','.join(profile.allowed_bedrock_regions)}",
+                    f"EnableMonitoring={str(profile.monitoring_enabled).lower()}",
+                ]
+            )
 
-            elif stack_type == "dashboard":
-                template = project_root / "deployment" / "infrastructure" / "claude-code-dashboard.yaml"
-                stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
+            return deploy_with_cf(
+                template,
+                stack_name,
+                params,
+                ["CAPABILITY_NAMED_IAM"],
+                task_description="Deploying authentication stack...",
+            )
 
-                # Get S3 bucket from networking stack for packaging
-                networking_stack_name = profile.stack_names.get(
-                    "networking", f"{profile.identity_pool_name}-networking"
-                )
-                networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
+        elif stack_type == "distribution":
+            template = project_root / "deployment" / "infrastructure" / "distribution.yaml"
+            stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
+            params = [f"IdentityPoolName={profile.identity_pool_name}"]
+            return deploy_with_cf(
+                template,
+                stack_name,
+                params,
+                ["CAPABILITY_NAMED_IAM"],
+                task_description="Deploying distribution stack...",
+            )
 
-                if not networking_outputs or not networking_outputs.get("CfnArtifactsBucket"):
-                    console.print("[red]Error: S3 bucket for packaging not found[/red]")
-                    console.print(
-                        "[yellow]The networking stack must be deployed first with the artifacts bucket.[/yellow]"
-                    )
-                    console.print("Run: [cyan]ccwb deploy networking[/cyan]")
-                    return 1
+        elif stack_type == "networking":
+            template = project_root / "deployment" / "infrastructure" / "networking.yaml"
+            stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
+            vpc_config = profile.monitoring_config or {}
+            params = [
+                f"VpcCidr={vpc_config.get('vpc_cidr', '10.0.0.0/16')}",
+                f"PublicSubnet1Cidr={vpc_config.get('subnet1_cidr', '10.0.1.0/24')}",
+                f"PublicSubnet2Cidr={vpc_config.get('subnet2_cidr', '10.0.2.0/24')}",
+            ]
+            return deploy_with_cf(
+                template, stack_name, params, task_description="Deploying networking infrastructure..."
+            )
 
-                s3_bucket = networking_outputs["CfnArtifactsBucket"]
-
-                # Package the template using AWS CLI (simple and reliable!)
-                task = progress.add_task("Packaging dashboard Lambda functions...", total=None)
-
-                try:
-                    import subprocess
-
-                    # Create temp file for packaged template
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                        packaged_template_path = f.name
-
-                    # Run AWS CLI package command
-                    cmd = [
-                        "aws",
-                        "cloudformation",
-                        "package",
-                        "--template-file",
-                        str(template),
-                        "--s3-bucket",
-                        s3_bucket,
-                        "--s3-prefix",
-                        "claude-code/dashboard",
-                        "--output-template-file",
-                        packaged_template_path,
-                        "--region",
-                        profile.aws_region,
-                    ]
+        elif stack_type == "monitoring":
+            template = project_root / "deployment" / "infrastructure" / "otel-collector.yaml"
+            stack_name = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
 
-                    result = subprocess.run(cmd, capture_output=True, text=True)
+            # Get VPC outputs from networking stack
+            networking_stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
+            networking_outputs = dependency_outputs("networking", networking_stack_name)
 
-                    if result.returncode != 0:
-                        console.print(f"[red]Failed to package template: {result.stderr}[/red]")
-                        return 1
+            params = []
+            if networking_outputs:
+                vpc_id = networking_outputs.get("VpcId", "")
+                subnet_ids = networking_outputs.get("SubnetIds", "")
+                if vpc_id:
+                    params.append(f"VpcId={vpc_id}")
+                if subnet_ids:
+                    params.append(f"SubnetIds={subnet_ids}")
+
+            # Add HTTPS domain parameters if configured
+            monitoring_config = getattr(profile, "monitoring_config", {})
+            if monitoring_config.get("custom_domain"):
+                params.append(f"CustomDomainName={monitoring_config['custom_domain']}")
+                params.append(f"HostedZoneId={monitoring_config['hosted_zone_id']}")
+
+            return deploy_with_cf(template, stack_name, params, task_description="Deploying monitoring collector...")
+
+        elif stack_type == "dashboard":
+            template = project_root / "deployment" / "infrastructure" / "claude-code-dashboard.yaml"
+            stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
+
+            # Get S3 bucket from networking stack for packaging
+            networking_stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
+            networking_outputs = dependency_outputs("networking", networking_stack_name)
+
+            if not networking_outputs or not networking_outputs.get("CfnArtifactsBucket"):
+                console.print("[red]Error: S3 bucket for packaging not found[/red]")
+                console.print("[yellow]The networking stack must be deployed first with the artifacts bucket.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy networking[/cyan]")
+                return 1
 
-                    progress.update(
-                        task, description="Dashboard Lambda functions packaged successfully", completed=True
-                    )
+            s3_bucket = networking_outputs["CfnArtifactsBucket"]
 
-                    # Deploy the packaged template
-                    return deploy_with_cf(
-                        packaged_template_path, stack_name, [], task_description="Deploying monitoring dashboard..."
-                    )
+            # Package the template using AWS CLI (simple and reliable!)
+            task = progress.add_task("Packaging dashboard Lambda functions...", total=None)
 
-                finally:
-                    # Clean up temp file
-                    if "packaged_template_path" in locals():
-                        try:
-                            os.unlink(packaged_template_path)
-                        except:
-                            pass
-
-            elif stack_type == "analytics":
-                template = project_root / "deployment" / "infrastructure" / "analytics-pipeline.yaml"
-                stack_name = profile.stack_names.get("analytics", f"{profile.identity_pool_name}-analytics")
-                params = [
-                    f"MetricsLogGroup={profile.metrics_log_group}",
-                    f"DataRetentionDays={profile.data_retention_days}",
-                    f"FirehoseBufferInterval={profile.firehose_buffer_interval}",
-                    f"DebugMode={str(profile.analytics_debug_mode).lower()}",
+            try:
+                # Create temp file for packaged template
+                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+                    packaged_template_path = f.name
+
+                # Run AWS CLI package command
+                cmd = [
+                    "aws",
+                    "cloudformation",
+                    "package",
+                    "--template-file",
+                    str(template),
+                    "--s3-bucket",
+                    s3_bucket,
+                    "--s3-prefix",
+                    "claude-code/dashboard",
+                    "--output-template-file",
+                    packaged_template_path,
+                    "--region",
+                    profile.aws_region,
                 ]
-                return deploy_with_cf(template, stack_name, params, task_description="Deploying analytics pipeline...")
 
-            elif stack_type == "quota":
-                template = project_root / "deployment" / "infrastructure" / "quota-monitoring.yaml"
-                stack_name = profile.stack_names.get("quota", f"{profile.identity_pool_name}-quota")
+                result = subprocess.run(cmd, capture_output=True, text=True)
 
-                # Get MetricsTable ARN from dashboard stack outputs
-                dashboard_stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-                dashboard_outputs = get_stack_outputs(dashboard_stack_name, profile.aws_region)
-
-                if not dashboard_outputs or not dashboard_outputs.get("MetricsTableArn"):
-                    console.print(
-                        f"[red]Could not get MetricsTable ARN from dashboard stack {dashboard_stack_name}[/red]"
-                    )
-                    console.print("[yellow]The dashboard stack must be deployed first.[/yellow]")
-                    console.print("Run: [cyan]ccwb deploy dashboard[/cyan]")
+                if result.returncode != 0:
+                    console.print(f"[red]Failed to package template: {result.stderr}[/red]")
                     return 1
 
-                # Get S3 bucket from networking stack for packaging
-                networking_stack = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
-                networking_outputs = get_stack_outputs(networking_stack, profile.aws_region)
+                progress.update(task, description="Dashboard Lambda functions packaged successfully", completed=True)
 
-                if not networking_outputs or not networking_outputs.get("CfnArtifactsBucket"):
-                    console.print(f"[red]Could not get S3 bucket from networking stack {networking_stack}[/red]")
-                    console.print("[yellow]The networking stack must be deployed first.[/yellow]")
-                    console.print("Run: [cyan]ccwb deploy networking[/cyan]")
-                    return 1
+                # Deploy the packaged template
+                return deploy_with_cf(
+                    packaged_template_path, stack_name, [], task_description="Deploying monitoring dashboard..."
+                )
 
-                s3_bucket = networking_outputs["CfnArtifactsBucket"]
+            finally:
+                # Clean up temp file
+                if "packaged_template_path" in locals():
+                    try:
+                        os.unlink(packaged_template_path)
+                    except:
+                        pass
+
+        elif stack_type == "analytics":
+            template = project_root / "deployment" / "infrastructure" / "analytics-pipeline.yaml"
+            stack_name = profile.stack_names.get("analytics", f"{profile.identity_pool_name}-analytics")
+            params = [
+                f"MetricsLogGroup={profile.metrics_log_group}",
+                f"DataRetentionDays={profile.data_retention_days}",
+                f"FirehoseBufferInterval={profile.firehose_buffer_interval}",
+                f"DebugMode={str(profile.analytics_debug_mode).lower()}",
+            ]
+            return deploy_with_cf(template, stack_name, params, task_description="Deploying analytics pipeline...")
+
+        elif stack_type == "quota":
+            template = project_root / "deployment" / "infrastructure" / "quota-monitoring.yaml"
+            stack_name = profile.stack_names.get("quota", f"{profile.identity_pool_name}-quota")
+
+            # Get MetricsTable ARN from dashboard stack outputs
+            dashboard_stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
+            dashboard_outputs = dependency_outputs("dashboard", dashboard_stack_name)
+
+            if not dashboard_outputs or not dashboard_outputs.get("MetricsTableArn"):
+                console.print(f"[red]Could not get MetricsTable ARN from dashboard stack {dashboard_stack_name}[/red]")
+                console.print("[yellow]The dashboard stack must be deployed first.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy dashboard[/cyan]")
+                return 1
 
-                # Build parameters
-                monthly_limit = getattr(profile, "monthly_token_limit", 300000000)
-                metrics_aggregator_role = dashboard_outputs.get(
-                    "MetricsAggregatorRoleName", "claude-code-auth-dashboard-MetricsAggregatorRole-*"
-                )
+            # Get S3 bucket from networking stack for packaging
+            networking_stack = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
+            networking_outputs = dependency_outputs("networking", networking_stack)
 
-                params = [
-                    f"MonthlyTokenLimit={monthly_limit}",
-                    f"MetricsTableArn={dashboard_outputs['MetricsTableArn']}",
-                    f"MetricsAggregatorRoleName={metrics_aggregator_role}",
-                    f"WarningThreshold80={int(monthly_limit * 0.8)}",
-                    f"WarningThreshold90={int(monthly_limit * 0.9)}",
-                ]
+            if not networking_outputs or not networking_outputs.get("CfnArtifactsBucket"):
+                console.print(f"[red]Could not get S3 bucket from networking stack {networking_stack}[/red]")
+                console.print("[yellow]The networking stack must be deployed first.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy networking[/cyan]")
+                return 1
 
-                # Package the template using AWS CLI
-                task = progress.add_task("Packaging quota monitoring Lambda functions...", total=None)
-
-                try:
-                    # Create temp file for packaged template
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                        packaged_template_path = f.name
-
-                    # Run AWS CLI package command
-                    cmd = [
-                        "aws",
-                        "cloudformation",
-                        "package",
-                        "--template-file",
-                        str(template),
-                        "--s3-bucket",
-                        s3_bucket,
-                        "--s3-prefix",
-                        "claude-code/quota",
-                        "--output-template-file",
-                        packaged_template_path,
-                        "--region",
-                        profile.aws_region,
-                    ]
+            s3_bucket = networking_outputs["CfnArtifactsBucket"]
 
-                    result_pkg = subprocess.run(cmd, capture_output=True, text=True)
+            # Build parameters
+            monthly_limit = getattr(profile, "monthly_token_limit", 300000000)
+            metrics_aggregator_role = dashboard_outputs.get(
+                "MetricsAggregatorRoleName", "claude-code-auth-dashboard-MetricsAggregatorRole-*"
+            )
 
-                    if result_pkg.returncode != 0:
-                        console.print(f"[red]Failed to package template: {result_pkg.stderr}[/red]")
-                        return 1
+            params = [
+                f"MonthlyTokenLimit={monthly_limit}",
+                f"MetricsTableArn={dashboard_outputs['MetricsTableArn']}",
+                f"MetricsAggregatorRoleName={metrics_aggregator_role}",
+                f"WarningThreshold80={int(monthly_limit * 0.8)}",
+                f"WarningThreshold90={int(monthly_limit * 0.9)}",
+            ]
 
-                    progress.update(
-                        task, description="Quota monitoring Lambda functions packaged successfully", completed=True
-                    )
+            # Package the template using AWS CLI
+            task = progress.add_task("Packaging quota monitoring Lambda functions...", total=None)
 
-                    # Deploy the packaged template
-                    result = deploy_with_cf(
-                        packaged_template_path, stack_name, params, task_description="Deploying quota monitoring..."
-                    )
+            try:
+                # Create temp file for packaged template
+                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+                    packaged_template_path = f.name
+
+                # Run AWS CLI package command
+                cmd = [
+                    "aws",
+                    "cloudformation",
+                    "package",
+                    "--template-file",
+                    str(template),
+                    "--s3-bucket",
+                    s3_bucket,
+                    "--s3-prefix",
+                    "claude-code/quota",
+                    "--output-template-file",
+                    packaged_template_path,
+                    "--region",
+                    profile.aws_region,
+                ]
 
-                    # Update metrics aggregator Lambda environment if successful
-                    if result == 0:
-                        self._update_metrics_aggregator_env(profile, stack_name, console)
+                result_pkg = subprocess.run(cmd, capture_output=True, text=True)
 
-                    return result
+                if result_pkg.returncode != 0:
+                    console.print(f"[red]Failed to package template: {result_pkg.stderr}[/red]")
+                    return 1
 
-                finally:
-                    # Clean up temp file
-                    if "packaged_template_path" in locals():
-                        try:
-                            os.unlink(packaged_template_path)
-                        except:
-                            pass
+                progress.update(
+                    task, description="Quota monitoring Lambda functions packaged successfully", completed=True
+                )
 
-            elif stack_type == "codebuild":
-                template = project_root / "deployment" / "infrastructure" / "codebuild-windows.yaml"
-                stack_name = profile.stack_names.get("codebuild", f"{profile.identity_pool_name}-codebuild")
-                params = [f"ProjectNamePrefix={profile.identity_pool_name}"]
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying CodeBuild for Windows builds..."
+                # Deploy the packaged template
+                result = deploy_with_cf(
+                    packaged_template_path, stack_name, params, task_description="Deploying quota monitoring..."
                 )
 
-            else:
-                console.print(f"[red]Unknown stack type: {stack_type}[/red]")
-                return 1
+                # Update metrics aggregator Lambda environment if successful
+                if result == 0:
+                    self._update_metrics_aggregator_env(profile, stack_outputs.get("quota", {}), console)
+
+                return result
+
+            finally:
+                # Clean up temp file
+                if "packaged_template_path" in locals():
+                    try:
+                        os.unlink(packaged_template_path)
+                    except:
+                        pass
+
+        elif stack_type == "codebuild":
+            template = project_root / "deployment" / "infrastructure" / "codebuild-windows.yaml"
+            stack_name = profile.stack_names.get("codebuild", f"{profile.identity_pool_name}-codebuild")
+            params = [f"ProjectNamePrefix={profile.identity_pool_name}"]
+            return deploy_with_cf(
+                template, stack_name, params, task_description="Deploying CodeBuild for Windows builds..."
+            )
+
+        else:
+            console.print(f"[red]Unknown stack type: {stack_type}[/red]")
+            return 1
 
     def _show_all_deployment_commands(self, stacks_to_deploy, profile, console):
         """Show AWS CLI commands that would be executed."""
@@ -674,13 +746,12 @@ class DeployCommand(Command):
                 if dashboard_url:
                     console.print(f"• Dashboard URL: [cyan][link={dashboard_url}]{dashboard_url}[/link][/cyan]")
 
-    def _update_metrics_aggregator_env(self, profile, quota_stack_name: str, console: Console) -> None:
+    def _update_metrics_aggregator_env(self, profile, quota_outputs: dict[str, str], console: Console) -> None:
         """Update metrics aggregator Lambda environment variable to include quota table."""
         try:
             import boto3
 
             # Get the quota table name from the quota stack outputs
-            quota_outputs = get_stack_outputs(quota_stack_name, profile.aws_region)
             if not quota_outputs or not quota_outputs.get("QuotaTableName"):
                 console.print("[yellow]Warning: Could not get quota table name from stack outputs[/yellow]")
                 return
@@ -693,7 +764,9 @@ class DeployCommand(Command):
             console.print(f"[dim]Updating {metrics_aggregator_name} environment variables...[/dim]")
 
             # Update the Lambda function environment variables
-            lambda_client = boto3.client("lambda", region_name=profile.aws_region)
+            # Use a dedicated session: this runs on a deployment worker thread and the
+            # default boto3 session is not safe to initialize concurrently.
+            lambda_client = boto3.session.Session().client("lambda", region_name=profile.aws_region)
 
             try:
                 lambda_client.update_function_configuration(
@@ -11,8 +11,6 @@ import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
-import boto3
-from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from cleo.commands.command import Command
 from cleo.helpers import option
@@ -23,6 +21,36 @@ from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, Te
 from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
 from claude_code_with_bedrock.config import Config
 
+# Packaged executables are compressed binaries and are stored in the archive as-is
+STORED_FILE_PREFIXES = ("credential-process-", "otel-helper-")
+
+
+class _HashingWriter:
+    """Write-only file wrapper that computes a SHA256 checksum of everything written.
+
+    It deliberately has no seek(), so zipfile writes entries sequentially with data
+    descriptors instead of seeking back to patch headers, and the checksum matches the file.
+    """
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._sha256 = hashlib.sha256()
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._sha256.update(data)
+        self._position += len(data)
+        return self._fileobj.write(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        self._fileobj.flush()
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
 
 class S3UploadProgress:
     """Track S3 upload progress."""
@@ -123,6 +151,8 @@ class DistributeCommand(Command):
 
     def _get_latest_url(self, profile, console: Console) -> int:
         """Retrieve the latest distribution URL from Parameter Store."""
+        import boto3
+
         try:
             ssm = boto3.client("ssm", region_name=profile.aws_region)
 
@@ -194,6 +224,7 @@ class DistributeCommand(Command):
         import json
 
         import boto3
+        from boto3.s3.transfer import TransferConfig
 
         package_path = Path(self.option("package-path"))
 
@@ -400,11 +431,7 @@ class DistributeCommand(Command):
         ) as progress:
             # Create archive
             task = progress.add_task("Creating distribution archive...", total=None)
-            archive_path = self._create_archive(package_path)
-
-            # Calculate checksum
-            progress.update(task, description="Calculating checksum...")
-            checksum = self._calculate_checksum(archive_path)
+            archive_path, checksum = self._create_archive(package_path)
 
             # Prepare filename
             timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -435,9 +462,9 @@ class DistributeCommand(Command):
 
                 # Configure multipart upload for better performance
                 config = TransferConfig(
-                    multipart_threshold=1024 * 25,  # 25MB
+                    multipart_threshold=1024 * 1024 * 16,  # 16MB
                     max_concurrency=10,
-                    multipart_chunksize=1024 * 25,
+                    multipart_chunksize=1024 * 1024 * 16,
                     use_threads=True,
                 )
 
@@ -541,15 +568,13 @@ class DistributeCommand(Command):
                 local_dir.mkdir(exist_ok=True)
                 local_path = local_dir / filename
 
-                import shutil
-
-                shutil.copy2(archive_path, local_path)
+                shutil.move(archive_path, local_path)
 
                 # Get file size
-                file_size = archive_path.stat().st_size if archive_path.exists() else 0
+                file_size = local_path.stat().st_size
 
-            # Clean up temp file
-            archive_path.unlink()
+            # Clean up temp archive directory
+            shutil.rmtree(archive_path.parent, ignore_errors=True)
 
             # Stop progress if it's still running
             if "progress" in locals() and hasattr(progress, "stop"):
@@ -623,18 +648,21 @@ class DistributeCommand(Command):
 
         return 0
 
-    def _create_archive(self, package_path: Path) -> Path:
-        """Create a zip archive of the package directory."""
+    def _create_archive(self, package_path: Path) -> tuple[Path, str]:
+        """Create a zip archive of the package directory.
+
+        Source files are streamed straight into the archive and the SHA256 checksum is
+        computed from the bytes as they are written, so the package is read once.
+
+        Returns:
+            Tuple of the archive path and its SHA256 checksum
+        """
         import zipfile
 
         # Create temp directory for archive
         temp_dir = Path(tempfile.mkdtemp())
         archive_path = temp_dir / "claude-code-package.zip"
 
-        # Create a clean package directory with only necessary files
-        package_temp_dir = temp_dir / "claude-code-package"
-        package_temp_dir.mkdir(exist_ok=True)
-
         # Files to include in the package
         required_files = [
             # Executables for each platform
@@ -657,40 +685,30 @@ class DistributeCommand(Command):
             "README.md",
         ]
 
-        # Also include claude-settings directory if it exists
-        settings_dir = package_path / "claude-settings"
-        if settings_dir.exists() and settings_dir.is_dir():
-            shutil.copytree(settings_dir, package_temp_dir / "claude-settings")
-
-        # Copy only the required files
+        # Archive paths mapped to source files, with contents under claude-code-package/
+        # When extracted, it will create claude-code-package/ with files directly inside
+        entries = []
         for filename in required_files:
             source_file = package_path / filename
             if source_file.exists():
-                shutil.copy2(source_file, package_temp_dir / filename)
+                entries.append((source_file, f"claude-code-package/{filename}"))
 
-        # Create zip archive with contents at root level
-        # When extracted, it will create claude-code-package/ with files directly inside
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Add all files from the package directory
-            for file in package_temp_dir.rglob("*"):
+        # Also include claude-settings directory if it exists
+        settings_dir = package_path / "claude-settings"
+        if settings_dir.exists() and settings_dir.is_dir():
+            for file in sorted(settings_dir.rglob("*")):
                 if file.is_file():
-                    # Get relative path from package_temp_dir (not temp_dir) to avoid nested directories
-                    # This creates paths like "config.json", "install.sh" instead of "claude-code-package/config.json"
-                    arcname = f"claude-code-package/{file.relative_to(package_temp_dir)}"
-                    zf.write(file, arcname)
-
-        # Clean up temp package directory
-        shutil.rmtree(package_temp_dir)
+                    entries.append((file, f"claude-code-package/claude-settings/{file.relative_to(settings_dir)}"))
 
-        return archive_path
+        with open(archive_path, "wb") as f:
+            writer = _HashingWriter(f)
+            with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zf:
+                for source_file, arcname in entries:
+                    # Packaged executables are already compressed, so deflating them only costs time
+                    stored = source_file.name.startswith(STORED_FILE_PREFIXES)
+                    zf.write(source_file, arcname, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
 
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return archive_path, writer.hexdigest()
 
     def _generate_restricted_url(self, s3_client, bucket: str, key: str, allowed_ips: str, expires_hours: int) -> str:
         """Generate a presigned URL with IP restrictions."""
@@ -752,6 +770,7 @@ class DistributeCommand(Command):
         """Download Windows build artifacts from S3."""
         import zipfile
 
+        import boto3
         from botocore.exceptions import ClientError
 
         from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
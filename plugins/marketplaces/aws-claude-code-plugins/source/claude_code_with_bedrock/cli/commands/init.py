@@ -9,8 +9,6 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
-import boto3
-import questionary
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich import box
@@ -18,8 +16,13 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from claude_code_with_bedrock.cli.utils.aws import check_bedrock_access, get_current_region, get_subnets, get_vpcs
+from claude_code_with_bedrock.cli.utils.aws import get_current_region, get_subnets, get_vpcs
 from claude_code_with_bedrock.cli.utils.progress import WizardProgress
+from claude_code_with_bedrock.cli.utils.regions import (
+    discover_bedrock_regions,
+    get_candidate_regions,
+    get_region_model_ids,
+)
 from claude_code_with_bedrock.cli.utils.validators import (
     validate_oidc_provider_domain,
 )
@@ -77,6 +80,7 @@ class InitCommand(Command):
 
     def _handle_with_progress(self, console: Console, progress: WizardProgress) -> int:
         """Handle the command with progress tracking."""
+        import questionary
 
         # Check for existing deployment first
         existing_config = self._check_existing_deployment()
@@ -193,11 +197,13 @@ class InitCommand(Command):
             "Python 3.10+ available": self._check_python_version(),
         }
 
-        # Check current region and Bedrock access
+        # Check current region and Bedrock access. Every candidate region is probed
+        # concurrently (and cached) so later wizard steps get availability for free.
         region = get_current_region()
         if region:
             checks[f"Current region: {region}"] = True
-            checks[f"Bedrock access enabled in {region}"] = check_bedrock_access(region)
+            region_availability = discover_bedrock_regions(sorted({region, *get_candidate_regions()}))
+            checks[f"Bedrock access enabled in {region}"] = region_availability.get(region, {}).get("available", False)
 
         # Display results
         all_passed = True
@@ -217,6 +223,8 @@ class InitCommand(Command):
 
     def _gather_configuration(self, progress: WizardProgress, existing_config: dict[str, Any] = None) -> dict[str, Any]:
         """Gather configuration from user."""
+        import questionary
+
         console = Console()
         # Use existing config as base if provided, otherwise use saved progress
         if existing_config:
@@ -694,7 +702,16 @@ class InitCommand(Command):
             console.print(f"\n[green]Selected:[/green] {profile_name} Cross-Region")
 
             # Get available source regions for this model/profile combination
-            available_source_regions = get_source_regions_for_model_profile(selected_model_key, selected_profile)
+            # Narrow to regions where discovery confirmed the model is callable
+            configured_source_regions = get_source_regions_for_model_profile(selected_model_key, selected_profile)
+            available_source_regions = get_source_regions_for_model_profile(
+                selected_model_key, selected_profile, get_region_model_ids(configured_source_regions)
+            )
+            unavailable_regions = [r for r in configured_source_regions if r not in available_source_regions]
+            if unavailable_regions:
+                console.print(f"[dim]Not available to your account in: {', '.join(unavailable_regions)}[/dim]")
+            if not available_source_regions:
+                available_source_regions = configured_source_regions
 
             # Check for saved source region
             saved_source_region = config.get("aws", {}).get("selected_source_region")
@@ -992,6 +1009,8 @@ class InitCommand(Command):
 
     def _check_aws_credentials(self) -> bool:
         """Check if AWS credentials are configured."""
+        import boto3
+
         try:
             boto3.client("sts").get_caller_identity()
             return True
@@ -1007,36 +1026,28 @@ class InitCommand(Command):
     def _get_bedrock_regions(self) -> list[str]:
         """Get list of regions where Bedrock is available."""
         try:
-            # These are the regions where Bedrock is currently available
-            # This list should be updated as AWS expands Bedrock availability
-            bedrock_regions = [
-                "us-east-1",  # N. Virginia
-                "us-east-2",  # Ohio
-                "us-west-2",  # Oregon
-                "ap-northeast-1",  # Tokyo
-                "ap-southeast-1",  # Singapore
-                "ap-southeast-2",  # Sydney
-                "eu-central-1",  # Frankfurt
-                "eu-west-1",  # Ireland
-                "eu-west-3",  # Paris
-                "ap-south-1",  # Mumbai
-                "ca-central-1",  # Canada
-            ]
+            # Probed concurrently and cached under the config directory (see utils/regions.py)
+            region_availability = discover_bedrock_regions()
+            bedrock_regions = [region for region, entry in region_availability.items() if entry["available"]]
+            if bedrock_regions:
+                return sorted(bedrock_regions)
+        except Exception:
+            pass
 
-            # For now, return the known list without checking each one
-            # (checking each region takes time and requires permissions)
-            return bedrock_regions
-        except:
-            # Return default list if we can't check
-            return [
-                "us-east-1",
-                "us-west-2",
-                "eu-west-1",
-                "eu-central-1",
-                "ap-northeast-1",
-                "ap-southeast-1",
-                "ap-southeast-2",
-            ]
+        # Fall back to the known list if discovery found nothing (e.g. missing permissions)
+        return [
+            "us-east-1",  # N. Virginia
+            "us-east-2",  # Ohio
+            "us-west-2",  # Oregon
+            "ap-northeast-1",  # Tokyo
+            "ap-southeast-1",  # Singapore
+            "ap-southeast-2",  # Sydney
+            "eu-central-1",  # Frankfurt
+            "eu-west-1",  # Ireland
+            "eu-west-3",  # Paris
+            "ap-south-1",  # Mumbai
+            "ca-central-1",  # Canada
+        ]
 
     def _update_parameters_file(self, params_file: Path, config: dict[str, Any]) -> None:
         """Update the CloudFormation parameters file with our configuration."""
@@ -1360,6 +1371,8 @@ class InitCommand(Command):
 
     def _configure_vpc(self, region: str) -> dict[str, Any]:
         """Configure VPC for monitoring stack."""
+        import questionary
+
         console = Console()
 
         console.print("\n[bold]VPC Configuration for Monitoring[/bold]")
@@ -10,7 +10,6 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
-import questionary
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich.console import Console
@@ -55,6 +54,8 @@ class PackageCommand(Command):
         import platform
         import subprocess
 
+        import questionary
+
         console = Console()
 
         # Check if this is a status check (deprecated - moved to builds command)
@@ -4,6 +4,8 @@
 """Status command - Show deployment status."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,11 +16,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
 from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.cli.utils.display import display_configuration_info, get_configuration_dict
 from claude_code_with_bedrock.config import Config
 
+# Full re-describe of every stack in --watch mode happens every N refreshes;
+# in between only stacks with an operation in progress are polled
+WATCH_FULL_REFRESH_EVERY = 6
+
 
 class StatusCommand(Command):
     name = "status"
@@ -28,8 +33,13 @@ class StatusCommand(Command):
         option("profile", description="Configuration profile to check", flag=False, default="default"),
         option("json", description="Output in JSON format", flag=True),
         option("detailed", description="Show detailed information", flag=True),
+        option("watch", description="Keep refreshing stack status until interrupted", flag=True),
+        option("interval", description="Seconds between refreshes in watch mode", flag=False, default="10"),
     ]
 
+    # Stack inventory memoized for the duration of the command (see _get_inventory)
+    _inventory: dict[str, dict[str, Any]] | None = None
+
     def handle(self) -> int:
         """Execute the status command."""
         console = Console()
@@ -47,6 +57,16 @@ class StatusCommand(Command):
         json_output = self.option("json")
         detailed = self.option("detailed")
 
+        if self.option("watch"):
+            try:
+                interval = int(self.option("interval"))
+            except ValueError:
+                interval = 0
+            if interval < 1:
+                console.print("[red]--interval must be a whole number of seconds, 1 or more.[/red]")
+                return 1
+            return self._watch_status(profile, console, interval)
+
         if json_output:
             return self._show_json_status(profile, console)
         else:
@@ -77,24 +97,11 @@ class StatusCommand(Command):
         console.print("\n[bold]Stack Status[/bold]")
         stacks = self._get_stack_status(profile)
 
-        stack_table = Table(box=box.SIMPLE)
-        stack_table.add_column("Stack", style="cyan")
-        stack_table.add_column("Status")
-        stack_table.add_column("Last Updated")
-
-        for stack_type, info in stacks.items():
-            status_color = "green" if info["status"] == "CREATE_COMPLETE" else "yellow"
-            stack_table.add_row(
-                stack_type.title(),
-                f"[{status_color}]{info['status']}[/{status_color}]",
-                info.get("last_updated", "N/A"),
-            )
-
+        stack_table = self._build_stack_table(stacks)
         console.print(stack_table)
 
         # Endpoints section
         console.print("\n[bold]Endpoints[/bold]")
-        endpoints = self._get_endpoints(profile)
 
         if endpoints.get("identity_pool_id"):
             console.print(f"• Identity Pool: [cyan]{endpoints['identity_pool_id']}[/cyan]")
@@ -159,33 +166,87 @@ class StatusCommand(Command):
         console.print(json.dumps(status, indent=2))
         return 0
 
-    def _get_stack_status(self, profile) -> dict[str, Any]:
-        """Get status of all stacks."""
-        stacks = {}
+    def _watch_status(self, profile, console: Console, interval: int) -> int:
+        """Re-render the stack table until interrupted, polling only what may have changed."""
+        from rich.live import Live
 
-        # Check auth stack
-        auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
-        auth_status = self._check_stack(auth_stack, profile.aws_region)
-        stacks["auth"] = auth_status
+        stacks = self._get_stack_status(profile)
+        refreshes = 0
+        try:
+            with Live(self._build_stack_table(stacks), console=console, auto_refresh=False) as live:
+                while True:
+                    time.sleep(interval)
+                    refreshes += 1
+                    if refreshes % WATCH_FULL_REFRESH_EVERY == 0:
+                        stack_types = None
+                    else:
+                        stack_types = [
+                            stack_type
+                            for stack_type, info in self._inventory.items()
+                            if info["status"].endswith("_IN_PROGRESS")
+                        ]
+                        if not stack_types:
+                            continue
+                    self._refresh_inventory(profile, stack_types)
+                    stacks = self._get_stack_status(profile)
+                    live.update(self._build_stack_table(stacks), refresh=True)
+        except KeyboardInterrupt:
+            pass
 
-        if profile.monitoring_enabled:
-            # Check monitoring stack
-            monitoring_stack = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-monitoring")
-            stacks["monitoring"] = self._check_stack(monitoring_stack, profile.aws_region)
+        return 0
+
+    def _build_stack_table(self, stacks: dict[str, Any]) -> Table:
+        """Build the stack status table."""
+        stack_table = Table(box=box.SIMPLE)
+        stack_table.add_column("Stack", style="cyan")
+        stack_table.add_column("Status")
+        stack_table.add_column("Last Updated")
 
-            # Check dashboard stack
-            dashboard_stack = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-            stacks["dashboard"] = self._check_stack(dashboard_stack, profile.aws_region)
+        for stack_type, info in stacks.items():
+            status_color = "green" if info["status"] == "CREATE_COMPLETE" else "yellow"
+            stack_table.add_row(
+                stack_type.title(),
+                f"[{status_color}]{info['status']}[/{status_color}]",
+                info.get("last_updated") or "N/A",
+            )
 
-        return stacks
+        return stack_table
 
-    def _check_stack(self, stack_name: str, region: str) -> dict[str, Any]:
-        """Check individual stack status using boto3."""
-        cf_manager = CloudFormationManager(region=region)
+    def _get_stack_names(self, profile) -> dict[str, str]:
+        """Get the CloudFormation stack name for each stack type this profile uses."""
+        stack_names = {"auth": profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")}
 
+        if profile.monitoring_enabled:
+            stack_names["monitoring"] = profile.stack_names.get(
+                "monitoring", f"{profile.identity_pool_name}-otel-collector"
+            )
+            stack_names["dashboard"] = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
+
+        return stack_names
+
+    def _get_inventory(self, profile) -> dict[str, dict[str, Any]]:
+        """Get status and outputs of every profile stack, describing them at most once per command."""
+        if self._inventory is None:
+            self._inventory = {}
+            self._refresh_inventory(profile)
+        return self._inventory
+
+    def _refresh_inventory(self, profile, stack_types: list[str] | None = None) -> None:
+        """Describe the given stack types (default: all) concurrently through one shared client."""
+        stack_names = self._get_stack_names(profile)
+        if stack_types is not None:
+            stack_names = {stack_type: stack_names[stack_type] for stack_type in stack_types}
+
+        # boto3 clients are thread-safe, so one client serves every describe call
+        cf_client = CloudFormationManager(region=profile.aws_region).cf_client
+        with ThreadPoolExecutor(max_workers=len(stack_names)) as executor:
+            results = executor.map(lambda name: self._describe_stack(cf_client, name), stack_names.values())
+            self._inventory.update(zip(stack_names, results, strict=True))
+
+    def _describe_stack(self, cf_client, stack_name: str) -> dict[str, Any]:
+        """Describe one stack, returning its status, last update time and outputs."""
         try:
-            # Get stack details
-            response = cf_manager.cf_client.describe_stacks(StackName=stack_name)
+            response = cf_client.describe_stacks(StackName=stack_name)
             if response["Stacks"]:
                 stack = response["Stacks"][0]
                 last_updated = stack.get("LastUpdatedTime") or stack.get("CreationTime")
@@ -197,19 +258,30 @@ class StatusCommand(Command):
                     else:
                         last_updated = str(last_updated)
 
-                return {"status": stack["StackStatus"], "last_updated": last_updated}
+                return {
+                    "status": stack["StackStatus"],
+                    "last_updated": last_updated,
+                    "outputs": {output["OutputKey"]: output["OutputValue"] for output in stack.get("Outputs", [])},
+                }
         except Exception:
             pass
 
-        return {"status": "NOT_FOUND", "last_updated": None}
+        return {"status": "NOT_FOUND", "last_updated": None, "outputs": {}}
+
+    def _get_stack_status(self, profile) -> dict[str, Any]:
+        """Get status of all stacks."""
+        return {
+            stack_type: {"status": info["status"], "last_updated": info["last_updated"]}
+            for stack_type, info in self._get_inventory(profile).items()
+        }
 
     def _get_endpoints(self, profile) -> dict[str, Any]:
         """Get all relevant endpoints."""
         endpoints = {}
+        inventory = self._get_inventory(profile)
 
         # Get auth stack outputs
-        auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
-        auth_outputs = get_stack_outputs(auth_stack, profile.aws_region)
+        auth_outputs = inventory["auth"]["outputs"]
 
         if auth_outputs:
             endpoints["identity_pool_id"] = auth_outputs.get("IdentityPoolId")
@@ -219,15 +291,13 @@ class StatusCommand(Command):
 
         if profile.monitoring_enabled:
             # Get monitoring endpoint
-            monitoring_stack = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
-            monitoring_outputs = get_stack_outputs(monitoring_stack, profile.aws_region)
+            monitoring_outputs = inventory["monitoring"]["outputs"]
 
             if monitoring_outputs:
                 endpoints["monitoring_endpoint"] = monitoring_outputs.get("CollectorEndpoint")
 
             # Get dashboard URL
-            dashboard_stack = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-            dashboard_outputs = get_stack_outputs(dashboard_stack, profile.aws_region)
+            dashboard_outputs = inventory["dashboard"]["outputs"]
 
             if dashboard_outputs:
                 endpoints["dashboard_url"] = dashboard_outputs.get("DashboardURL")
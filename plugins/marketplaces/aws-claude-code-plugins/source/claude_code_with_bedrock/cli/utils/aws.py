@@ -5,12 +5,13 @@
 
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
 
 def get_current_region() -> str | None:
     """Get the current AWS region from configuration."""
+    import boto3
+
     try:
         session = boto3.Session()
         return session.region_name or "us-east-1"
@@ -20,6 +21,8 @@ def get_current_region() -> str | None:
 
 def check_bedrock_access(region: str) -> bool:
     """Check if Bedrock is accessible in the given region."""
+    import boto3
+
     try:
         client = boto3.client("bedrock", region_name=region)
         # Try to list foundation models
@@ -43,6 +46,8 @@ def check_bedrock_access(region: str) -> bool:
 
 def get_bedrock_models(region: str) -> list[dict[str, Any]]:
     """Get available Bedrock models in a region."""
+    import boto3
+
     try:
         client = boto3.client("bedrock", region_name=region)
         response = client.list_foundation_models()
@@ -65,6 +70,8 @@ def get_bedrock_models(region: str) -> list[dict[str, Any]]:
 
 def check_stack_exists(stack_name: str, region: str) -> bool:
     """Check if a CloudFormation stack exists."""
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
         response = client.describe_stacks(StackName=stack_name)
@@ -88,6 +95,8 @@ def check_stack_exists(stack_name: str, region: str) -> bool:
 
 def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
     """Get outputs from a CloudFormation stack."""
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
         response = client.describe_stacks(StackName=stack_name)
@@ -106,6 +115,8 @@ def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
 
 def get_account_id() -> str | None:
     """Get the current AWS account ID."""
+    import boto3
+
     try:
         client = boto3.client("sts")
         response = client.get_caller_identity()
@@ -116,6 +127,8 @@ def get_account_id() -> str | None:
 
 def validate_iam_permissions() -> dict[str, bool]:
     """Validate required IAM permissions."""
+    import boto3
+
     permissions = {}
 
     # Check CloudFormation permissions
@@ -147,6 +160,8 @@ def validate_iam_permissions() -> dict[str, bool]:
 
 def get_vpcs(region: str) -> list[dict[str, Any]]:
     """Get list of VPCs in a region."""
+    import boto3
+
     try:
         client = boto3.client("ec2", region_name=region)
         response = client.describe_vpcs()
@@ -179,6 +194,8 @@ def get_vpcs(region: str) -> list[dict[str, Any]]:
 
 def get_subnets(region: str, vpc_id: str) -> list[dict[str, Any]]:
     """Get list of subnets in a VPC."""
+    import boto3
+
     try:
         client = boto3.client("ec2", region_name=region)
         response = client.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
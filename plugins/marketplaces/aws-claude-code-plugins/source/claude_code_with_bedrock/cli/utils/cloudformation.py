@@ -3,14 +3,17 @@
 
 """CloudFormation manager for boto3-based stack operations."""
 
+import functools
+import hashlib
+import threading
 import time
+import uuid
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import boto3
-import cfn_flip
-from botocore.exceptions import ClientError, WaiterError
+from botocore.exceptions import ClientError
 
 from .cf_exceptions import (
     CloudFormationError,
@@ -20,6 +23,47 @@ from .cf_exceptions import (
     TemplateValidationError,
 )
 
+# Concurrent artifact uploads per template
+ARTIFACT_UPLOAD_WORKERS = 8
+
+# Bounds for the delay between stack event polls while waiting on an operation
+EVENT_POLL_MIN_DELAY = 2
+EVENT_POLL_MAX_DELAY = 15
+
+# Stack status that starts and successfully completes each wait operation
+WAIT_STATUSES = {
+    "stack_create_complete": ("CREATE_IN_PROGRESS", "CREATE_COMPLETE"),
+    "stack_update_complete": ("UPDATE_IN_PROGRESS", "UPDATE_COMPLETE"),
+    "stack_delete_complete": ("DELETE_IN_PROGRESS", "DELETE_COMPLETE"),
+}
+
+# Stack statuses after which no further events are emitted for the operation
+TERMINAL_STACK_STATUSES = {
+    "CREATE_COMPLETE",
+    "CREATE_FAILED",
+    "ROLLBACK_COMPLETE",
+    "ROLLBACK_FAILED",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "UPDATE_ROLLBACK_FAILED",
+    "DELETE_COMPLETE",
+    "DELETE_FAILED",
+}
+
+
+@functools.cache
+def _artifact_transfer_config():
+    """Transfer settings shared by all artifact uploads, built on first use to keep boto3 off the import path."""
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=1024 * 1024 * 25,  # 25MB
+        max_concurrency=4,
+        multipart_chunksize=1024 * 1024 * 25,
+        use_threads=True,
+    )
+
 
 class StackDeploymentResult:
     """Result of a stack deployment operation."""
@@ -53,25 +97,34 @@ class CloudFormationManager:
             region: AWS region
             profile: Optional AWS profile name
         """
+        import boto3
+
         self.region = region
         self.session = (
             boto3.Session(region_name=region, profile_name=profile) if profile else boto3.Session(region_name=region)
         )
         self._cf_client = None
         self._s3_client = None
+        # boto3 sessions are not thread-safe, so client creation is serialized.
+        # The clients themselves are safe to share across deployment threads.
+        self._client_lock = threading.Lock()
 
     @property
     def cf_client(self):
         """Lazy-loaded CloudFormation client with connection pooling."""
         if not self._cf_client:
-            self._cf_client = self.session.client("cloudformation")
+            with self._client_lock:
+                if not self._cf_client:
+                    self._cf_client = self.session.client("cloudformation")
         return self._cf_client
 
     @property
     def s3_client(self):
         """Lazy-loaded S3 client for template packaging."""
         if not self._s3_client:
-            self._s3_client = self.session.client("s3")
+            with self._client_lock:
+                if not self._s3_client:
+                    self._s3_client = self.session.client("s3")
         return self._s3_client
 
     def deploy_stack(
@@ -134,6 +187,9 @@ class CloudFormationManager:
             if disable_rollback:
                 params["DisableRollback"] = True
 
+            # Tags the events of this operation so waiting never picks up an earlier one
+            params["ClientRequestToken"] = f"ccwb-{uuid.uuid4()}"
+
             # Create or update stack
             if not exists:
                 if on_event:
@@ -160,7 +216,7 @@ class CloudFormationManager:
                     raise
 
             # Wait for completion with event streaming
-            success = self._wait_for_stack(stack_name, wait_status, timeout, on_event)
+            success = self._wait_for_stack(stack_name, wait_status, timeout, on_event, params["ClientRequestToken"])
 
             if success:
                 outputs = self.get_stack_outputs(stack_name)
@@ -228,7 +284,7 @@ class CloudFormationManager:
                 )
 
             # Delete stack
-            params = {"StackName": stack_name}
+            params = {"StackName": stack_name, "ClientRequestToken": f"ccwb-{uuid.uuid4()}"}
             if retain_resources:
                 params["RetainResources"] = retain_resources
 
@@ -238,7 +294,9 @@ class CloudFormationManager:
             self.cf_client.delete_stack(**params)
 
             # Wait for deletion
-            success = self._wait_for_stack(stack_name, "stack_delete_complete", timeout, on_event)
+            success = self._wait_for_stack(
+                stack_name, "stack_delete_complete", timeout, on_event, params["ClientRequestToken"]
+            )
 
             return StackDeletionResult(success=success)
 
@@ -255,7 +313,9 @@ class CloudFormationManager:
         """
         Package a CloudFormation template and upload artifacts to S3.
 
-        This handles Lambda functions and nested templates.
+        This handles Lambda functions and nested templates. Artifacts are stored under
+        content-hash keys and uploaded concurrently, skipping any that already exist in
+        the bucket, so repackaging an unchanged template uploads nothing.
         Replaces: aws cloudformation package
 
         Args:
@@ -267,6 +327,8 @@ class CloudFormationManager:
         Returns:
             Packaged template as string
         """
+        import cfn_flip
+
         template_path = Path(template_path)
 
         # Read template
@@ -279,9 +341,11 @@ class CloudFormationManager:
         else:
             template = cfn_flip.load_json(template_body)
 
-        # Process resources for packaging
+        # Collect local artifacts first so they can be packaged and uploaded concurrently
+        lambda_artifacts = []
+        nested_templates = []
         if "Resources" in template:
-            for resource_name, resource in template["Resources"].items():
+            for resource in template["Resources"].values():
                 # Ensure resource is a dict (cfn_flip might return special types)
                 if not isinstance(resource, dict):
                     continue
@@ -293,21 +357,8 @@ class CloudFormationManager:
                     if "ZipFile" not in code and code.get("S3Bucket") != s3_bucket:
                         # Need to package local code
                         local_path = template_path.parent / code.get("S3Key", "")
-                        if local_path.exists():
-                            # Upload to S3
-                            s3_key = (
-                                f"{s3_prefix}/{resource_name}/{local_path.name}"
-                                if s3_prefix
-                                else f"{resource_name}/{local_path.name}"
-                            )
-
-                            if on_event:
-                                on_event({"message": f"Uploading {local_path.name} to s3://{s3_bucket}/{s3_key}"})
-
-                            self.s3_client.upload_file(str(local_path), s3_bucket, s3_key)
-
-                            # Update template
-                            resource["Properties"]["Code"] = {"S3Bucket": s3_bucket, "S3Key": s3_key}
+                        if local_path.is_file():
+                            lambda_artifacts.append((resource, local_path))
 
                 # Handle nested stacks
                 elif resource_type == "AWS::CloudFormation::Stack":
@@ -316,26 +367,82 @@ class CloudFormationManager:
                         # Need to package nested template
                         nested_path = template_path.parent / template_url
                         if nested_path.exists():
-                            # Recursively package nested template
-                            nested_packaged = self.package_template(nested_path, s3_bucket, s3_prefix, on_event)
+                            nested_templates.append((resource, nested_path))
+
+        if lambda_artifacts or nested_templates:
+            with ThreadPoolExecutor(max_workers=ARTIFACT_UPLOAD_WORKERS) as executor:
+                code_futures = [
+                    (resource, executor.submit(self._upload_artifact, local_path, s3_bucket, s3_prefix, on_event))
+                    for resource, local_path in lambda_artifacts
+                ]
+                nested_futures = [
+                    (
+                        resource,
+                        executor.submit(self._package_nested_template, nested_path, s3_bucket, s3_prefix, on_event),
+                    )
+                    for resource, nested_path in nested_templates
+                ]
+
+                # Update template
+                for resource, future in code_futures:
+                    resource["Properties"]["Code"] = {"S3Bucket": s3_bucket, "S3Key": future.result()}
+                for resource, future in nested_futures:
+                    resource["Properties"]["TemplateURL"] = f"https://{s3_bucket}.s3.amazonaws.com/{future.result()}"
 
-                            # Upload packaged nested template
-                            s3_key = (
-                                f"{s3_prefix}/{resource_name}/template.yaml"
-                                if s3_prefix
-                                else f"{resource_name}/template.yaml"
-                            )
+        # Return packaged template as YAML with CloudFormation intrinsic functions preserved
+        return cfn_flip.dump_yaml(template)
 
-                            if on_event:
-                                on_event({"message": f"Uploading nested template to s3://{s3_bucket}/{s3_key}"})
+    def _package_nested_template(
+        self, nested_path: Path, s3_bucket: str, s3_prefix: str = None, on_event: Callable = None
+    ) -> str:
+        """Recursively package a nested template and upload it, returning its S3 key."""
+        nested_packaged = self.package_template(nested_path, s3_bucket, s3_prefix, on_event).encode()
+        s3_key = self._artifact_key(hashlib.sha256(nested_packaged).hexdigest(), ".yaml", s3_prefix)
 
-                            self.s3_client.put_object(Bucket=s3_bucket, Key=s3_key, Body=nested_packaged)
+        if self._artifact_exists(s3_bucket, s3_key):
+            if on_event:
+                on_event({"message": f"Nested template unchanged at s3://{s3_bucket}/{s3_key}"})
+            return s3_key
 
-                            # Update template
-                            resource["Properties"]["TemplateURL"] = f"https://{s3_bucket}.s3.amazonaws.com/{s3_key}"
+        if on_event:
+            on_event({"message": f"Uploading nested template to s3://{s3_bucket}/{s3_key}"})
+        self.s3_client.put_object(Bucket=s3_bucket, Key=s3_key, Body=nested_packaged)
+        return s3_key
 
-        # Return packaged template as YAML with CloudFormation intrinsic functions preserved
-        return cfn_flip.dump_yaml(template)
+    def _upload_artifact(
+        self, local_path: Path, s3_bucket: str, s3_prefix: str = None, on_event: Callable = None
+    ) -> str:
+        """Upload a local artifact under a content-addressed key unless it is already present."""
+        sha256_hash = hashlib.sha256()
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256_hash.update(chunk)
+        s3_key = self._artifact_key(sha256_hash.hexdigest(), local_path.suffix, s3_prefix)
+
+        if self._artifact_exists(s3_bucket, s3_key):
+            if on_event:
+                on_event({"message": f"{local_path.name} unchanged at s3://{s3_bucket}/{s3_key}"})
+            return s3_key
+
+        if on_event:
+            on_event({"message": f"Uploading {local_path.name} to s3://{s3_bucket}/{s3_key}"})
+        self.s3_client.upload_file(str(local_path), s3_bucket, s3_key, Config=_artifact_transfer_config())
+        return s3_key
+
+    def _artifact_exists(self, s3_bucket: str, s3_key: str) -> bool:
+        """Check whether an artifact has already been uploaded."""
+        try:
+            self.s3_client.head_object(Bucket=s3_bucket, Key=s3_key)
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    @staticmethod
+    def _artifact_key(digest: str, suffix: str, s3_prefix: str = None) -> str:
+        """Build the content-addressed S3 key for an artifact."""
+        return f"{s3_prefix}/{digest}{suffix}" if s3_prefix else f"{digest}{suffix}"
 
     def get_stack_status(self, stack_name: str) -> str | None:
         """
@@ -419,76 +526,129 @@ class CloudFormationManager:
                 return False, None
             raise
 
-    def _wait_for_stack(self, stack_name: str, waiter_name: str, timeout: int, on_event: Callable = None) -> bool:
+    def _wait_for_stack(
+        self,
+        stack_name: str,
+        waiter_name: str,
+        timeout: int,
+        on_event: Callable = None,
+        client_request_token: str | None = None,
+    ) -> bool:
         """
-        Wait for stack operation to complete with event streaming.
+        Wait for stack operation to complete by tailing its stack events.
+
+        Only events newer than the last one seen are fetched on each poll, and completion is
+        derived from the stack's own terminal status event, so no separate status polling is
+        needed. The poll delay backs off while the stack is quiet and on throttling.
 
         Args:
             stack_name: Name of the stack
-            waiter_name: Name of the waiter (e.g., 'stack_create_complete')
+            waiter_name: Name of the operation being waited on (e.g., 'stack_create_complete')
             timeout: Timeout in seconds
             on_event: Callback for stack events
+            client_request_token: ClientRequestToken the operation was issued with
 
         Returns:
             True if successful, False otherwise
         """
-        # Stream events while waiting
-        if on_event:
-            self._start_event_streaming(stack_name, on_event)
+        start_status, success_status = WAIT_STATUSES[waiter_name]
+        deadline = time.monotonic() + timeout
+        delay = EVENT_POLL_MIN_DELAY
+        last_event_id = None
+
+        while time.monotonic() < deadline:
+            try:
+                new_events = self._fetch_new_stack_events(stack_name, last_event_id, start_status, client_request_token)
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                if error_code == "ValidationError" and waiter_name == "stack_delete_complete":
+                    # Stack can no longer be described by name once deletion finishes
+                    return True
+                if error_code not in ("Throttling", "ThrottlingException"):
+                    return False
+                delay = min(delay * 2, EVENT_POLL_MAX_DELAY)
+                time.sleep(delay)
+                continue
+
+            if new_events:
+                last_event_id = new_events[-1]["EventId"]
+                delay = EVENT_POLL_MIN_DELAY
+            else:
+                delay = min(delay * 1.5, EVENT_POLL_MAX_DELAY)
 
-        try:
-            waiter = self.cf_client.get_waiter(waiter_name)
-            waiter.wait(StackName=stack_name, WaiterConfig={"Delay": 5, "MaxAttempts": timeout // 5})
-            return True
-        except WaiterError:
-            # Check if it's a timeout or actual failure
-            final_status = self.get_stack_status(stack_name)
-            if final_status and "FAILED" in final_status:
-                return False
-            elif final_status and "ROLLBACK" in final_status:
-                return False
-            # Might be timeout
-            return False
-        except Exception:
-            return False
+            for event in new_events or []:
+                if on_event:
+                    on_event(self._format_stack_event(event))
+                status = event.get("ResourceStatus")
+                if self._is_stack_event(event, stack_name) and status in TERMINAL_STACK_STATUSES:
+                    return status == success_status
 
-    def _start_event_streaming(self, stack_name: str, on_event: Callable):
-        """Start streaming stack events in a separate thread."""
-        import threading
+            time.sleep(delay)
 
-        seen_events = set()
+        # Timed out
+        return False
 
-        def stream_events():
-            while True:
-                try:
-                    response = self.cf_client.describe_stack_events(StackName=stack_name)
-                    for event in response.get("StackEvents", []):
-                        event_id = event["EventId"]
-                        if event_id not in seen_events:
-                            seen_events.add(event_id)
-                            # Format event for callback
-                            formatted_event = {
-                                "timestamp": event.get("Timestamp"),
-                                "LogicalResourceId": event.get("LogicalResourceId"),
-                                "ResourceType": event.get("ResourceType"),
-                                "ResourceStatus": event.get("ResourceStatus"),
-                                "ResourceStatusReason": event.get("ResourceStatusReason"),
-                                "message": f"{event.get('LogicalResourceId')} - {event.get('ResourceStatus')}",
-                            }
-                            on_event(formatted_event)
-
-                    # Check if stack operation is complete
-                    status = self.get_stack_status(stack_name)
-                    if status and ("COMPLETE" in status or "FAILED" in status):
-                        break
-
-                    time.sleep(2)
-                except Exception:
-                    break
-
-        thread = threading.Thread(target=stream_events, daemon=True)
-        thread.start()
-        return thread
+    def _fetch_new_stack_events(
+        self,
+        stack_name: str,
+        last_event_id: str | None,
+        start_status: str,
+        client_request_token: str | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Fetch stack events newer than the last one seen, oldest first.
+
+        describe_stack_events returns events newest first, so pages are only requested until
+        the previously seen event is reached. Before any event has been seen, events are
+        collected back to the stack event that started the current operation. When the
+        operation was issued with a ClientRequestToken, only a start event carrying that token
+        counts, so an earlier operation's events are never replayed while the new one is not
+        visible yet.
+
+        Args:
+            stack_name: Name of the stack
+            last_event_id: ID of the newest event already processed, or None on the first poll
+            start_status: Stack status that marks the start of the current operation
+            client_request_token: ClientRequestToken the current operation was issued with
+
+        Returns:
+            New events in chronological order, or None if the operation has not started yet
+        """
+        collected = []
+        paginator = self.cf_client.get_paginator("describe_stack_events")
+        for page in paginator.paginate(StackName=stack_name):
+            for event in page.get("StackEvents", []):
+                if event["EventId"] == last_event_id:
+                    return collected[::-1]
+                collected.append(event)
+                if (
+                    last_event_id is None
+                    and self._is_stack_event(event, stack_name)
+                    and event.get("ResourceStatus") == start_status
+                    and (client_request_token is None or event.get("ClientRequestToken") == client_request_token)
+                ):
+                    return collected[::-1]
+
+        return collected[::-1] if last_event_id else None
+
+    @staticmethod
+    def _is_stack_event(event: dict[str, Any], stack_name: str) -> bool:
+        """Check whether an event describes the stack itself rather than one of its resources."""
+        return (
+            event.get("ResourceType") == "AWS::CloudFormation::Stack" and event.get("LogicalResourceId") == stack_name
+        )
+
+    @staticmethod
+    def _format_stack_event(event: dict[str, Any]) -> dict[str, Any]:
+        """Format a stack event for the on_event callback."""
+        return {
+            "timestamp": event.get("Timestamp"),
+            "LogicalResourceId": event.get("LogicalResourceId"),
+            "ResourceType": event.get("ResourceType"),
+            "ResourceStatus": event.get("ResourceStatus"),
+            "ResourceStatusReason": event.get("ResourceStatusReason"),
+            "message": f"{event.get('LogicalResourceId')} - {event.get('ResourceStatus')}",
+        }
 
     def _get_stack_failure_reason(self, stack_name: str) -> str:
         """Get the failure reason from stack events."""
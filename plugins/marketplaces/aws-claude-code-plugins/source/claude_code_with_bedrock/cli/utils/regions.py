@@ -0,0 +1,166 @@
+# ABOUTME: Discovers which regions serve Claude models on Bedrock for the current credentials
+# ABOUTME: Probes regions concurrently and caches per-region availability under the config directory
+
+"""Bedrock region capability discovery."""
+
+import functools
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from claude_code_with_bedrock.config import Config
+from claude_code_with_bedrock.models import CLAUDE_MODELS
+
+# Regions probed in addition to every source/destination region in CLAUDE_MODELS
+EXTRA_CANDIDATE_REGIONS = ["ca-central-1"]
+
+CACHE_FILE = Config.CONFIG_DIR / "bedrock-regions.json"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+DISCOVERY_WORKERS = 16
+
+# Keep one unreachable region from stalling discovery on botocore's default timeouts and retries
+PROBE_CONNECT_TIMEOUT = 3
+PROBE_READ_TIMEOUT = 5
+PROBE_MAX_ATTEMPTS = 2
+
+# Errors meaning the region is reachable but Bedrock is not usable there
+UNAVAILABLE_ERROR_CODES = {"AccessDeniedException", "UnrecognizedClientException", "AuthFailure"}
+
+
+def get_candidate_regions() -> list[str]:
+    """Get every region any configured Claude model can be called from or routed to."""
+    regions = set(EXTRA_CANDIDATE_REGIONS)
+    for model_config in CLAUDE_MODELS.values():
+        for profile_config in model_config["profiles"].values():
+            regions.update(profile_config.get("source_regions", []))
+            regions.update(profile_config.get("destination_regions", []))
+    return sorted(regions)
+
+
+def discover_bedrock_regions(regions: list[str] | None = None, refresh: bool = False) -> dict[str, dict[str, Any]]:
+    """Get Claude model availability for each region.
+
+    Fresh cache entries are reused; the remaining regions are probed concurrently.
+    Regions that could not be probed (no credentials, network errors) are omitted
+    so callers can tell "unknown" apart from "unavailable".
+
+    Args:
+        regions: Regions to check, defaults to get_candidate_regions()
+        refresh: Ignore cached entries and probe every region again
+
+    Returns:
+        Mapping of region to {"available", "model_ids", "profile_ids", "checked_at"}
+    """
+    import boto3
+
+    regions = regions or get_candidate_regions()
+    aws_profile = boto3.session.Session().profile_name or "default"
+
+    cache = _load_cache()
+    cached = cache.get(aws_profile, {})
+    now = time.time()
+
+    results = {}
+    if not refresh:
+        results = {
+            region: cached[region]
+            for region in regions
+            if region in cached and now - cached[region].get("checked_at", 0) < CACHE_TTL_SECONDS
+        }
+
+    pending = [region for region in regions if region not in results]
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(DISCOVERY_WORKERS, len(pending))) as executor:
+            probed = dict(zip(pending, executor.map(_probe_region, pending), strict=True))
+
+        probed = {region: entry for region, entry in probed.items() if entry is not None}
+        if probed:
+            results.update(probed)
+            cache[aws_profile] = {**cached, **probed}
+            _save_cache(cache)
+
+    return results
+
+
+def get_region_model_ids(regions: list[str] | None = None, refresh: bool = False) -> dict[str, set[str]]:
+    """Get the Claude model and inference profile IDs callable from each probed region."""
+    return {
+        region: set(entry["model_ids"]) | set(entry["profile_ids"])
+        for region, entry in discover_bedrock_regions(regions, refresh).items()
+    }
+
+
+@functools.cache
+def _probe_client_config():
+    """Client settings shared by all region probes, built on first use to keep botocore off the import path."""
+    from botocore.config import Config as BotoConfig
+
+    return BotoConfig(
+        connect_timeout=PROBE_CONNECT_TIMEOUT,
+        read_timeout=PROBE_READ_TIMEOUT,
+        retries={"max_attempts": PROBE_MAX_ATTEMPTS, "mode": "standard"},
+    )
+
+
+def _probe_region(region: str) -> dict[str, Any] | None:
+    """List Claude foundation models and inference profiles in one region.
+
+    Returns None when the outcome is unknown so the failure is not cached.
+    """
+    import boto3
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    try:
+        # Sessions are not thread-safe, so each probe gets its own
+        client = boto3.session.Session().client("bedrock", region_name=region, config=_probe_client_config())
+        response = client.list_foundation_models(byProvider="Anthropic")
+        model_ids = sorted(
+            model["modelId"]
+            for model in response.get("modelSummaries", [])
+            if "claude" in model.get("modelId", "").lower()
+        )
+
+        profile_ids = []
+        paginator = client.get_paginator("list_inference_profiles")
+        for page in paginator.paginate(typeEquals="SYSTEM_DEFINED"):
+            profile_ids.extend(
+                profile["inferenceProfileId"]
+                for profile in page.get("inferenceProfileSummaries", [])
+                if "claude" in profile.get("inferenceProfileId", "").lower()
+            )
+    except ClientError as e:
+        if e.response["Error"]["Code"] not in UNAVAILABLE_ERROR_CODES:
+            return None
+        model_ids, profile_ids = [], []
+    except BotoCoreError:
+        return None
+
+    return {
+        "available": bool(model_ids),
+        "model_ids": model_ids,
+        "profile_ids": sorted(profile_ids),
+        "checked_at": time.time(),
+    }
+
+
+def _load_cache() -> dict[str, Any]:
+    """Load the region cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict[str, Any]) -> None:
+    """Write the region cache atomically; caching is best-effort."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = CACHE_FILE.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(cache, f, indent=2)
+        temp_file.replace(CACHE_FILE)
+    except OSError:
+        pass
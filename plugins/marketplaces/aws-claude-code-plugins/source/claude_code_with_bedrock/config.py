@@ -3,6 +3,7 @@
 
 """Configuration management for Claude Code with Bedrock."""
 
+import copy
 import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
@@ -134,6 +135,9 @@ class Config:
     CONFIG_DIR = Path(__file__).parent.parent / ".ccwb-config"
     CONFIG_FILE = CONFIG_DIR / "config.json"
 
+    # Last loaded configuration, keyed by the config file's (mtime, size) signature
+    _cache: tuple[tuple[int, int], "Config"] | None = None
+
     def __init__(self):
         """Initialize configuration."""
         self.profiles: dict[str, Profile] = {}
@@ -144,12 +148,29 @@ class Config:
         """Ensure configuration directory exists."""
         self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def _file_signature(cls) -> tuple[int, int] | None:
+        """Get the (mtime, size) signature of the config file, or None if it does not exist."""
+        try:
+            stat = cls.CONFIG_FILE.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     @classmethod
     def load(cls) -> "Config":
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        The parsed configuration is memoized for as long as the file is unchanged on disk.
+        Each call returns its own copy, so callers may modify the result freely.
+        """
+        signature = cls._file_signature()
+        if signature is not None and cls._cache is not None and cls._cache[0] == signature:
+            return copy.deepcopy(cls._cache[1])
+
         config = cls()
 
-        if cls.CONFIG_FILE.exists():
+        if signature is not None:
             try:
                 with open(cls.CONFIG_FILE) as f:
                     data = json.load(f)
@@ -159,6 +180,7 @@ class Config:
                     config.profiles[profile_name] = Profile.from_dict(profile_data)
 
                 config.default_profile = data.get("default_profile")
+                cls._cache = (signature, copy.deepcopy(config))
 
             except Exception as e:
                 # If config is corrupted, start fresh
@@ -177,6 +199,9 @@ class Config:
         with open(self.CONFIG_FILE, "w") as f:
             json.dump(data, f, indent=2)
 
+        signature = self._file_signature()
+        type(self)._cache = (signature, copy.deepcopy(self)) if signature is not None else None
+
     def add_profile(self, profile: Profile) -> None:
         """Add or update a profile."""
         profile.updated_at = datetime.utcnow().isoformat()
@@ -361,8 +361,15 @@ def get_default_region_for_profile(profile_key: str) -> str:
     return DEFAULT_REGIONS[profile_key]
 
 
-def get_source_regions_for_model_profile(model_key: str, profile_key: str) -> list[str]:
-    """Get source regions for a specific model and profile combination."""
+def get_source_regions_for_model_profile(
+    model_key: str, profile_key: str, region_model_ids: dict[str, set[str]] | None = None
+) -> list[str]:
+    """Get source regions for a specific model and profile combination.
+
+    When region_model_ids (region -> callable model/profile IDs, as discovered at runtime)
+    is given, regions known not to offer the model are dropped. Regions missing from the
+    mapping are kept, since their availability is unknown.
+    """
     if model_key not in CLAUDE_MODELS:
         raise ValueError(f"Unknown model: {model_key}")
 
@@ -370,7 +377,14 @@ def get_source_regions_for_model_profile(model_key: str, profile_key: str) -> li
     if profile_key not in model_config["profiles"]:
         raise ValueError(f"Model {model_key} not available in profile {profile_key}")
 
-    return model_config["profiles"][profile_key]["source_regions"]
+    source_regions = model_config["profiles"][profile_key]["source_regions"]
+    if region_model_ids is None:
+        return source_regions
+
+    model_ids = {model_config["profiles"][profile_key]["model_id"], model_config["base_model_id"]}
+    return [
+        region for region in source_regions if region not in region_model_ids or model_ids & region_model_ids[region]
+    ]
 
 
 def get_destination_regions_for_model_profile(model_key: str, profile_key: str) -> list[str]:
@@ -18,6 +18,7 @@ import sys
 import threading
 import time
 import webbrowser
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
@@ -30,7 +31,8 @@ import requests
 from botocore import UNSIGNED
 from botocore.config import Config
 
-# No longer using file locks - using port-based locking instead
+# No longer using file locks for authentication - using port-based locking instead.
+# ~/.aws/credentials read-modify-write still takes an advisory file lock (see _credentials_file_lock).
 
 __version__ = "1.0.0"
 
@@ -71,7 +73,59 @@ PROVIDER_CONFIGS = {
 }
 
 
+# Credentials file fields written for each profile, keyed by credential dict key
+CREDENTIALS_FILE_FIELDS = {
+    "AccessKeyId": "aws_access_key_id",
+    "SecretAccessKey": "aws_secret_access_key",
+    "SessionToken": "aws_session_token",
+    "Expiration": "x-expiration",
+}
+
+
+@contextmanager
+def _credentials_file_lock(credentials_path):
+    """Hold an exclusive advisory lock for a read-modify-write of the credentials file.
+
+    The lock lives in a sibling file because the credentials file itself is replaced
+    by an atomic rename on every write.
+    """
+    lock_path = credentials_path.parent / ".credentials.lock"
+    with open(lock_path, "a+") as lock_file:
+        if platform.system() == "Windows":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 seconds; keep waiting for the other process
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 class MultiProviderAuth:
+    # Parsed credentials files keyed by path, validated by (mtime, size, inode) so repeated
+    # reads and the read before a write only re-parse the file when another process changed it.
+    _credentials_file_cache = {}
+
+    # boto3 clients shared by every refresh in this process, keyed by (service, region, unsigned).
+    # Reusing a client reuses its HTTP connection pool and skips client construction.
+    _aws_clients = {}
+    _aws_clients_lock = threading.Lock()
+
     def __init__(self, profile=None):
         # Load configuration from environment or config file
         self.profile = profile or "default"
@@ -248,6 +302,85 @@ class MultiProviderAuth:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         # For keyring, no directory setup needed
 
+    def _get_aws_client(self, service, unsigned=False):
+        """Get a reusable boto3 client for the configured region"""
+        key = (service, self.config["aws_region"], unsigned)
+        with self._aws_clients_lock:
+            client = self._aws_clients.get(key)
+            if client is None:
+                config = Config(tcp_keepalive=True, signature_version=UNSIGNED if unsigned else None)
+                client = boto3.client(service, region_name=self.config["aws_region"], config=config)
+                self._aws_clients[key] = client
+                self._debug_print(f"Created {service} client")
+        return client
+
+    def _identity_cache_key(self, login_key, token_claims):
+        """Identify the pool, provider and user an IdentityId was resolved for"""
+        return {
+            "identity_pool_id": self.config["identity_pool_id"],
+            "login_key": login_key,
+            "subject": token_claims.get("sub") or token_claims.get("email", ""),
+        }
+
+    def get_cached_identity_id(self, login_key, token_claims):
+        """Retrieve the Cognito IdentityId previously resolved for this user, if any"""
+        try:
+            if self.credential_storage == "keyring":
+                identity_json = keyring.get_password("claude-code-with-bedrock", f"{self.profile}-identity")
+                if not identity_json:
+                    return None
+                identity_data = json.loads(identity_json)
+            else:
+                identity_file = self.cache_dir / f"{self.profile}-identity.json"
+                if not identity_file.exists():
+                    return None
+                with open(identity_file) as f:
+                    identity_data = json.load(f)
+
+            # Only reuse the IdentityId for the same pool, provider and user
+            expected = self._identity_cache_key(login_key, token_claims)
+            if any(identity_data.get(field) != value for field, value in expected.items()):
+                return None
+
+            return identity_data.get("identity_id")
+        except Exception as e:
+            self._debug_print(f"Could not read cached identity ID: {e}")
+            return None
+
+    def save_identity_id(self, identity_id, login_key, token_claims):
+        """Save the resolved Cognito IdentityId alongside the cached credentials"""
+        try:
+            identity_data = self._identity_cache_key(login_key, token_claims)
+            identity_data["identity_id"] = identity_id
+
+            if self.credential_storage == "keyring":
+                keyring.set_password("claude-code-with-bedrock", f"{self.profile}-identity", json.dumps(identity_data))
+            else:
+                identity_file = self.cache_dir / f"{self.profile}-identity.json"
+                with open(identity_file, "w") as f:
+                    json.dump(identity_data, f)
+                identity_file.chmod(0o600)
+        except Exception as e:
+            # Non-fatal - the IdentityId is resolved again on the next refresh
+            self._debug_print(f"Warning: Could not save identity ID: {e}")
+
+    def clear_cached_identity_id(self):
+        """Forget the cached Cognito IdentityId for this profile"""
+        cleared = False
+        try:
+            if keyring.get_password("claude-code-with-bedrock", f"{self.profile}-identity"):
+                keyring.delete_password("claude-code-with-bedrock", f"{self.profile}-identity")
+                cleared = True
+        except Exception as e:
+            self._debug_print(f"Could not clear keyring identity ID: {e}")
+
+        identity_file = Path.home() / "claude-code-with-bedrock" / "cache" / f"{self.profile}-identity.json"
+        if identity_file.exists():
+            identity_file.unlink()
+            cleared = True
+
+        return cleared
+
     def get_cached_credentials(self):
         """Retrieve valid credentials from configured storage"""
         if self.credential_storage == "keyring":
@@ -429,6 +562,10 @@ class MultiProviderAuth:
         except Exception as e:
             self._debug_print(f"Could not clear keyring monitoring token: {e}")
 
+        # Clear cached Cognito IdentityId
+        if self.clear_cached_identity_id():
+            cleared_items.append("cached identity ID")
+
         # Clear credentials file (for session storage mode)
         try:
             credentials_path = Path.home() / ".aws" / "credentials"
@@ -543,9 +680,42 @@ class MultiProviderAuth:
         except Exception:
             return None
 
+    def _load_credentials_file(self, credentials_path):
+        """Parse the credentials file, reusing the cached parse while the file is unchanged
+
+        Args:
+            credentials_path: Path to the credentials file
+
+        Returns:
+            ConfigParser for the file (empty if it does not exist). Callers that modify it
+            must write it back through save_to_credentials_file.
+        """
+        from configparser import ConfigParser
+
+        try:
+            stat = credentials_path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            signature = None
+
+        cached = self._credentials_file_cache.get(credentials_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        # Disable inline comment characters so we can use keys like 'x-expiration'
+        config = ConfigParser(inline_comment_prefixes=())
+        if signature is not None:
+            config.read(credentials_path)
+        self._credentials_file_cache[credentials_path] = (signature, config)
+        return config
+
     def save_to_credentials_file(self, credentials, profile="ClaudeCode"):
         """Save credentials to ~/.aws/credentials file
 
+        The read-modify-write runs under an advisory lock so concurrent refreshes cannot
+        drop each other's profiles, and the write is skipped if the profile already holds
+        these credentials.
+
         Args:
             credentials: Dict with AccessKeyId, SecretAccessKey, SessionToken, Expiration
             profile: Profile name to use in credentials file (default: ClaudeCode)
@@ -558,52 +728,62 @@ class MultiProviderAuth:
         # Create ~/.aws directory if it doesn't exist
         credentials_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read existing file or create new config
-        # Disable inline comment characters so we can use keys like 'x-expiration'
-        config = ConfigParser(inline_comment_prefixes=())
-        if credentials_path.exists():
-            try:
-                config.read(credentials_path)
-            except Exception as e:
-                self._debug_print(f"Warning: Could not read existing credentials file: {e}")
+        try:
+            with _credentials_file_lock(credentials_path):
+                # Read existing file or create new config
+                try:
+                    config = self._load_credentials_file(credentials_path)
+                except Exception as e:
+                    self._debug_print(f"Warning: Could not read existing credentials file: {e}")
+                    self._credentials_file_cache.pop(credentials_path, None)
+                    config = ConfigParser(inline_comment_prefixes=())
+
+                # Add expiration as a special key that AWS SDK will ignore
+                # Use 'x-' prefix which is a convention for custom/extension fields
+                values = {
+                    field: credentials[key] for key, field in CREDENTIALS_FILE_FIELDS.items() if key in credentials
+                }
 
-        # Update profile section
-        if profile not in config:
-            config[profile] = {}
+                if profile in config and all(config[profile].get(field) == value for field, value in values.items()):
+                    self._debug_print(f"Credentials for profile '{profile}' unchanged, skipping write")
+                    return
 
-        config[profile]["aws_access_key_id"] = credentials["AccessKeyId"]
-        config[profile]["aws_secret_access_key"] = credentials["SecretAccessKey"]
-        config[profile]["aws_session_token"] = credentials["SessionToken"]
+                # Update profile section
+                if profile not in config:
+                    config[profile] = {}
+                for field, value in values.items():
+                    config[profile][field] = value
 
-        # Add expiration as a special key that AWS SDK will ignore
-        # Use 'x-' prefix which is a convention for custom/extension fields
-        if "Expiration" in credentials:
-            config[profile]["x-expiration"] = credentials["Expiration"]
+                # Atomic write using temporary file
+                temp_fd, temp_path = tempfile.mkstemp(
+                    dir=credentials_path.parent, prefix=".credentials.", suffix=".tmp"
+                )
 
-        # Atomic write using temporary file
-        try:
-            # Write to temporary file first
-            temp_fd, temp_path = tempfile.mkstemp(dir=credentials_path.parent, prefix=".credentials.", suffix=".tmp")
+                try:
+                    with os.fdopen(temp_fd, "w") as f:
+                        config.write(f)
 
-            try:
-                with os.fdopen(temp_fd, "w") as f:
-                    config.write(f)
+                    # Set restrictive permissions on temp file
+                    os.chmod(temp_path, 0o600)
 
-                # Set restrictive permissions on temp file
-                os.chmod(temp_path, 0o600)
+                    # Atomic rename
+                    os.replace(temp_path, credentials_path)
+                except Exception:
+                    # Clean up temp file on error
+                    try:
+                        os.unlink(temp_path)
+                    except Exception:
+                        pass
+                    raise
 
-                # Atomic rename
-                os.replace(temp_path, credentials_path)
+                # The parse we just wrote is the file's content; cache it under the new signature
+                stat = credentials_path.stat()
+                self._credentials_file_cache[credentials_path] = ((stat.st_mtime_ns, stat.st_size, stat.st_ino), config)
 
                 self._debug_print(f"Saved credentials to {credentials_path} for profile '{profile}'")
-            except Exception:
-                # Clean up temp file on error
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
-                raise
         except Exception as e:
+            # The cached parse may have been modified in place and no longer match the file
+            self._credentials_file_cache.pop(credentials_path, None)
             raise Exception(f"Failed to save credentials to file: {str(e)}")
 
     def read_from_credentials_file(self, profile="ClaudeCode"):
@@ -615,17 +795,13 @@ class MultiProviderAuth:
         Returns:
             Dict with credentials or None if not found
         """
-        from configparser import ConfigParser
-
         credentials_path = Path.home() / ".aws" / "credentials"
 
         if not credentials_path.exists():
             return None
 
         try:
-            # Disable inline comment characters to read keys like 'x-expiration'
-            config = ConfigParser(inline_comment_prefixes=())
-            config.read(credentials_path)
+            config = self._load_credentials_file(credentials_path)
 
             if profile not in config:
                 return None
@@ -879,8 +1055,8 @@ class MultiProviderAuth:
             if not federated_role_arn:
                 raise ValueError("federated_role_arn is required for direct STS federation")
 
-            # Create STS client
-            sts_client = boto3.client("sts", region_name=self.config["aws_region"])
+            # Get STS client
+            sts_client = self._get_aws_client("sts")
 
             # Prepare session tags from token claims
             session_tags = []
@@ -983,15 +1159,7 @@ class MultiProviderAuth:
 
         try:
             # Use unsigned requests for Cognito Identity (no AWS credentials needed)
-            self._debug_print("Creating Cognito Identity client...")
-            cognito_client = boto3.client(
-                "cognito-identity", region_name=self.config["aws_region"], config=Config(signature_version=UNSIGNED)
-            )
-            self._debug_print("Cognito client created")
-
-            self._debug_print("Creating STS client...")
-            boto3.client("sts", region_name=self.config["aws_region"])
-            self._debug_print("STS client created")
+            cognito_client = self._get_aws_client("cognito-identity", unsigned=True)
         finally:
             # Restore environment variables
             for var, value in saved_env.items():
@@ -1035,36 +1203,30 @@ class MultiProviderAuth:
                 for key, value in token_claims.items():
                     self._debug_print(f"  {key}: {value}")
 
-            # Get Cognito identity
-            self._debug_print(f"Calling GetId with identity pool: {self.config['identity_pool_id']}")
-            identity_response = cognito_client.get_id(
-                IdentityPoolId=self.config["identity_pool_id"], Logins={login_key: id_token}
-            )
-
-            identity_id = identity_response["IdentityId"]
-            self._debug_print(f"Got Cognito Identity ID: {identity_id}")
+            # Get Cognito identity, reusing the IdentityId resolved on a previous refresh
+            identity_id = self.get_cached_identity_id(login_key, token_claims)
+            if identity_id:
+                self._debug_print(f"Using cached Cognito Identity ID: {identity_id}")
+            else:
+                identity_id = self._resolve_identity_id(cognito_client, login_key, id_token, token_claims)
 
-            # For enhanced flow, directly get credentials
-            # Since we have a specific role configured, we'll use the role-based approach
             role_arn = self.config.get("role_arn")
             self._debug_print(f"Configured role ARN: {role_arn if role_arn else 'None (using default pool role)'}")
 
-            if role_arn:
-                # Get credentials for identity first to get the OIDC token
+            # The credentials from Cognito are temporary credentials for the pool's role
+            try:
                 credentials_response = cognito_client.get_credentials_for_identity(
                     IdentityId=identity_id, Logins={login_key: id_token}
                 )
-
-                # The credentials from Cognito are temporary credentials for the default role
-                # Since we want to use our specific role with session tags, we need to do AssumeRole
-                creds = credentials_response["Credentials"]
-            else:
-                # Get default role from identity pool
+            except cognito_client.exceptions.ResourceNotFoundException:
+                # Cached identity no longer exists in the pool; resolve it again
+                self._debug_print("Cached Cognito Identity ID not found, calling GetId")
+                identity_id = self._resolve_identity_id(cognito_client, login_key, id_token, token_claims)
                 credentials_response = cognito_client.get_credentials_for_identity(
                     IdentityId=identity_id, Logins={login_key: id_token}
                 )
 
-                creds = credentials_response["Credentials"]
+            creds = credentials_response["Credentials"]
 
             # Format for AWS CLI
             formatted_creds = {
@@ -1104,6 +1266,18 @@ class MultiProviderAuth:
                 )
             raise Exception(f"Failed to get AWS credentials: {str(e)}")
 
+    def _resolve_identity_id(self, cognito_client, login_key, id_token, token_claims):
+        """Call GetId for the user's Cognito IdentityId and cache it for later refreshes"""
+        self._debug_print(f"Calling GetId with identity pool: {self.config['identity_pool_id']}")
+        identity_response = cognito_client.get_id(
+            IdentityPoolId=self.config["identity_pool_id"], Logins={login_key: id_token}
+        )
+
+        identity_id = identity_response["IdentityId"]
+        self._debug_print(f"Got Cognito Identity ID: {identity_id}")
+        self.save_identity_id(identity_id, login_key, token_claims)
+        return identity_id
+
     def _wait_for_auth_completion(self, timeout=60):
         """Wait for another process to complete authentication using port-based detection"""
         start_time = time.time()
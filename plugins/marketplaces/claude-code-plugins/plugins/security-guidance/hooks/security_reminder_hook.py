@@ -128,7 +128,7 @@ Only use exec() if you absolutely need shell features and the input is guarantee
 
 def get_state_file(session_id):
     """Get session-specific state file path."""
-    return os.path.expanduser(f"~/.claude/security_warnings_state_{session_id}.json")
+    return os.path.expanduser(f"~/.claude/security_warnings_state_{session_id}.jsonl")
 
 
 def cleanup_old_state_files():
@@ -143,7 +143,7 @@ def cleanup_old_state_files():
 
         for filename in os.listdir(state_dir):
             if filename.startswith("security_warnings_state_") and filename.endswith(
-                ".json"
+                (".json", ".jsonl")
             ):
                 file_path = os.path.join(state_dir, filename)
                 try:
@@ -159,22 +159,34 @@ def cleanup_old_state_files():
 def load_state(session_id):
     """Load the state of shown warnings from file."""
     state_file = get_state_file(session_id)
+    shown_warnings = set()
     if os.path.exists(state_file):
         try:
             with open(state_file, "r") as f:
-                return set(json.load(f))
-        except (json.JSONDecodeError, IOError):
+                for line in f:
+                    try:
+                        shown_warnings.add(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Skip a partially written record
+        except IOError:
             return set()
-    return set()
+    return shown_warnings
 
 
-def save_state(session_id, shown_warnings):
-    """Save the state of shown warnings to file."""
+def save_state(session_id, warning_key):
+    """Append a shown warning to the session's state file.
+
+    Each record is a single O_APPEND write, so concurrent hooks never lose
+    each other's warnings and the file is never rewritten.
+    """
     state_file = get_state_file(session_id)
     try:
         os.makedirs(os.path.dirname(state_file), exist_ok=True)
-        with open(state_file, "w") as f:
-            json.dump(list(shown_warnings), f)
+        fd = os.open(state_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, (json.dumps(warning_key) + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
     except IOError as e:
         debug_log(f"Failed to save state file: {e}")
         pass  # Fail silently if we can't save state
@@ -190,7 +202,9 @@ def check_patterns(file_path, content):
         if "path_check" in pattern and pattern["path_check"](normalized_path):
             return pattern["ruleName"], pattern["reminder"]
 
-        # Check content-based patterns
+        # Check content-based patterns. Separate `in` scans use CPython's fast
+        # substring search and measure several times faster than one combined
+        # regex pass (see scripts/benchmark_check_patterns.py).
         if "substrings" in pattern and content:
             for substring in pattern["substrings"]:
                 if substring in content:
@@ -264,9 +278,8 @@ def main():
 
         # Check if we've already shown this warning in this session
         if warning_key not in shown_warnings:
-            # Add to shown warnings and save
-            shown_warnings.add(warning_key)
-            save_state(session_id, shown_warnings)
+            # Record the warning as shown
+            save_state(session_id, warning_key)
 
             # Output the warning to stderr and block execution
             print(reminder, file=sys.stderr)
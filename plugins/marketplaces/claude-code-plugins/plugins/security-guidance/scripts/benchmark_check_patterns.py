@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark for security_reminder_hook.check_patterns.
+
+Generates large source files and times check_patterns, which runs one `in` scan
+per rule substring, against a single-pass scan with all substrings combined into
+one regex. Both must pick the same rule.
+
+Usage: python3 scripts/benchmark_check_patterns.py [--sizes-mb 1,10,50] [--runs 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "hooks"))
+
+import security_reminder_hook as hook  # noqa: E402
+
+
+def build_single_pass_matcher(patterns):
+    """Combine every rule substring into one regex, ordered by rule priority."""
+    substring_rules = {}
+    for index, pattern in enumerate(patterns):
+        for substring in pattern.get("substrings", []):
+            substring_rules.setdefault(substring, index)
+
+    ordered = sorted(substring_rules, key=substring_rules.get)
+    # Zero-width lookahead so overlapping occurrences from different rules are all seen
+    regex = re.compile("(?=(" + "|".join(re.escape(substring) for substring in ordered) + "))")
+    return regex, substring_rules
+
+
+SINGLE_PASS_REGEX, SUBSTRING_RULES = build_single_pass_matcher(hook.SECURITY_PATTERNS)
+
+
+def check_patterns_single_pass(file_path, content):
+    """Scan content once, keeping the highest-priority rule seen."""
+    normalized_path = file_path.lstrip("/")
+
+    content_rule = None
+    if content:
+        for match in SINGLE_PASS_REGEX.finditer(content):
+            index = SUBSTRING_RULES[match.group(1)]
+            if content_rule is None or index < content_rule:
+                content_rule = index
+
+    for index, pattern in enumerate(hook.SECURITY_PATTERNS):
+        if "path_check" in pattern and pattern["path_check"](normalized_path):
+            return pattern["ruleName"], pattern["reminder"]
+        if index == content_rule:
+            return pattern["ruleName"], pattern["reminder"]
+
+    return None, None
+
+
+def generate_content(size_bytes, needle=None):
+    """Generate code-like text of about size_bytes, optionally with needle near the end."""
+    rng = random.Random(size_bytes)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))) for _ in range(500)]
+    lines = []
+    total = 0
+    while total < size_bytes:
+        line = "    const " + " = ".join(rng.choices(words, k=rng.randint(2, 6))) + ";"
+        lines.append(line)
+        total += len(line) + 1
+    if needle:
+        lines.insert(len(lines) - 10, needle)
+    return "\n".join(lines)
+
+
+def best_time(func, runs):
+    """Return the fastest of several runs in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark security pattern matching")
+    parser.add_argument("--sizes-mb", default="1,10,50", help="Comma-separated file sizes in MB")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case (fastest is reported)")
+    args = parser.parse_args()
+
+    cases = [("no match", None), ("late match", "os.system(cmd)"), ("early rule late", "x.innerHTML = y; exec(z)")]
+
+    print(f"{'size':>8}  {'case':<16} {'check_patterns':>14} {'single-pass':>12}  ratio")
+    for size_mb in (float(size) for size in args.sizes_mb.split(",")):
+        for case_name, needle in cases:
+            content = generate_content(int(size_mb * 1024 * 1024), needle)
+
+            expected = hook.check_patterns("src/app.js", content)
+            actual = check_patterns_single_pass("src/app.js", content)
+            if expected != actual:
+                print(f"Mismatch for {case_name}: {expected[0]} != {actual[0]}", file=sys.stderr)
+                return 1
+
+            current_ms = best_time(lambda: hook.check_patterns("src/app.js", content), args.runs)
+            single_ms = best_time(lambda: check_patterns_single_pass("src/app.js", content), args.runs)
+            print(
+                f"{size_mb:>6.1f}MB  {case_name:<16} {current_ms:>12.1f}ms {single_ms:>10.1f}ms"
+                f"  {single_ms / current_ms:5.1f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
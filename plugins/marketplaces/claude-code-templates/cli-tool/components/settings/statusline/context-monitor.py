@@ -4,75 +4,153 @@ Claude Code Context Monitor
 Real-time context usage monitoring with visual indicators and session analytics
 """
 
+import hashlib
 import json
 import sys
 import os
 import re
+import tempfile
+
+# Transcripts are read backwards in blocks of this size
+BLOCK_SIZE = 64 * 1024
+
+# Per-transcript scan position and last parsed usage, so refreshes only parse appended lines
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'claude-context-monitor')
+
+def parse_context_line(line):
+    """Parse context usage from a single transcript line, or None if it has none."""
+    try:
+        data = json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    
+    # Method 1: Parse usage tokens from assistant messages
+    if data.get('type') == 'assistant':
+        message = data.get('message', {})
+        usage = message.get('usage', {})
+        
+        if usage:
+            input_tokens = usage.get('input_tokens', 0)
+            cache_read = usage.get('cache_read_input_tokens', 0)
+            cache_creation = usage.get('cache_creation_input_tokens', 0)
+            
+            # Estimate context usage (assume 200k context for Claude Sonnet)
+            total_tokens = input_tokens + cache_read + cache_creation
+            if total_tokens > 0:
+                percent_used = min(100, (total_tokens / 200000) * 100)
+                return {
+                    'percent': percent_used,
+                    'tokens': total_tokens,
+                    'method': 'usage'
+                }
+    
+    # Method 2: Parse system context warnings
+    elif data.get('type') == 'system_message':
+        content = data.get('content', '')
+        
+        # "Context left until auto-compact: X%"
+        match = re.search(r'Context left until auto-compact: (\d+)%', content)
+        if match:
+            percent_left = int(match.group(1))
+            return {
+                'percent': 100 - percent_left,
+                'warning': 'auto-compact',
+                'method': 'system'
+            }
+        
+        # "Context low (X% remaining)"
+        match = re.search(r'Context low \((\d+)% remaining\)', content)
+        if match:
+            percent_left = int(match.group(1))
+            return {
+                'percent': 100 - percent_left,
+                'warning': 'low',
+                'method': 'system'
+            }
+    
+    return None
+
+def find_complete_end(f, size):
+    """Get the offset just past the last newline, ignoring a line still being written."""
+    pos = size
+    while pos > 0:
+        step = min(BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        newline = f.read(step).rfind(b'\n')
+        if newline != -1:
+            return pos + newline + 1
+    return 0
+
+def scan_backwards(f, start, end):
+    """Return the newest context info in lines between start and end, reading blocks from the end."""
+    pos = end
+    remainder = b''
+    while pos > start:
+        step = min(BLOCK_SIZE, pos - start)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + remainder).split(b'\n')
+        # The first piece may be the tail of a line that starts in an earlier block
+        remainder = lines.pop(0)
+        for line in reversed(lines):
+            if line.strip():
+                context_info = parse_context_line(line.decode('utf-8', errors='replace'))
+                if context_info:
+                    return context_info
+    if remainder.strip():
+        return parse_context_line(remainder.decode('utf-8', errors='replace'))
+    return None
+
+def load_scan_cache(cache_path):
+    """Load the cached scan state for a transcript."""
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_scan_cache(cache_path, state):
+    """Save the scan state atomically; caching is best-effort."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
 
 def parse_context_from_transcript(transcript_path):
-    """Parse context usage from transcript file."""
+    """Parse context usage from transcript file.
+    
+    Only lines appended since the previous refresh are parsed; if none of them carry
+    usage information, the result cached from the earlier refresh is reused.
+    """
     if not transcript_path or not os.path.exists(transcript_path):
         return None
     
+    cache_key = hashlib.sha1(os.path.abspath(transcript_path).encode('utf-8')).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{cache_key}.json")
+    
     try:
-        with open(transcript_path, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-        
-        # Check last 15 lines for context information
-        recent_lines = lines[-15:] if len(lines) > 15 else lines
-        
-        for line in reversed(recent_lines):
-            try:
-                data = json.loads(line.strip())
-                
-                # Method 1: Parse usage tokens from assistant messages
-                if data.get('type') == 'assistant':
-                    message = data.get('message', {})
-                    usage = message.get('usage', {})
-                    
-                    if usage:
-                        input_tokens = usage.get('input_tokens', 0)
-                        cache_read = usage.get('cache_read_input_tokens', 0)
-                        cache_creation = usage.get('cache_creation_input_tokens', 0)
-                        
-                        # Estimate context usage (assume 200k context for Claude Sonnet)
-                        total_tokens = input_tokens + cache_read + cache_creation
-                        if total_tokens > 0:
-                            percent_used = min(100, (total_tokens / 200000) * 100)
-                            return {
-                                'percent': percent_used,
-                                'tokens': total_tokens,
-                                'method': 'usage'
-                            }
-                
-                # Method 2: Parse system context warnings
-                elif data.get('type') == 'system_message':
-                    content = data.get('content', '')
-                    
-                    # "Context left until auto-compact: X%"
-                    match = re.search(r'Context left until auto-compact: (\d+)%', content)
-                    if match:
-                        percent_left = int(match.group(1))
-                        return {
-                            'percent': 100 - percent_left,
-                            'warning': 'auto-compact',
-                            'method': 'system'
-                        }
-                    
-                    # "Context low (X% remaining)"
-                    match = re.search(r'Context low \((\d+)% remaining\)', content)
-                    if match:
-                        percent_left = int(match.group(1))
-                        return {
-                            'percent': 100 - percent_left,
-                            'warning': 'low',
-                            'method': 'system'
-                        }
+        with open(transcript_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            end = find_complete_end(f, stat.st_size)
+            
+            state = load_scan_cache(cache_path)
+            if state.get('inode') == stat.st_ino and 0 <= state.get('offset', -1) <= end:
+                start, previous = state['offset'], state.get('context_info')
+            else:
+                # New or rewritten transcript: scan from the end until a usage record is found
+                start, previous = 0, None
             
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
+            context_info = scan_backwards(f, start, end) or previous
         
-        return None
+        if start != end or state.get('context_info') != context_info:
+            save_scan_cache(cache_path, {'inode': stat.st_ino, 'offset': end, 'context_info': context_info})
+        
+        return context_info
         
     except (FileNotFoundError, PermissionError):
         return None
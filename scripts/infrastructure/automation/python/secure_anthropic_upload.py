@@ -6,14 +6,19 @@ Implements security best practices for file uploads
 
 import os
 import sys
+import json
+import time
+import random
 import logging
 import hashlib
+import argparse
 import mimetypes
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import anthropic
-from anthropic import APIError, AuthenticationError, PermissionDeniedError
+from anthropic import APIConnectionError, APIError, APIStatusError, AuthenticationError, PermissionDeniedError
 
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB limit
 ALLOWED_MIME_TYPES = {
@@ -25,6 +30,14 @@ ALLOWED_MIME_TYPES = {
 }
 ALLOWED_EXTENSIONS = {'.pdf', '.txt', '.md', '.docx', '.doc'}
 
+# Batch mode
+DEFAULT_MANIFEST = '.anthropic_upload_manifest.json'
+DEFAULT_UPLOAD_WORKERS = 4
+MAX_UPLOAD_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt
+RETRY_MAX_DELAY = 60.0
+HASH_BLOCK_SIZE = 1024 * 1024
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -36,6 +49,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def calculate_file_hash(file_path: Path) -> str:
+    """Calculate SHA256 hash of a file (module-level so process pools can run it)"""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limiting (429), server errors (5xx) and connection failures are worth retrying"""
+    if isinstance(error, APIConnectionError):
+        return True
+    return isinstance(error, APIStatusError) and (error.status_code == 429 or error.status_code >= 500)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Backoff before the next attempt, honouring Retry-After when the API sends it"""
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        if retry_after:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+    except ValueError:
+        pass
+    delay = min(RETRY_BASE_DELAY * (2 ** attempt), RETRY_MAX_DELAY)
+    return delay * random.uniform(0.5, 1.0)  # Jitter spreads out workers that were throttled together
+
+
 class SecureFileUploader:
     """Secure file upload handler for Anthropic API"""
 
@@ -124,14 +166,14 @@ class SecureFileUploader:
 
         return False
 
-    def validate_file(self, file_path: Path) -> Tuple[str, int]:
-        """Validate file type, size, and content"""
-        file_size = file_path.stat().st_size
-        if file_size == 0:
-            raise ValueError("File is empty")
+    def validate_file(self, file_path: Path, file_hash: Optional[str] = None) -> Tuple[str, int]:
+        """Validate file type, size, and content
 
-        if file_size > MAX_FILE_SIZE:
-            raise ValueError(f"File size ({file_size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)")
+        Args:
+            file_path: File to validate
+            file_hash: SHA256 already computed for the file, if any
+        """
+        file_size = self._validate_file_size(file_path)
 
         extension = file_path.suffix.lower()
         if extension not in ALLOWED_EXTENSIONS:
@@ -144,11 +186,22 @@ class SecureFileUploader:
         if not mime_type:
             mime_type = self._detect_mime_type(file_path, extension)
 
-        file_hash = self._calculate_file_hash(file_path)
+        file_hash = file_hash or self._calculate_file_hash(file_path)
         logger.info(f"File validated - Size: {file_size}, Type: {mime_type}, SHA256: {file_hash}")
 
         return mime_type or 'application/octet-stream', file_size
 
+    def _validate_file_size(self, file_path: Path) -> int:
+        """Check the file is neither empty nor over MAX_FILE_SIZE and return its size"""
+        file_size = file_path.stat().st_size
+        if file_size == 0:
+            raise ValueError("File is empty")
+
+        if file_size > MAX_FILE_SIZE:
+            raise ValueError(f"File size ({file_size} bytes) exceeds maximum allowed size ({MAX_FILE_SIZE} bytes)")
+
+        return file_size
+
     def _detect_mime_type(self, file_path: Path, extension: str) -> str:
         """Detect MIME type based on extension"""
         mime_map = {
@@ -162,11 +215,7 @@ class SecureFileUploader:
 
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of file for integrity verification"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        return calculate_file_hash(file_path)
 
     def upload_file(self, file_path: str) -> dict:
         """Securely upload file to Anthropic API"""
@@ -185,14 +234,7 @@ class SecureFileUploader:
                     file=(filename, file_handle, mime_type)
                 )
 
-            result = {
-                'id': response.id,
-                'filename': response.filename,
-                'purpose': response.purpose,
-                'bytes': response.bytes,
-                'created_at': datetime.fromtimestamp(response.created_at).isoformat(),
-                'status': 'success'
-            }
+            result = self._upload_result(response)
 
             logger.info(f"Upload successful - File ID: {response.id}")
             return result
@@ -210,18 +252,164 @@ class SecureFileUploader:
             logger.error(f"Unexpected error during upload: {e}")
             raise
 
+    def _upload_result(self, response) -> dict:
+        """Convert an upload response into the result dict returned to callers"""
+        return {
+            'id': response.id,
+            'filename': response.filename,
+            'purpose': response.purpose,
+            'bytes': response.bytes,
+            'created_at': datetime.fromtimestamp(response.created_at).isoformat(),
+            'status': 'success'
+        }
+
+    def _upload_with_retry(self, path: Path, mime_type: str) -> dict:
+        """Upload one file, retrying 429/5xx and connection errors with exponential backoff
+
+        The SDK's own retries are turned off for these requests so each attempt
+        here is a single request.
+        """
+        client = self.client.with_options(max_retries=0)
+        for attempt in range(MAX_UPLOAD_ATTEMPTS):
+            try:
+                with open(path, 'rb') as file_handle:
+                    response = client.beta.files.upload(
+                        file=(path.name, file_handle, mime_type)
+                    )
+                return self._upload_result(response)
+            except APIError as e:
+                if not _is_retryable(e) or attempt == MAX_UPLOAD_ATTEMPTS - 1:
+                    raise
+                delay = _retry_delay(e, attempt)
+                logger.warning(f"Upload of {path.name} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def upload_directory(self, directory: str, manifest_path: str = DEFAULT_MANIFEST,
+                         max_workers: int = DEFAULT_UPLOAD_WORKERS) -> Dict[str, List[dict]]:
+        """Upload every allowed file under a directory, skipping content uploaded before
+
+        Files are hashed in a process pool. Hashes found in the manifest (content
+        hash -> file ID from earlier runs) are skipped, identical files within the
+        batch are uploaded once, and the rest are uploaded by up to max_workers
+        threads. The manifest is updated even if some uploads fail.
+
+        Returns:
+            Dict with 'uploaded', 'skipped' and 'failed' lists of per-file results
+        """
+        root = Path(directory).resolve()
+        if not root.is_dir():
+            raise ValueError(f"Path is not a directory: {directory}")
+        candidates = sorted(
+            path for path in root.rglob('*')
+            if path.is_file() and path.suffix.lower() in ALLOWED_EXTENSIONS
+        )
+        logger.info(f"Batch upload: {len(candidates)} candidate files under {root}")
+
+        summary = {'uploaded': [], 'skipped': [], 'failed': []}
+
+        # Validate paths and sizes up front (cheap) so hashing only runs on files we may upload
+        valid_paths = []
+        for path in candidates:
+            try:
+                valid_path = self.validate_file_path(str(path))
+                self._validate_file_size(valid_path)
+                valid_paths.append(valid_path)
+            except Exception as e:
+                summary['failed'].append({'file': str(path), 'error': str(e)})
+
+        with ProcessPoolExecutor() as pool:
+            hashes = dict(zip(valid_paths, pool.map(calculate_file_hash, valid_paths, chunksize=8)))
+
+        manifest = self._load_manifest(Path(manifest_path))
+
+        # One upload per unique content hash not already in the manifest
+        to_upload = {}
+        for path, file_hash in hashes.items():
+            if file_hash in manifest:
+                summary['skipped'].append({'file': str(path), 'sha256': file_hash, **manifest[file_hash]})
+                continue
+            try:
+                mime_type, _ = self.validate_file(path, file_hash)
+            except Exception as e:
+                summary['failed'].append({'file': str(path), 'error': str(e)})
+                continue
+            to_upload.setdefault(file_hash, []).append((path, mime_type))
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._upload_with_retry, *files[0]): (file_hash, files)
+                    for file_hash, files in to_upload.items()
+                }
+                for future in as_completed(futures):
+                    file_hash, files = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Upload failed for {files[0][0]}: {e}")
+                        summary['failed'].extend({'file': str(path), 'error': str(e)} for path, _ in files)
+                        continue
+
+                    logger.info(f"Upload successful - {files[0][0].name} -> {result['id']}")
+                    manifest[file_hash] = {'id': result['id'], 'filename': result['filename']}
+                    summary['uploaded'].append({'file': str(files[0][0]), 'sha256': file_hash, **result})
+                    # Identical copies elsewhere in the batch reuse the same file ID
+                    summary['skipped'].extend(
+                        {'file': str(path), 'sha256': file_hash, **manifest[file_hash]} for path, _ in files[1:]
+                    )
+        finally:
+            self._save_manifest(Path(manifest_path), manifest)
+
+        logger.info(
+            f"Batch upload complete - uploaded: {len(summary['uploaded'])}, "
+            f"skipped: {len(summary['skipped'])}, failed: {len(summary['failed'])}"
+        )
+        return summary
+
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, dict]:
+        """Load the content hash -> uploaded file manifest"""
+        if not manifest_path.exists():
+            return {}
+        try:
+            with open(manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read manifest {manifest_path}, starting fresh: {e}")
+            return {}
+
+    def _save_manifest(self, manifest_path: Path, manifest: Dict[str, dict]) -> None:
+        """Write the manifest atomically"""
+        temp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_path, manifest_path)
+
 
 def main():
     """Main entry point"""
-    if len(sys.argv) != 2:
-        print("Usage: python secure_anthropic_upload.py <file_path>")
-        sys.exit(1)
-
-    file_path = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Securely upload files to the Anthropic Files API")
+    parser.add_argument('path', help="File to upload, or directory with --batch")
+    parser.add_argument('--batch', action='store_true', help="Upload every allowed file under the directory")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST,
+                        help="Manifest of content hashes already uploaded (batch mode)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_UPLOAD_WORKERS,
+                        help="Concurrent uploads (batch mode)")
+    args = parser.parse_args()
 
     try:
         uploader = SecureFileUploader()
-        result = uploader.upload_file(file_path)
+
+        if args.batch:
+            summary = uploader.upload_directory(args.path, args.manifest, args.workers)
+            print(f"\n✓ Uploaded {len(summary['uploaded'])} files, "
+                  f"skipped {len(summary['skipped'])} duplicates")
+            for failure in summary['failed']:
+                print(f"  ✗ {failure['file']}: {failure['error']}")
+            if summary['failed']:
+                sys.exit(1)
+            return
+
+        result = uploader.upload_file(args.path)
 
         print("\n✓ File uploaded successfully!")
         print(f"  File ID: {result['id']}")